@@ -30,6 +30,19 @@ target_metadata = Base.metadata
 config.set_main_option("sqlalchemy.url", DatabaseSettings().database_uri)
 
 
+def include_name(
+    name: str | None,
+    type_: str,
+    parent_names: dict[str, str | None],  # noqa: ARG001
+) -> bool:
+    """Skip FTS5 virtual tables and their shadow tables in autogenerate.
+
+    They are created with raw SQL in migrations and are not part of
+    the SQLAlchemy metadata.
+    """
+    return not (type_ == "table" and name and "_fts" in name)
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -48,6 +61,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -55,7 +69,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:  # noqa: D103
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,40 @@
+"""Added vacancy retention.
+
+Revision ID: 5c1e7a9d2b40
+Revises: 38045ae32b61
+Create Date: 2026-10-19 09:12:04.318527
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7a9d2b40"
+down_revision: str | Sequence[str] | None = "38045ae32b61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_vacancys_created_at"),
+        "vacancys",
+        ["created_at"],
+        unique=False,
+    )
+    # auto_vacuum mode only takes effect after a full VACUUM,
+    # which cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        op.execute("VACUUM")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("PRAGMA auto_vacuum = NONE")
+        op.execute("VACUUM")
+    op.drop_index(op.f("ix_vacancys_created_at"), table_name="vacancys")
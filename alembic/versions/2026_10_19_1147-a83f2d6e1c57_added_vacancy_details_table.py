@@ -0,0 +1,110 @@
+"""Added vacancy details table.
+
+Revision ID: a83f2d6e1c57
+Revises: 5c1e7a9d2b40
+Create Date: 2026-10-19 11:47:36.902114
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a83f2d6e1c57"
+down_revision: str | Sequence[str] | None = "5c1e7a9d2b40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "vacancy_details",
+        sa.Column("vacancy_id", sa.Integer(), nullable=False),
+        sa.Column("main_tag", sa.String(length=128), nullable=True),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("company", sa.Text(), nullable=False),
+        sa.Column("salary", sa.Text(), nullable=False),
+        sa.Column("location", sa.Text(), nullable=False),
+        sa.Column("link", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("ai_score", sa.Integer(), nullable=True),
+        sa.Column("ai_reasons", sa.Text(), nullable=True),
+        sa.Column("missing_skills", sa.Text(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["vacancy_id"],
+            ["vacancys.id"],
+            name=op.f("fk_vacancy_details_vacancy_id_vacancys"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_vacancy_details")),
+        sa.UniqueConstraint(
+            "vacancy_id", name=op.f("uq_vacancy_details_vacancy_id")
+        ),
+    )
+
+    # External-content FTS5 index, synchronised by triggers.
+    op.execute(
+        "CREATE VIRTUAL TABLE vacancy_details_fts USING fts5("
+        "title, company, description, missing_skills, "
+        "content='vacancy_details', content_rowid='id', "
+        "tokenize='unicode61')"
+    )
+    op.execute(
+        "CREATE TRIGGER vacancy_details_ai AFTER INSERT ON vacancy_details "
+        "BEGIN "
+        "INSERT INTO vacancy_details_fts"
+        "(rowid, title, company, description, missing_skills) "
+        "VALUES (new.id, new.title, new.company, new.description, "
+        "new.missing_skills); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER vacancy_details_ad AFTER DELETE ON vacancy_details "
+        "BEGIN "
+        "INSERT INTO vacancy_details_fts"
+        "(vacancy_details_fts, rowid, title, company, description, "
+        "missing_skills) "
+        "VALUES ('delete', old.id, old.title, old.company, "
+        "old.description, old.missing_skills); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER vacancy_details_au AFTER UPDATE ON vacancy_details "
+        "BEGIN "
+        "INSERT INTO vacancy_details_fts"
+        "(vacancy_details_fts, rowid, title, company, description, "
+        "missing_skills) "
+        "VALUES ('delete', old.id, old.title, old.company, "
+        "old.description, old.missing_skills); "
+        "INSERT INTO vacancy_details_fts"
+        "(rowid, title, company, description, missing_skills) "
+        "VALUES (new.id, new.title, new.company, new.description, "
+        "new.missing_skills); "
+        "END"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS vacancy_details_au")
+    op.execute("DROP TRIGGER IF EXISTS vacancy_details_ad")
+    op.execute("DROP TRIGGER IF EXISTS vacancy_details_ai")
+    op.execute("DROP TABLE IF EXISTS vacancy_details_fts")
+    op.drop_table("vacancy_details")
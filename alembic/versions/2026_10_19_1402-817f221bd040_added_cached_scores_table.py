@@ -0,0 +1,62 @@
+"""Added cached scores table.
+
+Revision ID: 817f221bd040
+Revises: a83f2d6e1c57
+Create Date: 2026-10-19 14:02:21.803137
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "817f221bd040"
+down_revision: str | Sequence[str] | None = "a83f2d6e1c57"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "cached_scores",
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("resume_digest", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("prompt_version", sa.Integer(), nullable=False),
+        sa.Column("result", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_cached_scores")),
+        sa.UniqueConstraint(
+            "fingerprint",
+            "resume_digest",
+            "model",
+            "prompt_version",
+            name=op.f(
+                "uq_cached_scores_fingerprint_resume_digest_model_prompt_version"
+            ),
+        ),
+    )
+    op.create_index(
+        op.f("ix_cached_scores_created_at"),
+        "cached_scores",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_cached_scores_created_at"), table_name="cached_scores"
+    )
+    op.drop_table("cached_scores")
@@ -0,0 +1,66 @@
+"""Added pending scores table.
+
+Revision ID: e68a3bdf9f5b
+Revises: 817f221bd040
+Create Date: 2026-10-19 15:25:54.193927
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e68a3bdf9f5b"
+down_revision: str | Sequence[str] | None = "817f221bd040"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "pending_scores",
+        sa.Column("vacancy_hash", sa.String(length=64), nullable=False),
+        sa.Column("resume_digest", sa.String(length=64), nullable=False),
+        sa.Column("vacancy", sa.Text(), nullable=False),
+        sa.Column("published", sa.Boolean(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "next_attempt_at", sa.TIMESTAMP(timezone=True), nullable=False
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_pending_scores")),
+    )
+    op.create_index(
+        op.f("ix_pending_scores_next_attempt_at"),
+        "pending_scores",
+        ["next_attempt_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_pending_scores_vacancy_hash"),
+        "pending_scores",
+        ["vacancy_hash"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_pending_scores_vacancy_hash"), table_name="pending_scores"
+    )
+    op.drop_index(
+        op.f("ix_pending_scores_next_attempt_at"), table_name="pending_scores"
+    )
+    op.drop_table("pending_scores")
@@ -0,0 +1,63 @@
+"""Added vacancy feedbacks table.
+
+Revision ID: b4e78431922a
+Revises: e68a3bdf9f5b
+Create Date: 2026-10-19 16:40:29.223583
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e78431922a"
+down_revision: str | Sequence[str] | None = "e68a3bdf9f5b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "vacancy_feedbacks",
+        sa.Column("vacancy_hash", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("liked", sa.Boolean(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_vacancy_feedbacks")),
+        sa.UniqueConstraint(
+            "vacancy_hash",
+            "user_id",
+            name=op.f("uq_vacancy_feedbacks_vacancy_hash_user_id"),
+        ),
+    )
+    op.create_index(
+        op.f("ix_vacancy_feedbacks_updated_at"),
+        "vacancy_feedbacks",
+        ["updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_vacancy_feedbacks_updated_at"),
+        table_name="vacancy_feedbacks",
+    )
+    op.drop_table("vacancy_feedbacks")
@@ -0,0 +1,68 @@
+"""Added scoring inputs table.
+
+Revision ID: c7d21f5e8a90
+Revises: b4e78431922a
+Create Date: 2026-10-19 17:55:12.417306
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d21f5e8a90"
+down_revision: str | Sequence[str] | None = "b4e78431922a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "scoring_inputs",
+        sa.Column("vacancy_hash", sa.String(length=64), nullable=False),
+        sa.Column("source", sa.String(length=512), nullable=False),
+        sa.Column("resume_digest", sa.String(length=64), nullable=False),
+        sa.Column("vacancy", sa.Text(), nullable=False),
+        sa.Column("ai_score", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_scoring_inputs")),
+    )
+    op.create_index(
+        op.f("ix_scoring_inputs_created_at"),
+        "scoring_inputs",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_scoring_inputs_vacancy_hash"),
+        "scoring_inputs",
+        ["vacancy_hash"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_scoring_inputs_vacancy_hash"), table_name="scoring_inputs"
+    )
+    op.drop_index(
+        op.f("ix_scoring_inputs_created_at"), table_name="scoring_inputs"
+    )
+    op.drop_table("scoring_inputs")
@@ -0,0 +1,67 @@
+"""Added outbox messages table.
+
+Revision ID: 7f752dd47474
+Revises: c7d21f5e8a90
+Create Date: 2026-10-19 18:30:10.791717
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f752dd47474"
+down_revision: str | Sequence[str] | None = "c7d21f5e8a90"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "outbox_messages",
+        sa.Column("message_id", sa.String(length=64), nullable=False),
+        sa.Column("routing_key", sa.String(length=255), nullable=False),
+        sa.Column("resume_digest", sa.String(length=64), nullable=True),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "next_attempt_at", sa.TIMESTAMP(timezone=True), nullable=False
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_outbox_messages")),
+    )
+    op.create_index(
+        op.f("ix_outbox_messages_message_id"),
+        "outbox_messages",
+        ["message_id"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_outbox_messages_next_attempt_at"),
+        "outbox_messages",
+        ["next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_outbox_messages_next_attempt_at"),
+        table_name="outbox_messages",
+    )
+    op.drop_index(
+        op.f("ix_outbox_messages_message_id"), table_name="outbox_messages"
+    )
+    op.drop_table("outbox_messages")
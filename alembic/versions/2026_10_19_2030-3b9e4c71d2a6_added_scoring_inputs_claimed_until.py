@@ -0,0 +1,33 @@
+"""Added scoring inputs claimed until.
+
+Revision ID: 3b9e4c71d2a6
+Revises: 96a158ed5c5f
+Create Date: 2026-10-19 20:30:41.218904
+
+"""
+
+from collections.abc import Sequence  # noqa: TC003
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e4c71d2a6"
+down_revision: str | Sequence[str] | None = "96a158ed5c5f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "scoring_inputs",
+        sa.Column("claimed_until", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("scoring_inputs") as batch_op:
+        batch_op.drop_column("claimed_until")
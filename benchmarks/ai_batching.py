@@ -0,0 +1,164 @@
+r"""Compare single and batched AI scoring against an LLM endpoint.
+
+Scores the same synthetic vacancies once per vacancy and once in
+batches, and reports prompt/completion tokens and latency per vacancy.
+The score cache is disabled so every vacancy reaches the model.
+
+Usage:
+    python -m benchmarks.ai_batching \
+        --base-url http://localhost:1234/v1 --model qwen2.5-7b \
+        --vacancies 40 --batch-size 5
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Final
+
+from .sandbox import emit, run_worker
+
+STACKS: Final[tuple[str, ...]] = (
+    "Python, FastAPI, PostgreSQL, Redis, Docker",
+    "Python, Django, Celery, RabbitMQ, Kubernetes",
+    "Go, gRPC, Kafka, ClickHouse",
+    "Java, Spring Boot, Oracle, Kafka",
+    "Python, aiohttp, asyncio, MongoDB, Linux",
+    "TypeScript, React, Node.js, GraphQL",
+)
+DEFAULT_RESUME: Final[str] = (
+    "Python-разработчик, 5 лет опыта. Стек: Python, FastAPI, asyncio, "
+    "SQLAlchemy, PostgreSQL, Redis, RabbitMQ, Docker, Linux, pytest. "
+    "Проектировал микросервисы и высоконагруженные API."
+)
+
+
+def make_vacancies(count: int) -> list[str]:
+    """Return distinct synthetic vacancy descriptions."""
+    return [
+        f"Вакансия №{index}. Backend-разработчик. "
+        f"Требования: {STACKS[index % len(STACKS)]}. "
+        "Обязанности: разработка и поддержка сервисов, код-ревью, "
+        "участие в проектировании архитектуры."
+        for index in range(count)
+    ]
+
+
+async def run_benchmark(
+    base_url: str,
+    api_key: str,
+    model: str,
+    vacancies: int,
+    batch_size: int,
+    concurrency: int,
+    resume: str,
+) -> dict[str, Any]:
+    """Score the vacancies in single and batch mode."""
+    from src.services.scrapper.ai_analyst import (
+        BackendRouter,
+        LLMBackend,
+        ResumePrompt,
+        VacancyAIAnalyst,
+    )
+
+    texts = make_vacancies(vacancies)
+    resume_prompt = ResumePrompt.build(resume)
+    report: dict[str, Any] = {
+        "model": model,
+        "vacancies": vacancies,
+        "batch_size": batch_size,
+        "concurrency": concurrency,
+    }
+    for mode, size in (("single", 1), ("batch", batch_size)):
+        router = BackendRouter(
+            backends=[
+                LLMBackend(base_url=base_url, api_key=api_key, model=model)
+            ]
+        )
+        analyst = VacancyAIAnalyst(
+            router=router,
+            model=model,
+            max_concurrency=concurrency,
+            batch_size=size,
+        )
+        started = time.perf_counter()
+        results = await analyst.analyze_many(
+            vacancy_texts=texts, resume=resume_prompt
+        )
+        elapsed = time.perf_counter() - started
+
+        report[mode] = {
+            "wall_seconds": round(elapsed, 3),
+            "nonzero_scores": sum(
+                1 for result in results if result.get("score")
+            ),
+            "single_requests": analyst.single_stats.requests,
+            "batch_requests": analyst.batch_stats.requests,
+            # Batch mode falls back to single requests for bad entries.
+            "per_vacancy": {
+                "single": analyst.single_stats.per_vacancy(),
+                "batch": analyst.batch_stats.per_vacancy(),
+            },
+        }
+    return report
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--worker", action="store_true")
+    parser.add_argument("--base-url", required=True)
+    parser.add_argument("--api-key", default="local")
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--vacancies", type=int, default=40)
+    parser.add_argument("--batch-size", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--resume", type=Path)
+    args = parser.parse_args()
+
+    if not args.worker:
+        forwarded = [
+            "--base-url",
+            args.base_url,
+            "--api-key",
+            args.api_key,
+            "--model",
+            args.model,
+            "--vacancies",
+            str(args.vacancies),
+            "--batch-size",
+            str(args.batch_size),
+            "--concurrency",
+            str(args.concurrency),
+        ]
+        if args.resume is not None:
+            forwarded.extend(["--resume", str(args.resume.resolve())])
+        emit(
+            run_worker(
+                module="benchmarks.ai_batching", database={}, args=forwarded
+            )
+        )
+        return
+
+    resume = (
+        args.resume.read_text(encoding="utf-8")
+        if args.resume is not None
+        else DEFAULT_RESUME
+    )
+    emit(
+        asyncio.run(
+            run_benchmark(
+                base_url=args.base_url,
+                api_key=args.api_key,
+                model=args.model,
+                vacancies=args.vacancies,
+                batch_size=args.batch_size,
+                concurrency=args.concurrency,
+                resume=resume,
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+r"""Compare streaming with early termination to plain completions.
+
+Scores the same synthetic vacancies with and without streaming and
+reports latency, time to first token and output tokens per vacancy.
+Output tokens wasted by a plain completion are estimated as its
+completion tokens minus the chunks streaming needed to close the JSON
+answer (servers send about one token per chunk).
+
+Usage:
+    python -m benchmarks.ai_streaming \
+        --base-url http://localhost:1234/v1 --model qwen2.5-7b \
+        --vacancies 20
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from .ai_batching import DEFAULT_RESUME, make_vacancies
+from .sandbox import emit, run_worker
+
+
+async def run_benchmark(
+    base_url: str,
+    api_key: str,
+    model: str,
+    vacancies: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Score the vacancies with and without streaming."""
+    from src.services.scrapper.ai_analyst import (
+        BackendRouter,
+        LLMBackend,
+        ResumePrompt,
+        VacancyAIAnalyst,
+    )
+
+    texts = make_vacancies(vacancies)
+    resume_prompt = ResumePrompt.build(DEFAULT_RESUME)
+    report: dict[str, Any] = {
+        "model": model,
+        "vacancies": vacancies,
+        "concurrency": concurrency,
+    }
+    for mode, stream in (("complete", False), ("stream", True)):
+        router = BackendRouter(
+            backends=[
+                LLMBackend(base_url=base_url, api_key=api_key, model=model)
+            ]
+        )
+        analyst = VacancyAIAnalyst(
+            router=router,
+            model=model,
+            max_concurrency=concurrency,
+            stream=stream,
+        )
+        started = time.perf_counter()
+        await analyst.analyze_many(vacancy_texts=texts, resume=resume_prompt)
+        stats = analyst.single_stats
+        report[mode] = {
+            "wall_seconds": round(time.perf_counter() - started, 3),
+            "early_stops": stats.early_stops,
+            "per_vacancy": stats.per_vacancy(),
+        }
+
+    report["wasted_tokens_per_vacancy"] = round(
+        report["complete"]["per_vacancy"]["completion_tokens"]
+        - report["stream"]["per_vacancy"]["streamed_chunks"],
+        1,
+    )
+    return report
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--worker", action="store_true")
+    parser.add_argument("--base-url", required=True)
+    parser.add_argument("--api-key", default="local")
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--vacancies", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    if not args.worker:
+        emit(
+            run_worker(
+                module="benchmarks.ai_streaming",
+                database={},
+                args=[
+                    "--base-url",
+                    args.base_url,
+                    "--api-key",
+                    args.api_key,
+                    "--model",
+                    args.model,
+                    "--vacancies",
+                    str(args.vacancies),
+                    "--concurrency",
+                    str(args.concurrency),
+                ],
+            )
+        )
+        return
+
+    emit(
+        asyncio.run(
+            run_benchmark(
+                base_url=args.base_url,
+                api_key=args.api_key,
+                model=args.model,
+                vacancies=args.vacancies,
+                concurrency=args.concurrency,
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
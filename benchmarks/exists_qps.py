@@ -0,0 +1,125 @@
+"""Compare ``exists`` throughput of the ORM and the raw SQLite path.
+
+Usage:
+    python -m benchmarks.exists_qps --rows 100000 --lookups 20000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from .sandbox import emit, missing_hash, run_worker, stored_hash
+
+if TYPE_CHECKING:
+    from src.services.scrapper.repositories import IRepository
+
+
+async def measure_qps(
+    repository: IRepository,
+    hashes: list[str],
+    concurrency: int,
+) -> float:
+    """Run lookups with the given concurrency and return queries/s."""
+
+    async def worker(chunk: list[str]) -> None:
+        for vacancy_hash in chunk:
+            await repository.exists(vacancy_hash=vacancy_hash)
+
+    chunks = [hashes[i::concurrency] for i in range(concurrency)]
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(chunk) for chunk in chunks))
+    return len(hashes) / (time.perf_counter() - started)
+
+
+async def run_benchmark(
+    rows: int,
+    lookups: int,
+    concurrency: list[int],
+) -> dict[str, Any]:
+    """Benchmark both repository implementations in this process."""
+    from src.core.conf import DatabaseSettings
+    from src.core.database import DB_MANAGER
+    from src.services.scrapper.repositories import (
+        SQLiteVacancyRepository,
+        VacancyRepository,
+    )
+
+    hashes: list[str] = []
+    for index in range(lookups // 2):
+        hashes.extend((stored_hash(index * 7919 % rows), missing_hash(index)))
+
+    repositories: dict[str, IRepository] = {
+        "orm": VacancyRepository(),
+        "sqlite": SQLiteVacancyRepository(
+            database_path=DatabaseSettings().database_path  # pyright: ignore[reportCallIssue]
+        ),
+    }
+    results: dict[str, dict[str, float]] = {}
+    for name, repository in repositories.items():
+        # Warm up connections and statement caches.
+        await measure_qps(repository, hashes[:100], concurrency=1)
+        results[name] = {
+            str(level): round(await measure_qps(repository, hashes, level))
+            for level in concurrency
+        }
+        await repository.close()
+
+    await DB_MANAGER.dispose_engine()
+
+    return {
+        "rows": rows,
+        "lookups": len(hashes),
+        "qps": results,
+        "speedup": {
+            str(level): round(
+                results["sqlite"][str(level)] / results["orm"][str(level)], 2
+            )
+            for level in concurrency
+        },
+    }
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--worker", action="store_true")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+
+    if not args.worker:
+        emit(
+            run_worker(
+                module="benchmarks.exists_qps",
+                database={},
+                args=[
+                    "--rows",
+                    str(args.rows),
+                    "--lookups",
+                    str(args.lookups),
+                    "--concurrency",
+                    *map(str, args.concurrency),
+                ],
+            )
+        )
+        return
+
+    from .sandbox import migrate, seed_vacancies
+
+    migrate()
+    seed_vacancies(args.rows)
+    emit(
+        asyncio.run(
+            run_benchmark(
+                rows=args.rows,
+                lookups=args.lookups,
+                concurrency=args.concurrency,
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
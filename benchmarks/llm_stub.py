@@ -0,0 +1,534 @@
+r"""OpenAI-compatible stub server for offline AI benchmarks.
+
+Serves ``/v1/chat/completions`` (plain and streamed) and
+``/v1/embeddings`` with simulated latency, so the AI analyst can be
+load-tested without a real model. Chat answers are scoring JSON in the
+shape the analyst expects, for single and batched prompts; scores are
+derived from the vacancy text, so repeated requests are stable.
+
+Time to first token is the sampled ``--latency`` plus uncached prompt
+tokens divided by ``--prefill-tokens-per-second``; tokens are then
+generated at ``--tokens-per-second``. With ``--prefix-cache`` a
+repeated system message is reported as cached and skips prefill.
+``GET /stats`` returns request, error, token and concurrency counters.
+
+Usage:
+    python -m benchmarks.llm_stub --port 8089 \
+        --latency lognormal:0.4,0.5 --tokens-per-second 40 \
+        --prefill-tokens-per-second 2000 --prefix-cache \
+        --error-rate 0.02 --trailing-text "Надеюсь, это поможет."
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from .sandbox import emit
+
+# Rough characters per token of mixed Russian and English text.
+CHARS_PER_TOKEN: Final[int] = 4
+STREAM_CHUNK_CHARS: Final[int] = 8
+PREFIX_CACHE_SIZE: Final[int] = 1024
+BATCH_RE: Final[re.Pattern[str]] = re.compile(r"ВАКАНСИИ:\n(\[.*\])", re.S)
+VACANCY_MARKER: Final[str] = "ТЕКСТ ВАКАНСИИ:\n"  # noqa: RUF001
+WORD_RE: Final[re.Pattern[str]] = re.compile(r"\w+")
+REASONS: Final[tuple[str, ...]] = (
+    "Стек совпадает с резюме",  # noqa: RUF001
+    "Частичное совпадение стека",
+    "Другой основной язык",
+)
+STATUS_TEXT: Final[dict[int, str]] = {
+    200: "OK",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def count_tokens(text: str) -> int:
+    """Approximate the token count of a text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+@dataclass(frozen=True, slots=True)
+class Latency:
+    """A latency distribution in seconds.
+
+    Specs: ``fixed:S``, ``uniform:LOW,HIGH``, ``exp:MEAN`` and
+    ``lognormal:MEDIAN,SIGMA``.
+    """
+
+    kind: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def parse(cls, spec: str) -> Latency:
+        """Parse a latency spec."""
+        kind, _, values = spec.partition(":")
+        params = tuple(float(value) for value in values.split(",") if value)
+        arity = {"fixed": 1, "uniform": 2, "exp": 1, "lognormal": 2}
+        if arity.get(kind) != len(params):
+            raise argparse.ArgumentTypeError(f"Bad latency spec: {spec}")
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency."""
+        match self.kind:
+            case "uniform":
+                return rng.uniform(*self.params)
+            case "exp":
+                return rng.expovariate(1 / self.params[0])
+            case "lognormal":
+                median, sigma = self.params
+                return rng.lognormvariate(math.log(median), sigma)
+            case _:
+                return self.params[0]
+
+
+@dataclass(slots=True)
+class StubStats:
+    """Counters reported by ``GET /stats``."""
+
+    chat_requests: int = 0
+    stream_requests: int = 0
+    embedding_requests: int = 0
+    injected_errors: int = 0
+    aborted_streams: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def report(self) -> dict[str, Any]:
+        """Return the counters with the uptime."""
+        report = asdict(self)
+        report["uptime_seconds"] = round(
+            time.monotonic() - report.pop("started"), 3
+        )
+        return report
+
+
+class LLMStub:
+    """Simulated model behind the HTTP endpoints."""
+
+    def __init__(
+        self,
+        latency: Latency,
+        tokens_per_second: float,
+        prefill_tokens_per_second: float,
+        prefix_cache: bool,
+        error_rate: float,
+        error_status: int,
+        answer: dict[str, Any] | None,
+        trailing_text: str,
+        embedding_dim: int,
+        seed: int | None,
+    ) -> None:
+        """Initialize the stub; rates of 0 mean instantaneous."""
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.prefill_tokens_per_second = prefill_tokens_per_second
+        self.prefix_cache = prefix_cache
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.answer = answer
+        self.trailing_text = trailing_text
+        self.embedding_dim = embedding_dim
+        self.rng = random.Random(seed)  # noqa: S311
+        self.stats = StubStats()
+        self._prefixes: dict[str, None] = {}
+
+    def _score(self, vacancy_text: str) -> dict[str, Any]:
+        """Return the answer for one vacancy."""
+        if self.answer is not None:
+            return dict(self.answer)
+        value = int(hashlib.sha256(vacancy_text.encode()).hexdigest()[:8], 16)
+        return {
+            "score": value % 101,
+            "main_reasons": REASONS[value % len(REASONS)],
+            "missing_skills": "Kubernetes, Kafka",
+        }
+
+    def answer_text(self, prompt: str) -> str:
+        """Build the model output for a user prompt."""
+        batch = BATCH_RE.search(prompt)
+        if batch is not None:
+            items: list[dict[str, Any]] = json.loads(batch.group(1))
+            answer: Any = [
+                {"id": item["id"], **self._score(item["text"])}
+                for item in items
+            ]
+        else:
+            _, _, vacancy_text = prompt.partition(VACANCY_MARKER)
+            answer = self._score(vacancy_text or prompt)
+        return json.dumps(answer, ensure_ascii=False) + self.trailing_text
+
+    def cached_tokens(self, system_prompt: str) -> int:
+        """Return the cached prefix tokens and remember the prefix."""
+        if not self.prefix_cache or not system_prompt:
+            return 0
+        key = hashlib.sha256(system_prompt.encode()).hexdigest()
+        hit = key in self._prefixes
+        self._prefixes.pop(key, None)
+        self._prefixes[key] = None
+        if len(self._prefixes) > PREFIX_CACHE_SIZE:
+            del self._prefixes[next(iter(self._prefixes))]
+        return count_tokens(system_prompt) if hit else 0
+
+    def first_token_delay(self, prompt_tokens: int, cached: int) -> float:
+        """Seconds until the first generated token."""
+        delay = self.latency.sample(self.rng)
+        if self.prefill_tokens_per_second:
+            delay += (prompt_tokens - cached) / self.prefill_tokens_per_second
+        return delay
+
+    def generation_delay(self, tokens: float) -> float:
+        """Seconds to generate the given number of tokens."""
+        if not self.tokens_per_second:
+            return 0.0
+        return tokens / self.tokens_per_second
+
+    def should_fail(self) -> bool:
+        """Whether to inject an error into this request."""
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.stats.injected_errors += 1
+            return True
+        return False
+
+    def embed(self, text: str) -> list[float]:
+        """Return a unit hashed bag-of-words vector of a text."""
+        vector = [0.0] * self.embedding_dim
+        for word in WORD_RE.findall(text.lower()):
+            digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+            index = int.from_bytes(digest[:4]) % self.embedding_dim
+            vector[index] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.hypot(*vector) or 1.0
+        return [value / norm for value in vector]
+
+
+def _head(
+    status: int,
+    content_type: str,
+    length: int | None = None,
+) -> bytes:
+    """Build HTTP/1.1 response headers."""
+    lines = [
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Error')}",
+        f"Content-Type: {content_type}",
+        "Connection: keep-alive",
+    ]
+    if length is None:
+        lines.append("Transfer-Encoding: chunked")
+    else:
+        lines.append(f"Content-Length: {length}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+
+def _chunk(data: bytes) -> bytes:
+    """Frame data for chunked transfer encoding."""
+    return f"{len(data):x}\r\n".encode() + data + b"\r\n"
+
+
+class StubServer:
+    """Minimal keep-alive HTTP server in front of a :class:`LLMStub`."""
+
+    def __init__(self, stub: LLMStub) -> None:
+        """Initialize the server."""
+        self.stub = stub
+
+    @staticmethod
+    async def _read_request(
+        reader: asyncio.StreamReader,
+    ) -> tuple[str, str, bytes] | None:
+        """Read one request; None when the client closed."""
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        length = 0
+        while (line := await reader.readline()) not in {b"\r\n", b"\n", b""}:
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return method, path.split("?", 1)[0], await reader.readexactly(length)
+
+    @staticmethod
+    async def _send_json(
+        writer: asyncio.StreamWriter, status: int, payload: object
+    ) -> None:
+        """Send a JSON response."""
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        writer.write(_head(status, "application/json", len(body)) + body)
+        await writer.drain()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests of one connection until it is closed."""
+        try:
+            with contextlib.suppress(
+                ConnectionError, asyncio.IncompleteReadError
+            ):
+                while (
+                    request := await self._read_request(reader)
+                ) is not None:
+                    await self._dispatch(writer, *request)
+        finally:
+            writer.close()
+
+    async def _dispatch(
+        self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes
+    ) -> None:
+        """Route a request to its endpoint."""
+        stats = self.stub.stats
+        if method == "GET" and path == "/stats":
+            await self._send_json(writer, 200, stats.report())
+            return
+        if method == "GET" and path.endswith("/models"):
+            await self._send_json(
+                writer, 200, {"object": "list", "data": [{"id": "stub"}]}
+            )
+            return
+        if method != "POST" or not path.endswith((
+            "/chat/completions",
+            "/embeddings",
+        )):
+            await self._send_json(writer, 404, {"error": {"message": path}})
+            return
+
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            request: dict[str, Any] = json.loads(body)
+            if path.endswith("/embeddings"):
+                await self._embeddings(writer, request)
+            else:
+                await self._chat(writer, request)
+        finally:
+            stats.in_flight -= 1
+
+    async def _fail(self, writer: asyncio.StreamWriter) -> None:
+        """Answer with the injected error after the base latency."""
+        await asyncio.sleep(self.stub.latency.sample(self.stub.rng))
+        await self._send_json(
+            writer,
+            self.stub.error_status,
+            {"error": {"message": "Injected failure", "type": "server_error"}},
+        )
+
+    async def _chat(
+        self, writer: asyncio.StreamWriter, request: dict[str, Any]
+    ) -> None:
+        """Serve a chat completion."""
+        stub = self.stub
+        stub.stats.chat_requests += 1
+        if stub.should_fail():
+            await self._fail(writer)
+            return
+
+        messages: list[dict[str, str]] = request["messages"]
+        system_prompt = next(
+            (m["content"] for m in messages if m["role"] == "system"), ""
+        )
+        content = stub.answer_text(messages[-1]["content"])
+        prompt_tokens = sum(count_tokens(m["content"]) for m in messages)
+        cached = stub.cached_tokens(system_prompt)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": count_tokens(content),
+            "total_tokens": prompt_tokens + count_tokens(content),
+            "prompt_tokens_details": {"cached_tokens": cached},
+        }
+        stub.stats.prompt_tokens += prompt_tokens
+        stub.stats.cached_tokens += cached
+        await asyncio.sleep(stub.first_token_delay(prompt_tokens, cached))
+
+        if request.get("stream"):
+            await self._stream(writer, request, content, usage)
+            return
+
+        await asyncio.sleep(stub.generation_delay(usage["completion_tokens"]))
+        stub.stats.completion_tokens += usage["completion_tokens"]
+        await self._send_json(
+            writer,
+            200,
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            },
+        )
+
+    async def _stream(
+        self,
+        writer: asyncio.StreamWriter,
+        request: dict[str, Any],
+        content: str,
+        usage: dict[str, Any],
+    ) -> None:
+        """Stream a chat completion as server-sent events."""
+        self.stub.stats.stream_requests += 1
+        writer.write(_head(200, "text/event-stream"))
+        try:
+            await self._write_events(writer, request, content, usage)
+        except ConnectionError:
+            # The client stopped reading, e.g. after an early stop.
+            self.stub.stats.aborted_streams += 1
+            raise
+
+    async def _write_events(
+        self,
+        writer: asyncio.StreamWriter,
+        request: dict[str, Any],
+        content: str,
+        usage: dict[str, Any],
+    ) -> None:
+        """Write the completion chunks at the generation rate."""
+
+        def event(delta: dict[str, str], **extra: object) -> bytes:
+            chunk = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": request["model"],
+                "choices": [{"index": 0, "delta": delta, **extra}],
+            }
+            return _chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+
+        for start in range(0, len(content), STREAM_CHUNK_CHARS):
+            piece = content[start : start + STREAM_CHUNK_CHARS]
+            writer.write(event({"content": piece}, finish_reason=None))
+            await writer.drain()
+            self.stub.stats.completion_tokens += len(piece) // CHARS_PER_TOKEN
+            await asyncio.sleep(
+                self.stub.generation_delay(len(piece) / CHARS_PER_TOKEN)
+            )
+        writer.write(event({}, finish_reason="stop"))
+        if (request.get("stream_options") or {}).get("include_usage"):
+            final = {"id": "chatcmpl-stub", "choices": [], "usage": usage}
+            writer.write(_chunk(f"data: {json.dumps(final)}\n\n".encode()))
+        writer.write(_chunk(b"data: [DONE]\n\n") + b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _embeddings(
+        self, writer: asyncio.StreamWriter, request: dict[str, Any]
+    ) -> None:
+        """Serve an embeddings request."""
+        stub = self.stub
+        stub.stats.embedding_requests += 1
+        if stub.should_fail():
+            await self._fail(writer)
+            return
+
+        texts: list[str] = (
+            [request["input"]]
+            if isinstance(request["input"], str)
+            else request["input"]
+        )
+        tokens = sum(count_tokens(text) for text in texts)
+        stub.stats.prompt_tokens += tokens
+        await asyncio.sleep(stub.first_token_delay(tokens, cached=0))
+        await self._send_json(
+            writer,
+            200,
+            {
+                "object": "list",
+                "model": request["model"],
+                "data": [
+                    {
+                        "object": "embedding",
+                        "index": index,
+                        "embedding": stub.embed(text),
+                    }
+                    for index, text in enumerate(texts)
+                ],
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            },
+        )
+
+
+def load_answer(value: str | None) -> dict[str, Any] | None:
+    """Parse ``--answer``: inline JSON or ``@path`` to a JSON file."""
+    if value is None:
+        return None
+    if value.startswith("@"):
+        value = Path(value[1:]).read_text(encoding="utf-8")
+    answer: dict[str, Any] = json.loads(value)
+    return answer
+
+
+async def serve(host: str, port: int, stub: LLMStub) -> None:
+    """Serve until cancelled, then print the final stats."""
+    server = await asyncio.start_server(
+        StubServer(stub).handle, host=host, port=port
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        emit(stub.stats.report())
+
+
+def main() -> None:
+    """Parse arguments and run the stub server."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument(
+        "--latency", type=Latency.parse, default=Latency.parse("fixed:0.05")
+    )
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--prefill-tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--prefix-cache", action="store_true")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument(
+        "--answer", help="Canned answer JSON, or @path to a JSON file"
+    )
+    parser.add_argument("--trailing-text", default="")
+    parser.add_argument("--embedding-dim", type=int, default=256)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    stub = LLMStub(
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        prefill_tokens_per_second=args.prefill_tokens_per_second,
+        prefix_cache=args.prefix_cache,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        answer=load_answer(args.answer),
+        trailing_text=args.trailing_text,
+        embedding_dim=args.embedding_dim,
+        seed=args.seed,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, stub))
+
+
+if __name__ == "__main__":
+    main()
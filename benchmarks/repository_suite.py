@@ -0,0 +1,359 @@
+r"""Benchmark every repository backend on a large synthetic dataset.
+
+Each configuration gets its own sandbox: one worker process seeds the
+store, a second one opens it through ``make_repository`` and measures
+``exists``, ``exists_many``, ``save`` and ``save_many`` under
+concurrency. The report holds p50/p99 latency, throughput, the data
+directory size and peak memory, and is written as JSON.
+
+Usage:
+    python -m benchmarks.repository_suite --rows 1000000
+    python -m benchmarks.repository_suite --rows 10000000 \
+        --configs sqlite-wal-normal digest-fsync --output report.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from .sandbox import (
+    DATABASE_PATH,
+    emit,
+    missing_hash,
+    run_in,
+    sandbox,
+    stored_hash,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from src.services.scrapper.entity import VacancyEntity
+
+DIGEST_PATH: Final[str] = "data/digests"
+DIGEST_SEED_CHUNK: Final[int] = 1_000_000
+MODULE: Final[str] = "benchmarks.repository_suite"
+
+CONFIGS: Final[dict[str, dict[str, object]]] = {
+    "orm-wal-normal": {
+        "repository_backend": "orm",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+    },
+    "orm-wal-full": {
+        "repository_backend": "orm",
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+    },
+    "orm-delete-full": {
+        "repository_backend": "orm",
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+    },
+    "sqlite-wal-normal": {
+        "repository_backend": "sqlite",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+    },
+    "sqlite-wal-full": {
+        "repository_backend": "sqlite",
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+    },
+    "sqlite-delete-full": {
+        "repository_backend": "sqlite",
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+    },
+    "digest-fsync": {
+        "repository_backend": "digest",
+        "digest_store_path": DIGEST_PATH,
+        "digest_fsync": True,
+    },
+    "digest-nofsync": {
+        "repository_backend": "digest",
+        "digest_store_path": DIGEST_PATH,
+        "digest_fsync": False,
+    },
+}
+
+
+def peak_rss_kib() -> int:
+    """Return the peak resident set size of this process in KiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def directory_size(path: Path) -> int:
+    """Return the total size of files under ``path`` in bytes."""
+    return sum(
+        item.stat().st_size for item in path.rglob("*") if item.is_file()
+    )
+
+
+def make_vacancy(key: str) -> VacancyEntity:
+    """Build a synthetic vacancy with a unique hash."""
+    from src.services.scrapper.entity import VacancyEntity
+
+    return VacancyEntity(
+        title=f"Python developer {key}",
+        company="Benchmark LLC",
+        salary="100 000 - 200 000",
+        experience="1-3 years",
+        description="Responsibilities and requirements. " * 20,
+        link=f"https://example.com/vacancy/{key}",
+        location="Moscow",
+        date="2026-01-01T00:00:00",
+        raw_data={},
+        main_tag="#benchmark",
+    )
+
+
+def lookup_hash(index: int, rows: int) -> str:
+    """Return a lookup key; every other one hits a stored vacancy."""
+    if index % 2:
+        return stored_hash(index * 7919 % rows)
+    return missing_hash(index)
+
+
+async def measure(
+    operation: Callable[[int], Awaitable[object]],
+    count: int,
+    concurrency: int,
+    items_per_call: int = 1,
+) -> dict[str, float]:
+    """Run ``operation`` ``count`` times from concurrent workers.
+
+    Args:
+        operation: Coroutine function taking the call index.
+        count: Number of calls.
+        concurrency: Number of concurrent workers.
+        items_per_call: Vacancies handled by one call.
+
+    Returns:
+        dict[str, float]: Latency percentiles and throughput.
+    """
+    indexes = iter(range(count))
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        for index in indexes:
+            started = time.perf_counter()
+            await operation(index)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "calls": count,
+        "p50_ms": round(percentiles[49] * 1000, 3),
+        "p99_ms": round(percentiles[98] * 1000, 3),
+        "calls_per_second": round(count / elapsed, 1),
+        "items_per_second": round(count * items_per_call / elapsed, 1),
+    }
+
+
+async def run_measure(
+    rows: int,
+    operations: int,
+    batch_size: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Open the configured repository and measure every operation."""
+    from src.core.conf import DatabaseSettings
+    from src.core.database import DB_MANAGER
+    from src.services.scrapper.tasks.make import make_repository
+
+    baseline_rss = peak_rss_kib()
+    started = time.perf_counter()
+    repository = make_repository(DatabaseSettings())  # pyright: ignore[reportCallIssue]
+    await repository.exists(vacancy_hash=missing_hash(-1))
+    open_seconds = time.perf_counter() - started
+
+    batches = max(operations // batch_size, 2)
+
+    async def exists(index: int) -> None:
+        await repository.exists(vacancy_hash=lookup_hash(index, rows))
+
+    async def exists_many(index: int) -> None:
+        start = index * batch_size
+        await repository.exists_many(
+            vacancy_hashes=[
+                lookup_hash(start + offset, rows)
+                for offset in range(batch_size)
+            ]
+        )
+
+    async def save(index: int) -> None:
+        await repository.save(vacancy=make_vacancy(f"save-{index}"))
+
+    async def save_many(index: int) -> None:
+        start = index * batch_size
+        await repository.save_many(
+            vacancies=[
+                make_vacancy(f"save-many-{start + offset}")
+                for offset in range(batch_size)
+            ]
+        )
+
+    results: dict[str, Any] = {
+        "open_seconds": round(open_seconds, 4),
+        "exists": await measure(exists, operations, concurrency),
+        "exists_many": await measure(
+            exists_many, batches, concurrency, items_per_call=batch_size
+        ),
+        "save": await measure(save, operations, concurrency),
+        "save_many": await measure(
+            save_many, batches, concurrency, items_per_call=batch_size
+        ),
+    }
+
+    await repository.close()
+    await DB_MANAGER.dispose_engine()
+
+    results["data_bytes"] = directory_size(Path(DATABASE_PATH).parent)
+    results["baseline_rss_kib"] = baseline_rss
+    results["peak_rss_kib"] = peak_rss_kib()
+    return results
+
+
+def write_digest_segments(rows: int) -> None:
+    """Write stored hashes as sorted segments of up to 1M records."""
+    from src.services.scrapper.repositories.digest_store import RECORD
+
+    directory = Path(DIGEST_PATH)
+    directory.mkdir(parents=True, exist_ok=True)
+    created_at = int(time.time())
+
+    for generation, start in enumerate(range(0, rows, DIGEST_SEED_CHUNK)):
+        digests = sorted(
+            bytes.fromhex(stored_hash(index))
+            for index in range(start, min(start + DIGEST_SEED_CHUNK, rows))
+        )
+        path = directory / f"segment-{generation:010d}.bin"
+        with path.open("wb") as f:
+            f.writelines(RECORD.pack(digest, created_at) for digest in digests)
+
+
+async def merge_digest_segments() -> None:
+    """Merge seeded segments into one, as a retention purge would."""
+    from src.services.scrapper.repositories import DigestStoreRepository
+
+    store = DigestStoreRepository(directory=Path(DIGEST_PATH), fsync=False)
+    await store.purge_expired(
+        older_than=datetime.fromtimestamp(0, tz=UTC), batch_size=0
+    )
+    await store.close()
+
+
+def run_seed(backend: str, rows: int) -> dict[str, Any]:
+    """Populate the sandbox store with ``rows`` vacancies."""
+    from .sandbox import migrate, seed_vacancies
+
+    started = time.perf_counter()
+    if backend == "digest":
+        write_digest_segments(rows)
+        asyncio.run(merge_digest_segments())
+    else:
+        migrate()
+        seed_vacancies(rows)
+
+    return {
+        "seconds": round(time.perf_counter() - started, 2),
+        "data_bytes": directory_size(Path(DATABASE_PATH).parent),
+    }
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, Any]:
+    """Seed and measure every selected configuration."""
+    measure_args: list[str] = [
+        "--rows",
+        str(args.rows),
+        "--operations",
+        str(args.operations),
+        "--batch-size",
+        str(args.batch_size),
+        "--concurrency",
+        str(args.concurrency),
+    ]
+    results: dict[str, Any] = {}
+    for name in args.configs:
+        settings = CONFIGS[name]
+        backend = str(settings["repository_backend"])
+        with sandbox(settings) as directory:
+            seed = run_in(
+                directory,
+                MODULE,
+                ["seed", "--backend", backend, "--rows", str(args.rows)],
+            )
+            results[name] = {
+                "settings": settings,
+                "seed": seed,
+                **run_in(directory, MODULE, ["measure", *measure_args]),
+            }
+
+    return {
+        "generated_at": datetime.now(tz=UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "rows": args.rows,
+        "operations": args.operations,
+        "batch_size": args.batch_size,
+        "concurrency": args.concurrency,
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse arguments and run the suite or one of its phases."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--worker", action="store_true")
+    parser.add_argument("phase", nargs="?", choices=["seed", "measure"])
+    parser.add_argument("--backend", default="sqlite")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--operations", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--configs", nargs="+", choices=list(CONFIGS), default=list(CONFIGS)
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    if not args.worker:
+        report = run_suite(args)
+        if args.output is not None:
+            args.output.write_text(
+                json.dumps(report, indent=2) + "\n", encoding="utf-8"
+            )
+        emit(report)
+        return
+
+    if args.phase == "seed":
+        emit(run_seed(backend=args.backend, rows=args.rows))
+        return
+
+    emit(
+        asyncio.run(
+            run_measure(
+                rows=args.rows,
+                operations=args.operations,
+                batch_size=args.batch_size,
+                concurrency=args.concurrency,
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Run benchmark workers against a throwaway database.
+
+``DatabaseSettings`` is a process-wide singleton read from
+``settings.toml`` in the working directory, so every benchmark
+configuration runs in its own subprocess inside a temporary directory
+with a generated settings file.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+ROOT: Final[Path] = Path(__file__).resolve().parent.parent
+DATABASE_PATH: Final[str] = "data/benchmark.db"
+
+
+def _toml_value(value: object) -> str:
+    """Format a scalar as a TOML value."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return str(value)
+    return json.dumps(str(value))
+
+
+def write_settings(directory: Path, database: dict[str, object]) -> None:
+    """Write a ``settings.toml`` with the given database section."""
+    lines: list[str] = ["[database]"]
+    lines.extend(
+        f"{key} = {_toml_value(value)}"
+        for key, value in {"database_path": DATABASE_PATH, **database}.items()
+    )
+    (directory / "settings.toml").write_text(
+        "\n".join(lines) + "\n", encoding="utf-8"
+    )
+
+
+@contextmanager
+def sandbox(database: dict[str, object]) -> Generator[Path]:
+    """Create a temporary working directory with a settings file.
+
+    Args:
+        database: Overrides for the ``[database]`` settings section.
+
+    Yields:
+        Path: The sandbox directory, removed on exit.
+    """
+    with tempfile.TemporaryDirectory(prefix="job-tracker-bench-") as tmp:
+        directory = Path(tmp)
+        (directory / "data").mkdir()
+        write_settings(directory, database)
+        yield directory
+
+
+def run_in(
+    directory: Path,
+    module: str,
+    args: list[str],
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Run ``module --worker`` in a sandbox and return its JSON report.
+
+    Args:
+        directory: Sandbox directory created by :func:`sandbox`.
+        module: Benchmark module name, e.g. ``benchmarks.exists_qps``.
+        args: Extra command line arguments for the worker.
+        timeout: Maximum worker run time in seconds.
+
+    Returns:
+        dict[str, Any]: The last JSON line printed by the worker.
+    """
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", module, "--worker", *args],
+        cwd=directory,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=timeout,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"{module} failed with code {completed.returncode}:\n"
+            f"{completed.stderr}"
+        )
+
+    report: dict[str, Any] = json.loads(completed.stdout.splitlines()[-1])
+    return report
+
+
+def run_worker(
+    module: str,
+    database: dict[str, object],
+    args: list[str],
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Run ``module --worker`` once in a fresh sandbox.
+
+    Args:
+        module: Benchmark module name, e.g. ``benchmarks.exists_qps``.
+        database: Overrides for the ``[database]`` settings section.
+        args: Extra command line arguments for the worker.
+        timeout: Maximum worker run time in seconds.
+
+    Returns:
+        dict[str, Any]: The last JSON line printed by the worker.
+    """
+    with sandbox(database) as directory:
+        return run_in(directory, module, args, timeout)
+
+
+def migrate() -> None:
+    """Create the schema in the sandbox database via Alembic."""
+    from alembic.config import Config
+
+    from alembic import command
+
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    command.upgrade(config, "head")
+
+
+def stored_hash(index: int) -> str:
+    """Return the synthetic hash of the ``index``-th stored vacancy."""
+    return hashlib.sha256(f"stored-{index}".encode()).hexdigest()
+
+
+def missing_hash(index: int) -> str:
+    """Return a synthetic hash that is never stored."""
+    return hashlib.sha256(f"missing-{index}".encode()).hexdigest()
+
+
+def seed_vacancies(rows: int, batch_size: int = 100_000) -> None:
+    """Bulk-insert synthetic vacancy hashes bypassing the application.
+
+    Args:
+        rows: Number of vacancies to insert.
+        batch_size: Rows per transaction.
+    """
+
+    def batch(start: int) -> Iterator[tuple[str]]:
+        for index in range(start, min(start + batch_size, rows)):
+            yield (stored_hash(index),)
+
+    connection = sqlite3.connect(DATABASE_PATH)
+    try:
+        for start in range(0, rows, batch_size):
+            with connection:
+                connection.executemany(
+                    "INSERT INTO vacancys (hash) VALUES (?)", batch(start)
+                )
+    finally:
+        connection.close()
+
+
+def emit(report: dict[str, Any]) -> None:
+    """Write a report as a single JSON line to stdout."""
+    sys.stdout.write(json.dumps(report) + "\n")
+    sys.stdout.flush()
@@ -0,0 +1,121 @@
+r"""Compare the size and cost of vacancy wire formats.
+
+Encodes synthetic scored vacancies with short and long descriptions as
+JSON and in the binary format, each with and without compression, and
+reports the mean message size and the encode and decode time per
+message. Needs no broker.
+
+Usage:
+    python -m benchmarks.wire_format --messages 2000 \
+        --description-repeats 1,10,40 --compress-min-bytes 1024
+"""
+
+import argparse
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.core.rabbitmq import decode_vacancy, encode_vacancy
+
+from .ai_batching import make_vacancies
+from .mq_publish import make_entities
+from .sandbox import emit
+
+if TYPE_CHECKING:
+    from src.core.rabbitmq import WireFormat
+    from src.services.scrapper.entity import VacancyEntity
+
+
+def make_scored(count: int, repeats: int) -> list[dict[str, Any]]:
+    """Return message fields of scored vacancies.
+
+    The description of every vacancy joins ``repeats`` distinct
+    synthetic descriptions. They share a template, so they compress
+    better than real ones.
+    """
+    texts = make_vacancies(count * repeats)
+    vacancies: list[VacancyEntity] = make_entities(count)
+    for index, vacancy in enumerate(vacancies):
+        vacancy.description = " ".join(
+            texts[index * repeats : (index + 1) * repeats]
+        )
+        vacancy.main_tag = "python"
+        vacancy.tags = ["#python", "#backend", "#django"]
+        vacancy.apply_ai_result({
+            "score": 70,
+            "main_reasons": "Стек совпадает, опыт достаточный",
+            "missing_skills": "Kubernetes, Kafka",
+        })
+    return [vacancy.to_dict() for vacancy in vacancies]
+
+
+def measure(
+    messages: list[dict[str, Any]],
+    wire_format: WireFormat,
+    compress_min_bytes: int,
+) -> dict[str, Any]:
+    """Encode and decode the messages in one format."""
+    started = time.perf_counter()
+    encoded = [
+        encode_vacancy(data, wire_format, compress_min_bytes)
+        for data in messages
+    ]
+    encode_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for body, content_type, content_encoding in encoded:
+        decode_vacancy(body, content_type, content_encoding)
+    decode_seconds = time.perf_counter() - started
+
+    return {
+        "mean_bytes": round(
+            sum(len(body) for body, _, _ in encoded) / len(encoded)
+        ),
+        "encode_us": round(encode_seconds / len(encoded) * 1e6, 2),
+        "decode_us": round(decode_seconds / len(encoded) * 1e6, 2),
+    }
+
+
+def run_benchmark(
+    messages: int, repeats: list[int], compress_min_bytes: int
+) -> dict[str, Any]:
+    """Measure every format for every description length."""
+    report: dict[str, Any] = {"messages": messages}
+    for repeat in repeats:
+        batch = make_scored(messages, repeat)
+        results: dict[str, Any] = {
+            "json": measure(batch, "json", 0),
+            "json_deflate": measure(batch, "json", compress_min_bytes),
+            "binary": measure(batch, "binary", 0),
+            "binary_deflate": measure(batch, "binary", compress_min_bytes),
+        }
+        baseline = results["json"]["mean_bytes"]
+        results["size_vs_json"] = {
+            key: round(result["mean_bytes"] / baseline, 3)
+            for key, result in results.items()
+            if key != "json"
+        }
+        report[f"description_x{repeat}"] = results
+    return report
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--description-repeats", default="1,10,40")
+    parser.add_argument("--compress-min-bytes", type=int, default=1024)
+    args = parser.parse_args()
+
+    emit(
+        run_benchmark(
+            messages=args.messages,
+            repeats=[
+                int(repeat) for repeat in args.description_repeats.split(",")
+            ],
+            compress_min_bytes=args.compress_min_bytes,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import logging
+
+from src.core.conf import (
+    RabbitMQAnalystConfig,
+    RabbitMQPublisherConfig,
+    RabbitMQSettings,
+    ScrapperSettings,
+    setup_logging,
+)
+from src.services.analyst import run_analyst
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+def main() -> None:
+    """Initialize and run the AI analyst worker.
+
+    Exceptions:
+        KeyboardInterrupt:
+            Shuts down the service when interrupted by user.
+        Exception:
+            Logs any unexpected exceptions with full stack trace.
+    """
+    try:
+        log = logging.getLogger(__name__)
+
+        settings = ScrapperSettings()  # pyright: ignore[reportCallIssue]
+
+        setup_logging(settings=settings.logging)
+        rabbitmq_settings = RabbitMQSettings()  # pyright: ignore[reportCallIssue]
+        publisher_settings = RabbitMQPublisherConfig()
+
+        run_analyst(
+            settings=settings,
+            rabbitmq_settings=rabbitmq_settings,
+            publisher_settings=publisher_settings,
+            analyst_config=RabbitMQAnalystConfig(),
+        )
+    except KeyboardInterrupt:
+        log.warning("Cancelled by user")
+    except Exception as e:
+        log.exception(e)
+
+
+if __name__ == "__main__":
+    main()
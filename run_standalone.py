@@ -0,0 +1,48 @@
+"""Entry point for the single-process deployment.
+
+Runs the scrapper and the Telegram bot in one process, passing
+vacancies through an in-process queue instead of RabbitMQ.
+"""
+
+import asyncio
+import logging
+
+from src.core.conf import (
+    LocalQueueSettings,
+    ScrapperSettings,
+    TgBotSettings,
+    setup_logging,
+)
+from src.services.standalone import run_standalone
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+def main() -> None:
+    """Initialize and run the scrapper and the bot.
+
+    Exceptions:
+        KeyboardInterrupt: Shuts down when interrupted by user.
+        Exception: Logs any unexpected exceptions with full stack trace.
+    """
+    try:
+        log = logging.getLogger(__name__)
+        settings = ScrapperSettings()  # pyright: ignore[reportCallIssue]
+        tg_bot_settings = TgBotSettings()  # pyright: ignore[reportCallIssue]
+        setup_logging(settings=settings.logging)
+
+        run_standalone(
+            settings=settings,
+            tg_bot_config=tg_bot_settings.tg_bot,
+            queue_settings=LocalQueueSettings(),
+        )
+    except KeyboardInterrupt:
+        log.warning("Cancelled by user")
+    except asyncio.exceptions.CancelledError:
+        log.info("Cancelled by user")
+    except Exception as e:
+        log.exception(e)
+
+
+if __name__ == "__main__":
+    main()
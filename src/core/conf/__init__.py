@@ -1,9 +1,11 @@
 from .classes import (
     AIAnalystSettings,
+    AIBackendSettings,
     BaseSettingsConfig,
     DatabaseSettings,
     ExcangeConfig,
     HttpxSettings,
+    LocalQueueSettings,
     LoggingSettings,
     LogLevel,
     ProjectSettings,
@@ -18,6 +20,7 @@ from .classes import (
 )
 from .logging import setup_logging
 from .mq_topology import (
+    RabbitMQAnalystConfig,
     RabbitMQConsumerConfig,
     RabbitMQPublisherConfig,
     RabbitMQTopology,
@@ -25,14 +28,17 @@ from .mq_topology import (
 
 __all__ = (
     "AIAnalystSettings",
+    "AIBackendSettings",
     "BaseSettingsConfig",
     "DatabaseSettings",
     "ExcangeConfig",
     "HttpxSettings",
+    "LocalQueueSettings",
     "LogLevel",
     "LoggingSettings",
     "ProjectSettings",
     "QueueConfig",
+    "RabbitMQAnalystConfig",
     "RabbitMQConsumerConfig",
     "RabbitMQPublisherConfig",
     "RabbitMQSettings",
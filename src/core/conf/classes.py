@@ -95,6 +95,11 @@ class SourceSettings(BaseModel):
     period_minutes: int
     resume: Path
 
+    @property
+    def key(self) -> str:
+        """Identifier of the source."""
+        return f"{self.source_type.value}_{self.url}"
+
     @property
     def resume_text(self) -> str:
         """Get resume text."""
@@ -114,12 +119,82 @@ class HttpxSettings(BaseModel):
     http2: bool = False
 
 
+class AIBackendSettings(BaseModel):
+    """Additional OpenAI-compatible endpoint for AI scoring."""
+
+    base_url: str
+    api_key: str
+    # Model served by this endpoint; defaults to the primary model.
+    model: str | None = None
+    weight: float = Field(default=1.0, gt=0)
+
+
 class AIAnalystSettings(BaseModel):
     """AI Analyst settings."""
 
     base_url: str
     api_key: str
     model: str
+    weight: float = Field(default=1.0, gt=0)
+    backends: list[AIBackendSettings] = Field(default_factory=list)
+    # Latency quantile after which a request is hedged; 0 disables.
+    hedge_percentile: float = 0.95
+    eject_after_failures: int = 3
+    eject_seconds: float = 60.0
+    stats_interval_minutes: int = 15
+    # "worker" hands new vacancies to the analyst worker via the
+    # analysis queue instead of scoring them in the polling task.
+    mode: Literal["inline", "worker"] = "inline"
+    worker_prefetch: int = 8
+    max_concurrency: int = 4
+    # Vacancies per scoring request, keyed by model name; default 1.
+    batch_sizes: dict[str, int] = Field(default_factory=dict)
+    stream: bool = False
+    cache_enabled: bool = True
+    cache_ttl_days: int = 14
+    cache_max_entries: int = 50_000
+    cache_evict_interval_minutes: int = 60
+    # Failed scorings are parked and retried with exponential backoff.
+    # "gate" publishes a vacancy once it is scored, "publish" sends it
+    # unscored at once and stores the score later.
+    retry_enabled: bool = True
+    retry_mode: Literal["gate", "publish"] = "gate"
+    retry_base_delay_minutes: int = 5
+    retry_max_delay_minutes: int = 360
+    retry_max_attempts: int = 8
+    # Parked vacancies re-scored per run of the retry task.
+    retry_budget: int = 20
+    retry_interval_minutes: int = 5
+    # Claimed entries are hidden from other processes for this long.
+    retry_lease_minutes: int = 15
+    # TF-IDF relevance (0-1) below which the LLM is not called.
+    prefilter_threshold: float = 0.0
+    prefilter_mode: Literal["skip", "low_priority"] = "low_priority"
+    # Local model trained on likes and dislikes in the bot; replaces
+    # the LLM score when its probability is at least the confidence.
+    ranker_enabled: bool = True
+    ranker_confidence: float = 0.9
+    ranker_min_feedback: int = 50
+    ranker_interval_minutes: int = 10
+    # Vacancies of the retention window are re-scored after a resume
+    # changes; a correction is sent if the score moved by min_delta.
+    resume_rescore_enabled: bool = True
+    resume_rescore_min_delta: int = 15
+    resume_rescore_chunk_size: int = 20
+    resume_rescore_rate_per_minute: int = Field(default=60, gt=0)
+    resume_rescore_interval_minutes: int = 10
+    # Claimed vacancies are hidden from other processes for this long.
+    resume_rescore_lease_minutes: int = 15
+    # "embedding" scores by cosine similarity of embeddings and asks
+    # the chat model only for vacancies above the explain threshold.
+    scorer: Literal["chat", "embedding"] = "chat"
+    embedding_model: str = "text-embedding-3-small"
+    embedding_batch_size: int = 64
+    # Cosine similarities mapped to embedding scores of 0 and 100;
+    # the explain threshold applies to the mapped score.
+    embedding_cosine_floor: float = 0.2
+    embedding_cosine_ceiling: float = 0.6
+    embedding_explain_threshold: int = 70
 
 
 class ScrapperSettings(BaseSettingsConfig):
@@ -196,6 +271,104 @@ class DatabaseSettings(BaseSettingsConfig):
             "expire_on_commit",
         ),
     )
+    retention_days: int = Field(
+        default=30,
+        validation_alias=AliasPath(
+            "database",
+            "retention_days",
+        ),
+    )
+    purge_batch_size: int = Field(
+        default=500,
+        validation_alias=AliasPath(
+            "database",
+            "purge_batch_size",
+        ),
+    )
+    purge_interval_minutes: int = Field(
+        default=60,
+        validation_alias=AliasPath(
+            "database",
+            "purge_interval_minutes",
+        ),
+    )
+    vacuum_pages: int = Field(
+        default=1000,
+        validation_alias=AliasPath(
+            "database",
+            "vacuum_pages",
+        ),
+    )
+    repository_backend: Literal["orm", "sqlite", "digest"] = Field(
+        default="orm",
+        validation_alias=AliasPath(
+            "database",
+            "repository_backend",
+        ),
+    )
+    digest_store_path: Path = Field(
+        default=Path("data/digests"),
+        validation_alias=AliasPath(
+            "database",
+            "digest_store_path",
+        ),
+    )
+    digest_compact_threshold: int = Field(
+        default=10_000,
+        validation_alias=AliasPath(
+            "database",
+            "digest_compact_threshold",
+        ),
+    )
+    digest_max_segments: int = Field(
+        default=8,
+        validation_alias=AliasPath(
+            "database",
+            "digest_max_segments",
+        ),
+    )
+    digest_fsync: bool = Field(
+        default=True,
+        validation_alias=AliasPath(
+            "database",
+            "digest_fsync",
+        ),
+    )
+    journal_mode: Literal["DELETE", "TRUNCATE", "PERSIST", "WAL"] = Field(
+        default="WAL",
+        validation_alias=AliasPath(
+            "database",
+            "journal_mode",
+        ),
+    )
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        validation_alias=AliasPath(
+            "database",
+            "synchronous",
+        ),
+    )
+    writer_queue_size: int = Field(
+        default=1000,
+        validation_alias=AliasPath(
+            "database",
+            "writer_queue_size",
+        ),
+    )
+    writer_batch_size: int = Field(
+        default=100,
+        validation_alias=AliasPath(
+            "database",
+            "writer_batch_size",
+        ),
+    )
+    writer_batch_window_ms: int = Field(
+        default=10,
+        validation_alias=AliasPath(
+            "database",
+            "writer_batch_window_ms",
+        ),
+    )
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -237,6 +410,67 @@ class RabbitMQSettings(BaseSettingsConfig):
         default=...,
         validation_alias=AliasPath("rabbitmq", "connection_ttl"),
     )
+    confirm_window: int = Field(
+        default=64,
+        validation_alias=AliasPath("rabbitmq", "confirm_window"),
+    )
+    channel_pool_size: int = Field(
+        default=4,
+        validation_alias=AliasPath("rabbitmq", "channel_pool_size"),
+    )
+    wire_format: Literal["json", "binary"] = Field(
+        default="binary",
+        validation_alias=AliasPath("rabbitmq", "wire_format"),
+    )
+    compress_min_bytes: int = Field(
+        default=1024,
+        validation_alias=AliasPath("rabbitmq", "compress_min_bytes"),
+    )
+    ready_retry_base_seconds: float = Field(
+        default=0.5,
+        validation_alias=AliasPath("rabbitmq", "ready_retry_base_seconds"),
+    )
+    ready_retry_max_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasPath("rabbitmq", "ready_retry_max_seconds"),
+    )
+    outbox_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasPath("rabbitmq", "outbox_enabled"),
+    )
+    outbox_batch_size: int = Field(
+        default=100,
+        validation_alias=AliasPath("rabbitmq", "outbox_batch_size"),
+    )
+    outbox_poll_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasPath("rabbitmq", "outbox_poll_seconds"),
+    )
+    outbox_retry_base_seconds: int = Field(
+        default=5,
+        validation_alias=AliasPath("rabbitmq", "outbox_retry_base_seconds"),
+    )
+    outbox_retry_max_seconds: int = Field(
+        default=300,
+        validation_alias=AliasPath("rabbitmq", "outbox_retry_max_seconds"),
+    )
+
+
+class LocalQueueSettings(BaseSettingsConfig):
+    """In-process queue settings of the standalone mode."""
+
+    max_size: int = Field(
+        default=1000,
+        validation_alias=AliasPath("local_queue", "max_size"),
+    )
+    put_timeout_seconds: float = Field(
+        default=30.0,
+        validation_alias=AliasPath("local_queue", "put_timeout_seconds"),
+    )
+    persistent: bool = Field(
+        default=True,
+        validation_alias=AliasPath("local_queue", "persistent"),
+    )
 
 
 @dataclass(frozen=True, slots=True)
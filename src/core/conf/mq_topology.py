@@ -31,6 +31,19 @@ queue_config = QueueConfig(
     },
     timeout=15,
 )
+analysis_queue_config = QueueConfig(
+    name="analysis",
+    exchange_name="job_tracker",
+    routing_key="analysis",
+    message_ttl=MESSAGE_TTL,
+    durable=True,
+    arguments={
+        "x-message-ttl": MESSAGE_TTL,
+        "x-dead-letter-exchange": "dlx_job_tracker",
+        "x-dead-letter-routing-key": "failed.analysis",
+    },
+    timeout=15,
+)
 dl_queue_config = QueueConfig(
     name="dl_vacancies",
     exchange_name="dlx_job_tracker",
@@ -43,6 +56,18 @@ dl_queue_config = QueueConfig(
     timeout=15,
 )
 
+dl_analysis_queue_config = QueueConfig(
+    name="dl_analysis",
+    exchange_name="dlx_job_tracker",
+    routing_key="failed.analysis",
+    message_ttl=DLX_MESSGAE_TTL,
+    durable=True,
+    arguments={
+        "x-message-ttl": DLX_MESSGAE_TTL,
+    },
+    timeout=15,
+)
+
 
 class RabbitMQTopology:
     """Publisher topology."""
@@ -54,6 +79,8 @@ class RabbitMQTopology:
     queues: ClassVar[tuple[QueueConfig, ...]] = (
         queue_config,
         dl_queue_config,
+        analysis_queue_config,
+        dl_analysis_queue_config,
     )
 
 
@@ -62,6 +89,7 @@ class RabbitMQPublisherConfig:
 
     vacancy_exchange_name: str = "job_tracker"
     vacancy_routing_key: str = "vacancies"
+    analysis_routing_key: str = "analysis"
 
     topology: RabbitMQTopology = RabbitMQTopology()
 
@@ -74,7 +102,14 @@ class RabbitMQConsumerConfig:
     vacancy_queue: QueueConfig = queue_config
 
 
+class RabbitMQAnalystConfig:
+    """AI analyst worker config."""
+
+    analysis_queue: QueueConfig = analysis_queue_config
+
+
 __all__ = (
+    "RabbitMQAnalystConfig",
     "RabbitMQConsumerConfig",
     "RabbitMQPublisherConfig",
     "RabbitMQTopology",
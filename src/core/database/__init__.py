@@ -1,11 +1,14 @@
 from .base import Base
 from .db_manage import DB_MANAGER, DatabaseManager
 from .mixins import IntIdMixin, TimestampMixin
+from .writer import DatabaseWriter, WriteOperation
 
 __all__ = (
     "DB_MANAGER",
     "Base",
     "DatabaseManager",
+    "DatabaseWriter",
     "IntIdMixin",
     "TimestampMixin",
+    "WriteOperation",
 )
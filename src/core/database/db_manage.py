@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Final
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -9,10 +10,17 @@ from sqlalchemy.ext.asyncio import (
 
 from src.core.conf.classes import DatabaseSettings
 
+from .writer import DatabaseWriter
+
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
+    from sqlite3 import Connection as SQLiteConnection
 
+    from sqlalchemy.engine import Connection
     from sqlalchemy.ext.asyncio.engine import AsyncEngine
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+    from .writer import WriteOperation
 
 
 class DatabaseManager:
@@ -20,6 +28,8 @@ class DatabaseManager:
 
     This class initializes the SQLAlchemy async engine and provides
     a thread-safe session factory, specifically optimized for SQLite.
+    All writes are funnelled through a single ``DatabaseWriter`` so
+    concurrent tasks never contend for the SQLite write lock.
     """
 
     def __init__(self, db_settings: DatabaseSettings) -> None:
@@ -34,6 +44,15 @@ class DatabaseManager:
             echo_pool=db_settings.echo_pool,
             connect_args={"timeout": 30},
         )
+        self._journal_mode = db_settings.journal_mode
+        self._synchronous = db_settings.synchronous
+
+        # The sqlite3 driver manages transactions on its own and breaks
+        # SAVEPOINT; let SQLAlchemy emit BEGIN instead.
+        event.listen(
+            self._async_engine.sync_engine, "connect", self._on_connect
+        )
+        event.listen(self._async_engine.sync_engine, "begin", self._on_begin)
 
         self._async_session_maker: async_sessionmaker[AsyncSession] = (
             async_sessionmaker(
@@ -42,14 +61,73 @@ class DatabaseManager:
                 expire_on_commit=db_settings.expire_on_commit,
             )
         )
+        self._writer = DatabaseWriter(
+            session_factory=self.session,
+            queue_size=db_settings.writer_queue_size,
+            batch_size=db_settings.writer_batch_size,
+            batch_window=db_settings.writer_batch_window_ms / 1000,
+        )
+
+    def _on_connect(
+        self,
+        dbapi_connection: SQLiteConnection,
+        connection_record: ConnectionPoolEntry,  # noqa: ARG002
+    ) -> None:
+        """Configure a new SQLite connection."""
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={self._journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={self._synchronous}")
+        cursor.close()
+
+    @staticmethod
+    def _on_begin(connection: Connection) -> None:
+        """Start a transaction explicitly."""
+        connection.exec_driver_sql("BEGIN")
 
     async def dispose_engine(self) -> None:
         """Gracefully close all database connections in the pool.
 
+        Pending writes are committed before the pool is closed.
         Should be called during application shutdown.
         """
+        await self._writer.stop()
         await self._async_engine.dispose()
 
+    async def write[T](self, operation: WriteOperation[T]) -> T:
+        """Run a write operation through the single writer.
+
+        The operation shares a transaction with other writes submitted
+        within the same batch window and runs in its own savepoint, so
+        its failure does not affect the rest of the batch.
+
+        Args:
+            operation: Coroutine function receiving the session. It
+                must not commit or roll back the session.
+
+        Returns:
+            T: Operation result once the transaction is committed.
+        """
+        return await self._writer.submit(operation)
+
+    async def incremental_vacuum(self, pages: int) -> None:
+        """Return up to ``pages`` free pages to the filesystem.
+
+        Requires the database to use ``auto_vacuum = INCREMENTAL``,
+        otherwise SQLite silently ignores the pragma.
+
+        Args:
+            pages (int): Maximum number of free pages to reclaim.
+        """
+        async with self._async_engine.connect() as connection:
+            result = await connection.execute(
+                text(f"PRAGMA incremental_vacuum({int(pages)})")
+            )
+            # Each step of the pragma frees a single page.
+            if result.returns_rows:
+                result.fetchall()
+            await connection.commit()
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession]:
         """Provide a transactional scope around a series of operations.
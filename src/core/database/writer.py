@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from contextlib import AbstractAsyncContextManager
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+type WriteOperation[T] = Callable[[AsyncSession], Awaitable[T]]
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class WriteRequest:
+    """A write operation waiting for its transaction."""
+
+    operation: WriteOperation[Any]
+    future: asyncio.Future[Any]
+
+
+class DatabaseWriter:
+    """Single writer coroutine that owns all write transactions.
+
+    Callers submit write operations to a bounded queue. The writer
+    collects them for up to ``batch_window`` seconds (or until
+    ``batch_size`` operations are queued) and runs the whole batch in
+    one transaction, each operation inside its own savepoint. The
+    caller is resumed only after the transaction is committed.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ],
+        queue_size: int,
+        batch_size: int,
+        batch_window: float,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            session_factory: Factory of transactional session scopes.
+            queue_size: Maximum number of pending write operations.
+            batch_size: Maximum number of operations per transaction.
+            batch_window: Seconds to wait for more operations before
+                committing a batch.
+        """
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[WriteRequest | None] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self._task: asyncio.Task[None] | None = None
+
+    async def submit[T](self, operation: WriteOperation[T]) -> T:
+        """Run a write operation in the writer transaction.
+
+        Starts the writer lazily on first use, so it is always bound
+        to the running event loop.
+
+        Args:
+            operation: Coroutine function receiving the session.
+
+        Returns:
+            T: Operation result, available once the batch is committed.
+
+        Raises:
+            Exception: Re-raises the error of the operation or commit.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="db-writer")
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        await self._queue.put(WriteRequest(operation=operation, future=future))
+        return await future
+
+    async def stop(self) -> None:
+        """Commit pending operations and stop the writer."""
+        if self._task is None or self._task.done():
+            return
+
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        log.debug("Database writer stopped")
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and commit them."""
+        log.debug("Database writer started")
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            request: WriteRequest | None = await self._queue.get()
+            if request is None:
+                break
+
+            batch: list[WriteRequest] = [request]
+            deadline: float = loop.time() + self.batch_window
+
+            while len(batch) < self.batch_size:
+                timeout: float = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(
+                        self._queue.get(), timeout=timeout
+                    )
+                except TimeoutError:
+                    break
+
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            await self._commit(batch)
+
+    async def _commit(self, batch: list[WriteRequest]) -> None:
+        """Run a batch of operations in a single transaction."""
+        try:
+            async with self._session_factory() as session:
+                results = await self._execute(session, batch)
+                await session.commit()
+
+        except Exception as e:  # noqa: BLE001
+            log.error("Write batch of %d failed: %s", len(batch), e)
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        log.debug("Committed write batch of %d", len(results))
+        for request, result, error in results:
+            if request.future.done():
+                continue
+            if error is None:
+                request.future.set_result(result)
+            else:
+                request.future.set_exception(error)
+
+    @staticmethod
+    async def _execute(
+        session: AsyncSession,
+        batch: list[WriteRequest],
+    ) -> list[tuple[WriteRequest, Any, Exception | None]]:
+        """Run every operation of the batch in its own savepoint."""
+        results: list[tuple[WriteRequest, Any, Exception | None]] = []
+        for request in batch:
+            if request.future.cancelled():
+                continue
+            try:
+                async with session.begin_nested():
+                    result = await request.operation(session)
+                results.append((request, result, None))
+            except Exception as e:  # noqa: BLE001
+                results.append((request, None, e))
+        return results
+
+
+__all__ = ("DatabaseWriter", "WriteOperation")
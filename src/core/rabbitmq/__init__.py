@@ -1,4 +1,5 @@
 from .base_client import RabbitMQClient
+from .channel_pool import ChannelPool
 from .exceptions import (
     RabbitMQConnectionError,
     RabbitMQConsumeError,
@@ -8,8 +9,20 @@ from .exceptions import (
     RabbitMQSerializationError,
     RabbitMQTimeoutError,
 )
+from .wire import (
+    BINARY_CONTENT_TYPE,
+    DEFLATE_ENCODING,
+    JSON_CONTENT_TYPE,
+    WireFormat,
+    decode_vacancy,
+    encode_vacancy,
+)
 
 __all__ = [
+    "BINARY_CONTENT_TYPE",
+    "DEFLATE_ENCODING",
+    "JSON_CONTENT_TYPE",
+    "ChannelPool",
     "RabbitMQClient",
     "RabbitMQConnectionError",
     "RabbitMQConsumeError",
@@ -18,4 +31,7 @@ __all__ = [
     "RabbitMQPublishError",
     "RabbitMQSerializationError",
     "RabbitMQTimeoutError",
+    "WireFormat",
+    "decode_vacancy",
+    "encode_vacancy",
 ]
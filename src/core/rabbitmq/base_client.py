@@ -1,11 +1,16 @@
+import asyncio
+import contextlib
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Self
 
 import aio_pika
 from aio_pika import ExchangeType
 from aio_pika.abc import AbstractExchange, AbstractQueue
+from aio_pika.exceptions import ChannelNotFoundEntity
 
+from src.core.rabbitmq.channel_pool import ChannelPool
 from src.core.rabbitmq.exceptions import (
     RabbitMQConnectionError,
     RabbitMQInitializeError,
@@ -33,9 +38,20 @@ class RabbitMQClient(ABC):
         url: str,
         connection_ttl: int = 60,
         publisher_confirms: bool = True,
+        channel_pool_size: int = 1,
     ) -> None:
-        """Initialize the RabbitMQClient."""
+        """Initialize the RabbitMQClient.
+
+        Args:
+            url: RabbitMQ connection URL.
+            connection_ttl: Connection timeout in seconds.
+            publisher_confirms: Open channels in confirm mode.
+            channel_pool_size: Maximum number of publishing channels
+                opened next to the main one.
+        """
         self.publisher_confirms = publisher_confirms
+        self.channel_pool_size = channel_pool_size
+        self.channel_pool: ChannelPool | None = None
         self.url: str = url
         self.connection: AbstractRobustConnection | None = None
         self.channel: AbstractChannel | None = None
@@ -120,6 +136,56 @@ class RabbitMQClient(ABC):
                 f"Failed to declare queue: {e}"
             ) from e
 
+    async def _queue_exists(self, queue_name: str) -> bool:
+        """Check a queue with a passive declare.
+
+        A failed passive declare closes its channel, so every check
+        opens a short-lived channel of its own.
+        """
+        if self.connection is None:
+            raise RabbitMQConnectionError("Connection is not initialized")
+
+        channel = await self.connection.channel(publisher_confirms=False)
+        try:
+            await channel.declare_queue(queue_name, passive=True)
+        except ChannelNotFoundEntity:
+            return False
+        finally:
+            with contextlib.suppress(Exception):
+                await channel.close()
+        return True
+
+    async def wait_for_queue(
+        self, queue_name: str, base_delay: float, max_delay: float
+    ) -> float:
+        """Wait until a queue is declared by the service owning it.
+
+        The queue is checked right away and then with an exponential
+        backoff, so consuming starts as soon as the topology is ready.
+
+        Args:
+            queue_name: Name of the queue.
+            base_delay: Seconds before the first retry.
+            max_delay: Upper bound of the delay between retries.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        started = time.perf_counter()
+        delay = base_delay
+        while not await self._queue_exists(queue_name):
+            log.info(
+                "Queue %s is not declared yet, retrying in %.1fs",
+                queue_name,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+        waited = time.perf_counter() - started
+        log.info("Queue %s is ready after %.1fs", queue_name, waited)
+        return waited
+
     async def _create_connection(self) -> None:
         """Create connection and channel to RabbitMQ."""
         try:
@@ -144,6 +210,12 @@ class RabbitMQClient(ABC):
             log.error("Failed to connect to RabbitMQ: %s", e)
             raise RabbitMQConnectionError(f"Failed to connect: {e}") from e
 
+        self.channel_pool = ChannelPool(
+            connection=self.connection,
+            size=self.channel_pool_size,
+            publisher_confirms=self.publisher_confirms,
+        )
+
         try:
             await self._initialize()
 
@@ -157,6 +229,9 @@ class RabbitMQClient(ABC):
     async def close(self) -> None:
         """Close the connection."""
         log.debug("Closing RabbitMQ connection...")
+        if self.channel_pool is not None:
+            await self.channel_pool.close()
+
         if self.channel and not self.channel.is_closed:
             await self.channel.close()
             log.debug("Channel closed")
@@ -0,0 +1,119 @@
+import asyncio
+import contextlib
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from src.core.rabbitmq.exceptions import RabbitMQConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from aio_pika.abc import (
+        AbstractChannel,
+        AbstractExchange,
+        AbstractRobustConnection,
+    )
+
+
+log = logging.getLogger(__name__)
+
+
+class ChannelPool:
+    """Bounded pool of publishing channels over one connection.
+
+    Channels are opened lazily, up to ``size``, each in its own confirm
+    mode, so tasks holding different channels wait for their confirms
+    in parallel. A channel found closed when it is acquired is replaced
+    with a new one. Exchange handles are cached per channel.
+    """
+
+    def __init__(
+        self,
+        connection: AbstractRobustConnection,
+        size: int,
+        publisher_confirms: bool = True,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            connection: Connection the channels are opened on.
+            size: Maximum number of open channels.
+            publisher_confirms: Open channels in confirm mode.
+        """
+        self._connection = connection
+        self.size = size
+        self.publisher_confirms = publisher_confirms
+        # Free slots: an idle channel, or None if it is not opened yet.
+        self._idle: asyncio.Queue[AbstractChannel | None] = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+        self._channels: set[AbstractChannel] = set()
+        self._exchanges: dict[int, dict[str, AbstractExchange]] = {}
+
+    async def _open(self, stale: AbstractChannel | None) -> AbstractChannel:
+        """Open a channel in place of a missing or closed one."""
+        if stale is not None:
+            log.warning("Pooled channel is closed, reopening")
+            self._channels.discard(stale)
+            self._exchanges.pop(id(stale), None)
+            with contextlib.suppress(Exception):
+                await stale.close()
+
+        try:
+            channel = await self._connection.channel(
+                publisher_confirms=self.publisher_confirms,
+            )
+        except Exception as e:
+            log.error("Failed to open pooled channel: %s", e)
+            raise RabbitMQConnectionError(
+                f"Failed to open channel: {e}"
+            ) from e
+
+        self._channels.add(channel)
+        log.debug("Pooled channel opened (%d open)", len(self._channels))
+        return channel
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[AbstractChannel]:
+        """Hold a healthy channel for the duration of the block.
+
+        Waits while all ``size`` channels are in use.
+
+        Yields:
+            AbstractChannel: An open channel no other task is using.
+
+        Raises:
+            RabbitMQConnectionError: If a channel can not be opened.
+        """
+        channel = await self._idle.get()
+        try:
+            if channel is None or channel.is_closed:
+                channel = await self._open(channel)
+        except BaseException:
+            self._idle.put_nowait(None)
+            raise
+
+        try:
+            yield channel
+        finally:
+            self._idle.put_nowait(channel)
+
+    async def exchange(
+        self, channel: AbstractChannel, name: str
+    ) -> AbstractExchange:
+        """Return a cached handle of a declared exchange."""
+        exchanges = self._exchanges.setdefault(id(channel), {})
+        if name not in exchanges:
+            exchanges[name] = await channel.get_exchange(name, ensure=False)
+        return exchanges[name]
+
+    async def close(self) -> None:
+        """Close every open channel of the pool."""
+        for channel in self._channels:
+            if not channel.is_closed:
+                with contextlib.suppress(Exception):
+                    await channel.close()
+        self._channels.clear()
+        self._exchanges.clear()
+        log.debug("Channel pool closed")
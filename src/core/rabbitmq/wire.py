@@ -0,0 +1,296 @@
+"""Wire formats of vacancy messages.
+
+Vacancies are sent either as JSON or in a compact binary format. The
+binary message starts with the format version and a length-prefixed
+bitmap of present fields, followed by the values of these fields in
+``VACANCY_FIELDS`` order, so no field names are sent. Decoders ignore
+fields past the ones they know, which are always at the end. A
+message body of at least ``compress_min_bytes`` is compressed with
+zlib. The format and the compression are announced in the AMQP
+``content_type`` and ``content_encoding`` properties; a message
+without a content type is JSON, as sent by older publishers.
+"""
+
+import json
+import struct
+import zlib
+from enum import Enum
+from typing import Any, Final, Literal
+
+from src.core.rabbitmq.exceptions import RabbitMQSerializationError
+
+type WireFormat = Literal["json", "binary"]
+type Scalar = str | int | float
+
+
+class FieldKind(Enum):
+    """Encoding of a vacancy field value."""
+
+    TEXT = "text"
+    HEX = "hex"
+    TEXT_LIST = "text_list"
+    SCALAR = "scalar"
+    # A boolean sent as the presence bit only, set when true.
+    FLAG = "flag"
+
+
+JSON_CONTENT_TYPE: Final[str] = "application/json"
+BINARY_CONTENT_TYPE: Final[str] = "application/x-job-tracker-vacancy"
+DEFLATE_ENCODING: Final[str] = "deflate"
+BINARY_VERSION: Final[int] = 2
+# Version 1 had a fixed two-byte bitmap over the first 15 fields.
+LEGACY_VERSION: Final[int] = 1
+LEGACY_BITMAP_SIZE: Final[int] = 2
+
+# Field order is part of the format: new fields are only appended,
+# and a removed field keeps its slot. The bitmap grows with the fields
+# and carries its length, so appending a field needs no version bump.
+VACANCY_FIELDS: Final[tuple[tuple[str, FieldKind], ...]] = (
+    ("hash", FieldKind.HEX),
+    ("main_tag", FieldKind.TEXT),
+    ("tags", FieldKind.TEXT_LIST),
+    ("title", FieldKind.TEXT),
+    ("company", FieldKind.TEXT),
+    ("salary", FieldKind.TEXT),
+    ("experience", FieldKind.TEXT),
+    ("description", FieldKind.TEXT),
+    ("ai_score", FieldKind.SCALAR),
+    ("ai_reasons", FieldKind.TEXT),
+    ("ai_missing_skills", FieldKind.TEXT),
+    ("previous_ai_score", FieldKind.SCALAR),
+    ("link", FieldKind.TEXT),
+    ("location", FieldKind.TEXT),
+    ("date", FieldKind.TEXT),
+    ("relevance", FieldKind.SCALAR),
+    ("ai_given_up", FieldKind.FLAG),
+)
+BITMAP_SIZE: Final[int] = (len(VACANCY_FIELDS) + 7) // 8
+DOUBLE: Final[struct.Struct] = struct.Struct("<d")
+
+# Type tags of scalar values.
+INT_TAG: Final[int] = 0
+TEXT_TAG: Final[int] = 1
+FLOAT_TAG: Final[int] = 2
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 integer."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_bytes(out: bytearray, value: bytes) -> None:
+    """Append length-prefixed bytes."""
+    _write_varint(out, len(value))
+    out += value
+
+
+def _write_scalar(out: bytearray, value: Scalar) -> None:
+    """Append a tagged integer, float or string."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        out.append(TEXT_TAG)
+        _write_bytes(out, str(value).encode("utf-8"))
+    elif isinstance(value, int):
+        out.append(INT_TAG)
+        # Zigzag keeps small negative numbers short.
+        _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+    else:
+        out.append(FLOAT_TAG)
+        out += DOUBLE.pack(value)
+
+
+def _write_value(out: bytearray, kind: FieldKind, value: Any) -> None:  # noqa: ANN401
+    """Append a field value of the given kind."""
+    if kind is FieldKind.HEX:
+        _write_bytes(out, bytes.fromhex(value))
+    elif kind is FieldKind.TEXT_LIST:
+        _write_varint(out, len(value))
+        for item in value:
+            _write_bytes(out, str(item).encode("utf-8"))
+    elif kind is FieldKind.SCALAR:
+        _write_scalar(out, value)
+    else:
+        _write_bytes(out, str(value).encode("utf-8"))
+
+
+class _Reader:
+    """Sequential reader of a binary message."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = memoryview(data)
+        self._offset = 0
+
+    def byte(self) -> int:
+        value = self._data[self._offset]
+        self._offset += 1
+        return value
+
+    def take(self, size: int) -> bytes:
+        end = self._offset + size
+        if end > len(self._data):
+            raise ValueError("Truncated message")
+        value = self._data[self._offset : end].tobytes()
+        self._offset = end
+        return value
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.byte()
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def text(self) -> str:
+        return self.take(self.varint()).decode("utf-8")
+
+    def scalar(self) -> Scalar:
+        tag = self.byte()
+        if tag == INT_TAG:
+            zigzag = self.varint()
+            return zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+        if tag == FLOAT_TAG:
+            value: float = DOUBLE.unpack(self.take(DOUBLE.size))[0]
+            return value
+        if tag == TEXT_TAG:
+            return self.text()
+        raise ValueError(f"Unknown scalar tag: {tag}")
+
+    def value(self, kind: FieldKind) -> Any:  # noqa: ANN401
+        if kind is FieldKind.FLAG:
+            return True
+        if kind is FieldKind.HEX:
+            return self.take(self.varint()).hex()
+        if kind is FieldKind.TEXT_LIST:
+            return [self.text() for _ in range(self.varint())]
+        if kind is FieldKind.SCALAR:
+            return self.scalar()
+        return self.text()
+
+
+def encode_binary(data: dict[str, Any]) -> bytes:
+    """Encode vacancy fields in the binary format."""
+    bitmap = 0
+    values = bytearray()
+    for index, (name, kind) in enumerate(VACANCY_FIELDS):
+        value = data.get(name)
+        if value is None or (kind is FieldKind.FLAG and not value):
+            continue
+        bitmap |= 1 << index
+        if kind is not FieldKind.FLAG:
+            _write_value(values, kind, value)
+
+    out = bytearray([BINARY_VERSION])
+    _write_bytes(out, bitmap.to_bytes(BITMAP_SIZE, "little"))
+    return bytes(out + values)
+
+
+def decode_binary(body: bytes) -> dict[str, Any]:
+    """Decode vacancy fields from the binary format.
+
+    Fields missing from the message are None, as in JSON messages.
+    Values of fields appended by a newer publisher follow the known
+    ones and are left unread.
+    """
+    reader = _Reader(body)
+    version = reader.byte()
+    if version == BINARY_VERSION:
+        bitmap_size = reader.varint()
+    elif version == LEGACY_VERSION:
+        bitmap_size = LEGACY_BITMAP_SIZE
+    else:
+        raise ValueError(f"Unsupported binary version: {version}")
+
+    bitmap = int.from_bytes(reader.take(bitmap_size), "little")
+    return {
+        name: reader.value(kind)
+        if bitmap >> index & 1
+        else (False if kind is FieldKind.FLAG else None)
+        for index, (name, kind) in enumerate(VACANCY_FIELDS)
+    }
+
+
+def encode_vacancy(
+    data: dict[str, Any],
+    wire_format: WireFormat,
+    compress_min_bytes: int = 0,
+) -> tuple[bytes, str, str | None]:
+    """Encode vacancy fields for a message.
+
+    Args:
+        data: Vacancy fields as produced by ``VacancyEntity.to_dict``.
+        wire_format: Message format.
+        compress_min_bytes: Compress bodies of at least this size;
+            0 disables compression.
+
+    Returns:
+        tuple[bytes, str, str | None]: Message body, content type and
+            content encoding.
+    """
+    if wire_format == "binary":
+        body, content_type = encode_binary(data), BINARY_CONTENT_TYPE
+    else:
+        body = json.dumps(data).encode("utf-8")
+        content_type = JSON_CONTENT_TYPE
+
+    if 0 < compress_min_bytes <= len(body):
+        compressed = zlib.compress(body)
+        if len(compressed) < len(body):
+            return compressed, content_type, DEFLATE_ENCODING
+    return body, content_type, None
+
+
+def _decode(
+    body: bytes, content_type: str | None, content_encoding: str | None
+) -> dict[str, Any]:
+    """Decode vacancy fields, raising ValueError on a bad message."""
+    if content_encoding == DEFLATE_ENCODING:
+        body = zlib.decompress(body)
+    elif content_encoding:
+        raise ValueError(f"Unsupported encoding: {content_encoding}")
+
+    if content_type == BINARY_CONTENT_TYPE:
+        return decode_binary(body)
+    if content_type in {None, "", JSON_CONTENT_TYPE}:
+        data: dict[str, Any] = json.loads(body)
+        return data
+    raise ValueError(f"Unsupported content type: {content_type}")
+
+
+def decode_vacancy(
+    body: bytes,
+    content_type: str | None = None,
+    content_encoding: str | None = None,
+) -> dict[str, Any]:
+    """Decode vacancy fields of a message in any supported format.
+
+    Args:
+        body: Message body.
+        content_type: AMQP content type; JSON if missing.
+        content_encoding: AMQP content encoding; plain if missing.
+
+    Returns:
+        dict[str, Any]: Vacancy fields.
+
+    Raises:
+        RabbitMQSerializationError: If the message can not be decoded.
+    """
+    try:
+        return _decode(body, content_type, content_encoding)
+    except (ValueError, IndexError, zlib.error) as e:
+        raise RabbitMQSerializationError(
+            f"Failed to decode vacancy message: {e}"
+        ) from e
+
+
+__all__ = (
+    "BINARY_CONTENT_TYPE",
+    "DEFLATE_ENCODING",
+    "JSON_CONTENT_TYPE",
+    "WireFormat",
+    "decode_vacancy",
+    "encode_vacancy",
+)
@@ -0,0 +1,3 @@
+from .main import run_analyst
+
+__all__ = ["run_analyst"]
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Literal
+
+from src.core.rabbitmq import (
+    RabbitMQClient,
+    RabbitMQInitializeError,
+    decode_vacancy,
+)
+from src.services.scrapper.ai_analyst.analyst import ResumeRegistry
+from src.services.scrapper.ai_analyst.base import is_failed
+from src.services.scrapper.entity import VacancyEntity
+from src.services.scrapper.messaging.rabbitmq import RESUME_DIGEST_HEADER
+
+if TYPE_CHECKING:
+    from aio_pika.abc import AbstractIncomingMessage, AbstractQueue
+
+    from src.core.conf import (
+        RabbitMQAnalystConfig,
+        RabbitMQSettings,
+        SourceSettings,
+    )
+    from src.services.scrapper.ai_analyst.base import IVacancyScorer
+    from src.services.scrapper.ai_analyst.inputs import ScoringInputStore
+    from src.services.scrapper.ai_analyst.retry import RescoreQueue
+    from src.services.scrapper.messaging import IMessageSender
+    from src.services.scrapper.repositories import IRepository
+
+
+log = logging.getLogger(__name__)
+
+
+class AnalysisConsumer(RabbitMQClient):
+    """Scores vacancies from the analysis queue and publishes them.
+
+    Up to ``prefetch_count`` messages are delivered unacknowledged and
+    scored concurrently, so the prefetch is the worker's concurrency
+    limit. A message is acknowledged only after the scored vacancy is
+    published to the vacancy queue, or parked in the retry queue when
+    scoring failed.
+    """
+
+    def __init__(
+        self,
+        rabbitmq_settings: RabbitMQSettings,
+        analyst_config: RabbitMQAnalystConfig,
+        ai_analyst: IVacancyScorer,
+        mq_publisher: IMessageSender,
+        repository: IRepository,
+        sources: list[SourceSettings],
+        prefetch_count: int,
+        rescore_queue: RescoreQueue | None = None,
+        retry_mode: Literal["gate", "publish"] = "gate",
+        scoring_inputs: ScoringInputStore | None = None,
+    ) -> None:
+        """Initialize the AnalysisConsumer."""
+        super().__init__(
+            url=rabbitmq_settings.url,
+            connection_ttl=rabbitmq_settings.connection_ttl,
+            publisher_confirms=False,
+        )
+        self.analyst_config = analyst_config
+        self.ai_analyst = ai_analyst
+        self._mq_publisher = mq_publisher
+        self._repository = repository
+        self._resumes = ResumeRegistry(sources)
+        self.prefetch_count = prefetch_count
+        self._rescore_queue = rescore_queue
+        self.retry_mode = retry_mode
+        self._scoring_inputs = scoring_inputs
+
+    async def _initialize(self) -> None:
+        """Initialize RabbitMQ infrastructure."""
+        if self.channel is None:
+            raise RabbitMQInitializeError("Channel is not initialized")
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
+
+    async def _defer(
+        self, vacancy: VacancyEntity, resume_digest: str, error: str
+    ) -> bool:
+        """Park a vacancy whose scoring failed for a later retry.
+
+        The scrapper saved the vacancy before queueing it, so only the
+        retry queue entry is added. Without a retry queue, or in the
+        "publish" mode, the vacancy is published unscored first.
+
+        Returns:
+            bool: False if the unscored vacancy could not be published.
+        """
+        published = self._rescore_queue is None or self.retry_mode == "publish"
+        # Without a retry queue the vacancy is never scored.
+        vacancy.ai_given_up = self._rescore_queue is None
+        if published and not await self._mq_publisher.send_message(
+            vacancy=vacancy
+        ):
+            return False
+
+        if self._rescore_queue is not None:
+            await self._rescore_queue.park(
+                vacancy=vacancy,
+                resume_digest=resume_digest,
+                published=published,
+                error=error,
+            )
+        return True
+
+    async def _score(self, message: AbstractIncomingMessage) -> None:
+        """Score one vacancy and publish it to the vacancy queue."""
+        resume_digest = str(message.headers.get(RESUME_DIGEST_HEADER))
+        vacancy = VacancyEntity.from_dict(
+            decode_vacancy(
+                message.body, message.content_type, message.content_encoding
+            )
+        )
+        resume = self._resumes.get(resume_digest)
+        if resume is None:
+            # The resume was edited after the vacancy was queued, so
+            # the score can never be computed; the vacancy is
+            # delivered as not scored.
+            log.error("Unknown resume digest: %s", resume_digest)
+            scored = False
+            vacancy.ai_given_up = True
+            sent = await self._mq_publisher.send_message(vacancy=vacancy)
+        else:
+            result = await self.ai_analyst.analyze_score(
+                vacancy_text=vacancy.description, resume=resume
+            )
+            vacancy.apply_ai_result(result)
+            scored = not is_failed(result)
+            if scored:
+                sent = await self._mq_publisher.send_message(vacancy=vacancy)
+            else:
+                sent = await self._defer(
+                    vacancy, resume_digest, result["error"]
+                )
+
+        if sent:
+            await self._repository.update_ai_results(vacancy=vacancy)
+            if self._scoring_inputs is not None and scored:
+                await self._scoring_inputs.set_score(
+                    vacancy_hash=vacancy.hash,
+                    resume_digest=resume_digest,
+                    score=vacancy.ai_score,
+                )
+            await message.ack()
+            log.info("Vacancy processed: %s", vacancy.hash)
+        else:
+            log.error("Failed to publish vacancy: %s", vacancy)
+            await message.nack(requeue=True)
+
+    async def _process(self, message: AbstractIncomingMessage) -> None:
+        """Handle a message, dead-lettering it on unexpected errors."""
+        try:
+            await self._score(message)
+        except asyncio.CancelledError:
+            await message.nack(requeue=True)
+            raise
+        except Exception as exc:  # noqa: BLE001
+            log.error("Failed to score vacancy message: %s", exc)
+            await message.reject()
+
+    async def consume(self) -> None:
+        """Consume the analysis queue until cancelled."""
+        if self.channel is None:
+            raise RabbitMQInitializeError("Channel is not initialized")
+
+        queue_config = self.analyst_config.analysis_queue
+        queue: AbstractQueue = await self._declare_queue(
+            queue_name=queue_config.name,
+            exchange_name=queue_config.exchange_name,
+            routing_key=queue_config.routing_key,
+            channel=self.channel,
+            queue_timeout=queue_config.timeout,
+            arguments=queue_config.arguments,
+        )
+        log.info(
+            "Started consuming queue %s with prefetch %d",
+            queue.name,
+            self.prefetch_count,
+        )
+
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            async with queue.iterator() as queue_iter:
+                async for message in queue_iter:
+                    task = asyncio.create_task(self._process(message))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+__all__ = ("AnalysisConsumer",)
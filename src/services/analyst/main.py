@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Final
+
+from src.core.conf import DatabaseSettings
+from src.core.database import DB_MANAGER
+from src.services.scrapper.ai_analyst.analyst import ResumeRegistry
+from src.services.scrapper.main import (
+    make_ai_analyst,
+    make_rescore_queue,
+    make_score_cache,
+    make_scoring_inputs,
+)
+from src.services.scrapper.messaging.rabbitmq import MQPublisher
+from src.services.scrapper.scheduler import ParseScheduler
+from src.services.scrapper.tasks.make import (
+    make_ai_stats_task,
+    make_repository,
+    make_rescore_task,
+    make_resume_rescore_task,
+    make_score_cache_task,
+)
+
+from .consumer import AnalysisConsumer
+
+if TYPE_CHECKING:
+    from src.core.conf import (
+        RabbitMQAnalystConfig,
+        RabbitMQPublisherConfig,
+        RabbitMQSettings,
+        ScrapperSettings,
+    )
+
+
+log = logging.getLogger(__name__)
+
+OFFSET_SECONDS: Final[int] = 5
+
+
+async def main(
+    settings: ScrapperSettings,
+    rabbitmq_settings: RabbitMQSettings,
+    publisher_settings: RabbitMQPublisherConfig,
+    analyst_config: RabbitMQAnalystConfig,
+) -> None:
+    """Run the AI analyst worker.
+
+    Consumes unscored vacancies from the analysis queue, scores them
+    and publishes them to the vacancy queue. Several workers may
+    consume the same queue.
+
+    Args:
+        settings: Scrapper settings with the AI analyst and sources.
+        rabbitmq_settings: RabbitMQ connection settings.
+        publisher_settings: RabbitMQ publisher topology configuration.
+        analyst_config: Analysis queue configuration.
+    """
+    score_cache = make_score_cache(settings.ai_analyst)
+    ai_analyst = make_ai_analyst(settings.ai_analyst, cache=score_cache)
+    rescore_queue = make_rescore_queue(settings.ai_analyst)
+    scoring_inputs = make_scoring_inputs(settings.ai_analyst)
+    db_settings = DatabaseSettings()  # pyright: ignore[reportCallIssue]
+    repository = make_repository(db_settings=db_settings)
+
+    scheduler = ParseScheduler(settings=settings.scheduler)
+    scheduler.add_job(
+        job_id="ai_stats",
+        func=make_ai_stats_task(ai_analyst=ai_analyst).run,
+        interval_minutes=settings.ai_analyst.stats_interval_minutes,
+        stagger_first_run=True,
+        offset_seconds=0,
+    )
+    if score_cache is not None:
+        scheduler.add_job(
+            job_id="score_cache",
+            func=make_score_cache_task(cache=score_cache).run,
+            interval_minutes=settings.ai_analyst.cache_evict_interval_minutes,
+            stagger_first_run=True,
+            offset_seconds=OFFSET_SECONDS,
+        )
+
+    # The publisher declares the topology the consumer binds to.
+    async with (
+        MQPublisher(
+            rabbitmq_settings=rabbitmq_settings,
+            publisher_settings=publisher_settings,
+        ) as mq_publisher,
+        AnalysisConsumer(
+            rabbitmq_settings=rabbitmq_settings,
+            analyst_config=analyst_config,
+            ai_analyst=ai_analyst,
+            mq_publisher=mq_publisher,
+            repository=repository,
+            sources=settings.sources,
+            prefetch_count=settings.ai_analyst.worker_prefetch,
+            rescore_queue=rescore_queue,
+            retry_mode=settings.ai_analyst.retry_mode,
+            scoring_inputs=scoring_inputs,
+        ) as consumer,
+    ):
+        if rescore_queue is not None:
+            scheduler.add_job(
+                job_id="rescore",
+                func=make_rescore_task(
+                    queue=rescore_queue,
+                    ai_analyst=ai_analyst,
+                    mq_publisher=mq_publisher,
+                    repository=repository,
+                    resumes=ResumeRegistry(settings.sources),
+                    ai_settings=settings.ai_analyst,
+                    scoring_inputs=scoring_inputs,
+                ).run,
+                interval_minutes=settings.ai_analyst.retry_interval_minutes,
+                stagger_first_run=True,
+                offset_seconds=2 * OFFSET_SECONDS,
+            )
+        if scoring_inputs is not None:
+            for idx, source in enumerate(settings.sources):
+                scheduler.add_job(
+                    job_id=f"resume_rescore_{source.key}",
+                    func=make_resume_rescore_task(
+                        source_settings=source,
+                        scoring_inputs=scoring_inputs,
+                        ai_analyst=ai_analyst,
+                        mq_publisher=mq_publisher,
+                        repository=repository,
+                        ai_settings=settings.ai_analyst,
+                        db_settings=db_settings,
+                    ).run,
+                    interval_minutes=(
+                        settings.ai_analyst.resume_rescore_interval_minutes
+                    ),
+                    stagger_first_run=True,
+                    offset_seconds=(3 + idx) * OFFSET_SECONDS,
+                )
+        scheduler.start()
+        try:
+            await consumer.consume()
+        finally:
+            log.info("Shutting down scheduler")
+            scheduler.shutdown()
+            log.info("Closing repository")
+            await repository.close()
+            log.info("Disposing database engine")
+            await DB_MANAGER.dispose_engine()
+            log.info("Analyst worker stopped")
+
+
+def run_analyst(
+    settings: ScrapperSettings,
+    rabbitmq_settings: RabbitMQSettings,
+    publisher_settings: RabbitMQPublisherConfig,
+    analyst_config: RabbitMQAnalystConfig,
+) -> None:
+    """Entry point for running the AI analyst worker.
+
+    Args:
+        settings: Scrapper settings with the AI analyst and sources.
+        rabbitmq_settings: RabbitMQ connection settings.
+        publisher_settings: RabbitMQ publisher topology configuration.
+        analyst_config: Analysis queue configuration.
+    """
+    log.info("Start analyst worker ...")
+    asyncio.run(
+        main(
+            settings=settings,
+            rabbitmq_settings=rabbitmq_settings,
+            publisher_settings=publisher_settings,
+            analyst_config=analyst_config,
+        )
+    )
+    log.info("Stop analyst worker")
@@ -1,3 +1,34 @@
-from .analyst import VacancyAIAnalyst
+from .analyst import (
+    ResumePrompt,
+    ResumeRegistry,
+    ScoringStats,
+    VacancyAIAnalyst,
+)
+from .base import IVacancyScorer
+from .cache import ScoreCache, ScoreCacheKey
+from .embedding import EmbeddingScorer
+from .feedback import FeedbackLog, FeedbackSample
+from .inputs import ScoringInputStore
+from .prefilter import RelevancePrefilter
+from .ranker import FeedbackRanker
+from .retry import RescoreQueue
+from .router import BackendRouter, LLMBackend
 
-__all__ = ("VacancyAIAnalyst",)
+__all__ = (
+    "BackendRouter",
+    "EmbeddingScorer",
+    "FeedbackLog",
+    "FeedbackRanker",
+    "FeedbackSample",
+    "IVacancyScorer",
+    "LLMBackend",
+    "RelevancePrefilter",
+    "RescoreQueue",
+    "ResumePrompt",
+    "ResumeRegistry",
+    "ScoreCache",
+    "ScoreCacheKey",
+    "ScoringInputStore",
+    "ScoringStats",
+    "VacancyAIAnalyst",
+)
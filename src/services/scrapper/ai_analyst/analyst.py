@@ -1,74 +1,516 @@
+import asyncio
 import json
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
 
-import openai
+from .base import IVacancyScorer, failed_result
+from .cache import ScoreCacheKey, digest
+from .streaming import JsonValueScanner
 
 if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
     from openai.types.chat.chat_completion import ChatCompletion
+    from openai.types.completion_usage import CompletionUsage
+
+    from src.core.conf import SourceSettings
+
+    from .cache import ScoreCache
+    from .router import BackendRouter, LLMBackend
 
 log = logging.getLogger(__name__)
 
+# Bump whenever the prompt changes so cached scores are not reused.
+PROMPT_VERSION: Final[int] = 2
+
+# The instructions and the resume form the system message, which is
+# byte-identical for every vacancy of a source. Per-vacancy text goes
+# last, in the user message, so servers can reuse the cached prefix.
+SCORE_INSTRUCTIONS: Final[str] = (
+    "Ты профессиональный HR-аналитик и эксперт по найму в IT. "
+    "Твоя задача — сравнить резюме кандидата с текстом вакансии.\n"  # noqa: RUF001
+    "Верни ответ строго в формате JSON со следующими полями:\n"  # noqa: RUF001
+    "- score: число от 0 до 100 (насколько кандидат подходит).\n"
+    "- main_reasons: Ключевая причина такой оценки, опыт работы не учитывай, максимольно до 100 символов.\n"  # noqa: E501
+    "- missing_skills: список навыков из вакансии, которых нет в резюме, нужно перечисление стека через запятую, максимольно до 100 символов.\n"  # noqa: E501
+    "Отвечай ТОЛЬКО валидным JSON. "
+    "Не используй markdown, не оборачивай ответ в ```json ... ```. "  # noqa: RUF001
+    "Первый символ ответа должен быть '{', последний — '}'.\n\n"
+    "РЕЗЮМЕ КАНДИДАТА:\n"
+)
+BATCH_INSTRUCTIONS: Final[str] = (
+    "Ты профессиональный HR-аналитик и эксперт по найму в IT. "
+    "Твоя задача — сравнить резюме кандидата с каждой из вакансий. "  # noqa: RUF001
+    "Вакансии передаются JSON-массивом объектов с полями id и text.\n"  # noqa: RUF001
+    "Верни ответ строго в формате JSON-массива, по одному объекту на каждую вакансию, со следующими полями:\n"  # noqa: RUF001, E501
+    "- id: id вакансии из запроса.\n"
+    "- score: число от 0 до 100 (насколько кандидат подходит).\n"
+    "- main_reasons: Ключевая причина такой оценки, опыт работы не учитывай, максимольно до 100 символов.\n"  # noqa: E501
+    "- missing_skills: список навыков из вакансии, которых нет в резюме, нужно перечисление стека через запятую, максимольно до 100 символов.\n"  # noqa: E501
+    "Отвечай ТОЛЬКО валидным JSON. "
+    "Не используй markdown, не оборачивай ответ в ```json ... ```. "  # noqa: RUF001
+    "Первый символ ответа должен быть '[', последний — ']'.\n\n"
+    "РЕЗЮМЕ КАНДИДАТА:\n"
+)
+RESULT_FIELDS: Final[tuple[str, ...]] = (
+    "score",
+    "main_reasons",
+    "missing_skills",
+)
+
+
+@dataclass(slots=True)
+class ScoringStats:
+    """Token usage and latency totals of scoring requests."""
 
-class VacancyAIAnalyst:
-    """AI Analyst for Vacancy."""
+    requests: int = 0
+    vacancies: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    seconds: float = 0.0
+    first_token_seconds: float = 0.0
+    streamed_chunks: int = 0
+    early_stops: int = 0
 
-    def __init__(self, base_url: str, api_key: str, model: str) -> None:
-        """Initialize the AI Analyst."""
-        self._client = openai.AsyncOpenAI(
-            api_key=api_key,
-            base_url=base_url,
+    def record(
+        self, usage: CompletionUsage | None, vacancies: int, seconds: float
+    ) -> None:
+        """Add a completed request to the totals.
+
+        Streams cancelled early carry no usage, so only their latency
+        is counted.
+        """
+        self.requests += 1
+        self.vacancies += vacancies
+        self.seconds += seconds
+        if usage is None:
+            return
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        if usage.prompt_tokens_details is not None:
+            self.cached_tokens += (
+                usage.prompt_tokens_details.cached_tokens or 0
+            )
+        log.debug(
+            "Scored %d vacancies in %.2fs: %d prompt (%s cached), "
+            "%d completion tokens",
+            vacancies,
+            seconds,
+            usage.prompt_tokens,
+            usage.prompt_tokens_details
+            and usage.prompt_tokens_details.cached_tokens,
+            usage.completion_tokens,
         )
+
+    def per_vacancy(self) -> dict[str, float]:
+        """Return average tokens and latency per scored vacancy."""
+        count = self.vacancies or 1
+        return {
+            "prompt_tokens": round(self.prompt_tokens / count, 1),
+            "completion_tokens": round(self.completion_tokens / count, 1),
+            "cached_tokens": round(self.cached_tokens / count, 1),
+            "streamed_chunks": round(self.streamed_chunks / count, 1),
+            "seconds": round(self.seconds / count, 3),
+            "first_token_seconds": round(
+                self.first_token_seconds / (self.requests or 1), 3
+            ),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ResumePrompt:
+    """Prompt prefixes for one resume, built once per polling task.
+
+    Attributes:
+        text: Resume text.
+        digest: Digest of the resume text, part of the cache key.
+        single: System message for scoring one vacancy.
+        batch: System message for scoring a batch of vacancies.
+    """
+
+    text: str
+    digest: str
+    single: str
+    batch: str
+
+    @classmethod
+    def build(cls, resume_text: str) -> ResumePrompt:
+        """Build the prompt prefixes for a resume."""
+        return cls(
+            text=resume_text,
+            digest=digest(resume_text),
+            single=SCORE_INSTRUCTIONS + resume_text,
+            batch=BATCH_INSTRUCTIONS + resume_text,
+        )
+
+
+class ResumeRegistry:
+    """Resume prompts of the configured sources, keyed by digest.
+
+    Used where a vacancy carries only the digest of its resume, e.g.
+    queued or deferred scorings.
+    """
+
+    def __init__(self, sources: list[SourceSettings]) -> None:
+        """Initialize the registry and read the resumes."""
+        self._sources = sources
+        self._prompts: dict[str, ResumePrompt] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Build prompts for every source resume."""
+        prompts = [
+            ResumePrompt.build(source.resume_text) for source in self._sources
+        ]
+        self._prompts = {prompt.digest: prompt for prompt in prompts}
+
+    def get(self, resume_digest: str) -> ResumePrompt | None:
+        """Return the resume of a digest, re-reading changed files."""
+        if resume_digest not in self._prompts:
+            self._load()
+        return self._prompts.get(resume_digest)
+
+
+class VacancyAIAnalyst(IVacancyScorer):
+    """AI Analyst for Vacancy.
+
+    A single instance is shared by all polling tasks, so its semaphore
+    bounds the number of in-flight LLM requests process-wide.
+    """
+
+    def __init__(
+        self,
+        router: BackendRouter,
+        model: str,
+        max_concurrency: int = 4,
+        cache: ScoreCache | None = None,
+        batch_size: int = 1,
+        stream: bool = False,
+    ) -> None:
+        """Initialize the AI Analyst.
+
+        Args:
+            router: Router spreading requests over LLM backends.
+            model: Logical model name, part of the score cache key.
+            max_concurrency: Maximum number of concurrent requests.
+            cache: Persistent score cache, or None to always call
+                the model.
+            batch_size: Vacancies scored per request by
+                ``analyze_many``; 1 sends one request per vacancy.
+            stream: Whether to stream completions and stop reading as
+                soon as the JSON answer is complete.
+        """
+        self._router = router
         self._model = model
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache = cache
+        self.batch_size = batch_size
+        self.stream = stream
+        self.single_stats = ScoringStats()
+        self.batch_stats = ScoringStats()
         log.info("AI Analyst initialized")
 
+    def _cache_key(
+        self, vacancy_text: str, resume: ResumePrompt
+    ) -> ScoreCacheKey:
+        """Build the cache key of a vacancy score."""
+        return ScoreCacheKey(
+            fingerprint=digest(vacancy_text),
+            resume_digest=resume.digest,
+            model=self._model,
+            prompt_version=PROMPT_VERSION,
+        )
+
+    async def _cached(
+        self, vacancy_text: str, resume: ResumePrompt
+    ) -> dict[str, Any] | None:
+        """Return a cached score, or None when it must be requested."""
+        if self._cache is None:
+            return None
+        return await self._cache.get(self._cache_key(vacancy_text, resume))
+
+    async def _store(
+        self, vacancy_text: str, resume: ResumePrompt, result: dict[str, Any]
+    ) -> None:
+        """Put a successful score into the cache."""
+        if self._cache is not None:
+            await self._cache.put(
+                self._cache_key(vacancy_text, resume), result
+            )
+
+    async def _complete(
+        self,
+        system_prompt: str,
+        prompt: str,
+        stats: ScoringStats,
+        vacancies: int,
+    ) -> str:
+        """Send a prompt to the model and return the answer text."""
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+        if self.stream:
+            return await self._router.call(
+                lambda backend: self._complete_stream(
+                    backend, messages, stats, vacancies
+                )
+            )
+        return await self._router.call(
+            lambda backend: self._complete_once(
+                backend, messages, stats, vacancies
+            )
+        )
+
+    async def _complete_once(
+        self,
+        backend: LLMBackend,
+        messages: list[ChatCompletionMessageParam],
+        stats: ScoringStats,
+        vacancies: int,
+    ) -> str:
+        """Request a whole completion from a backend."""
+        started = time.perf_counter()
+        client = backend.client
+        response: ChatCompletion = await client.chat.completions.create(
+            model=backend.model,
+            messages=messages,
+            n=1,
+            # response_format={"type": "json_object"},  # noqa: E501, ERA001, W505
+            temperature=0.0,
+        )
+        stats.record(
+            response.usage,
+            vacancies=vacancies,
+            seconds=time.perf_counter() - started,
+        )
+
+        content: str | None = response.choices[0].message.content
+        if content is None:
+            raise ValueError("Model returned empty response")
+        return content
+
+    async def _complete_stream(
+        self,
+        backend: LLMBackend,
+        messages: list[ChatCompletionMessageParam],
+        stats: ScoringStats,
+        vacancies: int,
+    ) -> str:
+        """Stream a completion until its JSON answer is complete.
+
+        The stream is closed as soon as the top-level JSON value ends,
+        so trailing text the model would emit is never generated.
+        """
+        started = time.perf_counter()
+        stream = await backend.client.chat.completions.create(
+            model=backend.model,
+            messages=messages,
+            n=1,
+            temperature=0.0,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        scanner = JsonValueScanner()
+        answer: str | None = None
+        usage: CompletionUsage | None = None
+        chunks = 0
+        try:
+            async for chunk in stream:
+                usage = chunk.usage or usage
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                if not chunks:
+                    stats.first_token_seconds += time.perf_counter() - started
+                chunks += 1
+                answer = scanner.feed(chunk.choices[0].delta.content)
+                if answer is not None:
+                    break
+        finally:
+            await stream.close()
+
+        stats.streamed_chunks += chunks
+        stats.record(
+            usage, vacancies=vacancies, seconds=time.perf_counter() - started
+        )
+        if answer is None:
+            raise ValueError("Stream ended without a complete JSON answer")
+        if usage is None:
+            stats.early_stops += 1
+        return answer
+
+    def backend_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-backend latency and error statistics."""
+        return self._router.snapshot()
+
     async def analyze_score(
-        self, vacancy_text: str, resume_text: str
+        self, vacancy_text: str, resume: ResumePrompt
     ) -> dict[str, Any]:
-        """Analyze vacancy match with resume text."""
-        prompt = f"""
-        Ты — эксперт по найму в IT. Твоя задача — сравнить резюме кандидата с текстом вакансии.
+        """Analyze vacancy match with the resume.
 
-        РЕЗЮМЕ КАНДИДАТА:
-        {resume_text}
+        Scores are served from the cache when one is configured. Failed
+        requests return a failed result, which is not cached.
+        """
+        cached = await self._cached(vacancy_text, resume)
+        if cached is not None:
+            return cached
+        return await self._score_single(vacancy_text, resume)
 
-        ТЕКСТ ВАКАНСИИ:
-        {vacancy_text}
+    async def analyze_many(
+        self, vacancy_texts: list[str], resume: ResumePrompt
+    ) -> list[dict[str, Any]]:
+        """Analyze several vacancies, batching them into shared prompts.
 
-        Верни ответ строго в формате JSON со следующими полями:
-        - score: число от 0 до 100 (насколько кандидат подходит).
-        - main_reasons: Ключевая причина такой оценки, опыт работы не учитывай, максимольно до 100 символов.
-        - missing_skills: список навыков из вакансии, которых нет в резюме, нужно перечисление стека через запятую, максимольно до 100 символов.
-        """  # noqa: E501, RUF001
+        Each request scores up to ``batch_size`` vacancies. Entries the
+        model omits or returns malformed are re-scored one by one.
 
-        try:
-            response: ChatCompletion = await self._client.chat.completions.create(  # noqa: E501
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Ты профессиональный HR-аналитик. "
-                            "Отвечай ТОЛЬКО валидным JSON. "
-                            "Не используй markdown, не оборачивай ответ в ```json ... ```. "  # noqa: E501, RUF001
-                            "Первый символ ответа должен быть '{', последний — '}'."  # noqa: E501
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                n=1,
-                # response_format={"type": "json_object"},  # noqa: E501, ERA001, W505
-                temperature=0.0,
+        Returns:
+            list[dict[str, Any]]: Scores in the order of
+                ``vacancy_texts``.
+        """
+        if self.batch_size <= 1:
+            return await asyncio.gather(
+                *(
+                    self.analyze_score(vacancy_text=text, resume=resume)
+                    for text in vacancy_texts
+                )
+            )
+
+        results: list[dict[str, Any]] = [{} for _ in vacancy_texts]
+        pending: list[int] = []
+        for index, text in enumerate(vacancy_texts):
+            cached = await self._cached(text, resume)
+            if cached is None:
+                pending.append(index)
+            else:
+                results[index] = cached
+
+        batches: list[list[int]] = [
+            pending[start : start + self.batch_size]
+            for start in range(0, len(pending), self.batch_size)
+        ]
+        await asyncio.gather(
+            *(
+                self._score_batch(batch, vacancy_texts, resume, results)
+                for batch in batches
             )
+        )
+        return results
+
+    async def _score_single(
+        self, vacancy_text: str, resume: ResumePrompt
+    ) -> dict[str, Any]:
+        """Request a single score, or a failed result on error."""
+        async with self._semaphore:
+            try:
+                result = await self._request_score(
+                    vacancy_text=vacancy_text, resume=resume
+                )
+            except Exception as e:  # noqa: BLE001
+                log.error("AI Analysis error: %s", e)
+
+                return failed_result(e)
+
+        await self._store(vacancy_text, resume, result)
+        return result
+
+    async def _score_batch(
+        self,
+        batch: list[int],
+        vacancy_texts: list[str],
+        resume: ResumePrompt,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Score a batch in place, retrying bad entries one by one."""
+        async with self._semaphore:
+            try:
+                scored = await self._request_batch(
+                    vacancy_texts=[vacancy_texts[index] for index in batch],
+                    resume=resume,
+                )
+            except Exception as e:  # noqa: BLE001
+                log.error("AI batch analysis error: %s", e)
+                scored = {}
+
+        retry: list[int] = []
+        for position, index in enumerate(batch):
+            result = scored.get(position)
+            if result is None:
+                retry.append(index)
+                continue
+            results[index] = result
+            await self._store(vacancy_texts[index], resume, result)
+
+        if retry:
+            log.warning(
+                "Batch returned %d of %d scores, retrying the rest",
+                len(batch) - len(retry),
+                len(batch),
+            )
+            retried = await asyncio.gather(
+                *(
+                    self._score_single(vacancy_texts[index], resume)
+                    for index in retry
+                )
+            )
+            for index, result in zip(retry, retried, strict=True):
+                results[index] = result
+
+    async def _request_score(
+        self, vacancy_text: str, resume: ResumePrompt
+    ) -> dict[str, Any]:
+        """Request a score from the model and parse the JSON answer."""
+        prompt = f"ТЕКСТ ВАКАНСИИ:\n{vacancy_text}"  # noqa: RUF001
 
-            content: str | None = response.choices[0].message.content
-            if content is None:
-                raise ValueError("Model returned empty response")
+        content = await self._complete(
+            resume.single, prompt, stats=self.single_stats, vacancies=1
+        )
+        jnon_content: dict[str, Any] = json.loads(content)
+        if not isinstance(jnon_content, dict) or "score" not in jnon_content:
+            raise ValueError("Model answer has no score")
+        return jnon_content
+
+    async def _request_batch(
+        self, vacancy_texts: list[str], resume: ResumePrompt
+    ) -> dict[int, dict[str, Any]]:
+        """Request scores for several vacancies in one prompt.
 
-            jnon_content: dict[str, Any] = json.loads(content)
-            return jnon_content
+        Returns:
+            dict[int, dict[str, Any]]: Well-formed scores keyed by the
+                position of the vacancy in ``vacancy_texts``.
+        """
+        vacancies = json.dumps(
+            [
+                {"id": position, "text": text}
+                for position, text in enumerate(vacancy_texts)
+            ],
+            ensure_ascii=False,
+        )
+        prompt = f"ВАКАНСИИ:\n{vacancies}"
 
-        except Exception as e:  # noqa: BLE001
-            log.error("AI Analysis error: %s", e)
+        content = await self._complete(
+            resume.batch,
+            prompt,
+            stats=self.batch_stats,
+            vacancies=len(vacancy_texts),
+        )
+        answer: Any = json.loads(content)
+        if not isinstance(answer, list):
+            raise TypeError("Model returned a non-array batch response")
 
-            return {"score": 0}
+        scored: dict[int, dict[str, Any]] = {}
+        for item in answer:
+            if (
+                isinstance(item, dict)
+                and isinstance(item.get("id"), int)
+                and 0 <= item["id"] < len(vacancy_texts)
+                and isinstance(item.get("score"), int | float)
+            ):
+                scored[item["id"]] = {
+                    field: item[field]
+                    for field in RESULT_FIELDS
+                    if field in item
+                }
+        return scored
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analyst import ResumePrompt
+
+
+def failed_result(error: BaseException) -> dict[str, Any]:
+    """Build the result of a vacancy that could not be scored."""
+    return {"score": None, "error": str(error) or type(error).__name__}
+
+
+def is_failed(result: dict[str, Any]) -> bool:
+    """Whether a scorer result marks a failed scoring."""
+    return "error" in result
+
+
+class IVacancyScorer(ABC):
+    """Interface for scoring vacancies against a resume."""
+
+    @abstractmethod
+    async def analyze_score(
+        self, vacancy_text: str, resume: ResumePrompt
+    ) -> dict[str, Any]:
+        """Score one vacancy.
+
+        Returns:
+            dict[str, Any]: ``score`` from 0 to 100 and, when known,
+                ``main_reasons`` and ``missing_skills``; a
+                :func:`failed_result` when scoring failed.
+        """
+
+    @abstractmethod
+    async def analyze_many(
+        self, vacancy_texts: list[str], resume: ResumePrompt
+    ) -> list[dict[str, Any]]:
+        """Score several vacancies in the order of ``vacancy_texts``."""
+
+    @abstractmethod
+    def backend_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-backend latency and error statistics."""
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+
+from src.core.utils import utcnow
+from src.services.scrapper.models import CachedScore
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.database import DatabaseManager
+
+log = logging.getLogger(__name__)
+
+
+def digest(text: str) -> str:
+    """Return the SHA-256 hex digest of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class ScoreCacheKey:
+    """Identifies an AI score.
+
+    Attributes:
+        fingerprint: Digest of the vacancy text sent to the model.
+        resume_digest: Digest of the resume text.
+        model: Model name.
+        prompt_version: Version of the scoring prompt.
+    """
+
+    fingerprint: str
+    resume_digest: str
+    model: str
+    prompt_version: int
+
+
+class ScoreCache:
+    """Persistent SQLite cache of AI scores.
+
+    Entries expire after ``ttl`` and the oldest ones are evicted once
+    the cache holds more than ``max_entries``. Lookup failures are
+    treated as misses so the cache never blocks scoring.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        ttl: timedelta,
+        max_entries: int,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db_manager: Database manager owning the cache table.
+            ttl: Lifetime of a cached score.
+            max_entries: Maximum number of cached scores.
+        """
+        self._db_manager = db_manager
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    async def get(self, key: ScoreCacheKey) -> dict[str, Any] | None:
+        """Return a cached score, or None on a miss."""
+        try:
+            async with self._db_manager.session() as session:
+                result: str | None = await session.scalar(
+                    select(CachedScore.result).where(
+                        CachedScore.fingerprint == key.fingerprint,
+                        CachedScore.resume_digest == key.resume_digest,
+                        CachedScore.model == key.model,
+                        CachedScore.prompt_version == key.prompt_version,
+                        CachedScore.created_at >= utcnow() - self.ttl,
+                    )
+                )
+        except Exception as e:  # noqa: BLE001
+            log.error("Score cache lookup error: %s", e)
+            result = None
+
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        cached: dict[str, Any] = json.loads(result)
+        return cached
+
+    async def put(self, key: ScoreCacheKey, result: dict[str, Any]) -> None:
+        """Store a score, replacing an existing entry for the key."""
+
+        async def upsert(session: AsyncSession) -> None:
+            statement = insert(CachedScore).values(
+                fingerprint=key.fingerprint,
+                resume_digest=key.resume_digest,
+                model=key.model,
+                prompt_version=key.prompt_version,
+                result=json.dumps(result, ensure_ascii=False),
+                created_at=utcnow(),
+            )
+            await session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        CachedScore.fingerprint,
+                        CachedScore.resume_digest,
+                        CachedScore.model,
+                        CachedScore.prompt_version,
+                    ],
+                    set_={
+                        "result": statement.excluded.result,
+                        "created_at": statement.excluded.created_at,
+                    },
+                )
+            )
+
+        try:
+            await self._db_manager.write(upsert)
+        except Exception as e:  # noqa: BLE001
+            log.error("Score cache store error: %s", e)
+
+    async def evict(self) -> int:
+        """Delete expired entries and trim the cache to its size limit.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+
+        async def delete_entries(session: AsyncSession) -> int:
+            expired = await session.scalars(
+                delete(CachedScore)
+                .where(CachedScore.created_at < utcnow() - self.ttl)
+                .returning(CachedScore.id)
+            )
+            deleted = len(expired.all())
+
+            count: int = (
+                await session.scalar(
+                    select(func.count()).select_from(CachedScore)
+                )
+                or 0
+            )
+            if count > self.max_entries:
+                oldest = (
+                    select(CachedScore.id)
+                    .order_by(CachedScore.created_at)
+                    .limit(count - self.max_entries)
+                )
+                trimmed = await session.scalars(
+                    delete(CachedScore)
+                    .where(CachedScore.id.in_(oldest))
+                    .returning(CachedScore.id)
+                )
+                deleted += len(trimmed.all())
+            return deleted
+
+        return await self._db_manager.write(delete_entries)
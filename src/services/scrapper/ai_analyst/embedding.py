@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import math
+from typing import TYPE_CHECKING, Any, Final
+
+from .base import IVacancyScorer, failed_result, is_failed
+
+if TYPE_CHECKING:
+    from .analyst import ResumePrompt, VacancyAIAnalyst
+    from .router import BackendRouter, LLMBackend
+
+log = logging.getLogger(__name__)
+
+EMBEDDING_REASON: Final[str] = (
+    "Оценка по семантической близости резюме и вакансии"
+)
+
+
+def normalize(vector: list[float]) -> list[float]:
+    """Scale a vector to unit length so dot products are cosines."""
+    norm = math.hypot(*vector)
+    if not norm:
+        return vector
+    return [value / norm for value in vector]
+
+
+class EmbeddingScorer(IVacancyScorer):
+    """Scores vacancies by embedding similarity to the resume.
+
+    Vacancies are embedded in batches and scored by the cosine
+    similarity to the resume embedding, which is requested once per
+    resume digest. Resume and vacancy cosines cluster in a narrow band
+    well below 1, so the cosine is mapped linearly from
+    ``[cosine_floor, cosine_ceiling]`` to a 0-100 score. Vacancies
+    scoring at least ``explain_threshold`` are re-scored by the chat
+    model, which also explains the score.
+
+    The scorer needs its own router: embedding requests must not
+    affect the latency statistics and health of the chat backends.
+    """
+
+    def __init__(
+        self,
+        router: BackendRouter,
+        model: str,
+        max_concurrency: int = 4,
+        batch_size: int = 64,
+        explainer: VacancyAIAnalyst | None = None,
+        explain_threshold: int = 70,
+        cosine_floor: float = 0.2,
+        cosine_ceiling: float = 0.6,
+    ) -> None:
+        """Initialize the scorer.
+
+        Args:
+            router: Router spreading requests over LLM backends.
+            model: Embedding model name.
+            max_concurrency: Maximum number of concurrent requests.
+            batch_size: Vacancies embedded per request.
+            explainer: Chat model scorer for top candidates, or None
+                to return embedding scores only.
+            explain_threshold: Embedding score from which a vacancy is
+                passed to the explainer.
+            cosine_floor: Cosine similarity mapped to a score of 0.
+            cosine_ceiling: Cosine similarity mapped to a score of 100.
+        """
+        if cosine_ceiling <= cosine_floor:
+            raise ValueError("Cosine ceiling must be above the floor")
+        self._router = router
+        self._model = model
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._resume_lock = asyncio.Lock()
+        self._resume_vectors: dict[str, list[float]] = {}
+        self.batch_size = batch_size
+        self.explainer = explainer
+        self.explain_threshold = explain_threshold
+        self.cosine_floor = cosine_floor
+        self.cosine_ceiling = cosine_ceiling
+        self.requests = 0
+        self.embedded = 0
+        self.prompt_tokens = 0
+        self.explained = 0
+        log.info("Embedding scorer initialized")
+
+    async def _embed_on(
+        self, backend: LLMBackend, texts: list[str]
+    ) -> list[list[float]]:
+        """Request embeddings of several texts from a backend."""
+        response = await backend.client.embeddings.create(
+            model=self._model, input=texts
+        )
+        self.requests += 1
+        self.prompt_tokens += response.usage.prompt_tokens
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return [normalize(item.embedding) for item in ordered]
+
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, one request per ``batch_size`` of them."""
+        batches = [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with self._semaphore:
+                return await self._router.call(
+                    lambda backend: self._embed_on(backend, batch)
+                )
+
+        vectors: list[list[float]] = []
+        for embedded in await asyncio.gather(*map(embed_batch, batches)):
+            vectors.extend(embedded)
+        self.embedded += len(texts)
+        return vectors
+
+    async def _resume_vector(self, resume: ResumePrompt) -> list[float]:
+        """Return the resume embedding, requested once per digest."""
+        async with self._resume_lock:
+            vector = self._resume_vectors.get(resume.digest)
+            if vector is None:
+                (vector,) = await self._embed([resume.text])
+                self._resume_vectors[resume.digest] = vector
+            return vector
+
+    def calibrate(self, cosine: float) -> int:
+        """Map a cosine similarity to a 0-100 score."""
+        scaled = (cosine - self.cosine_floor) / (
+            self.cosine_ceiling - self.cosine_floor
+        )
+        return round(min(max(scaled, 0.0), 1.0) * 100)
+
+    def backend_stats(self) -> dict[str, dict[str, Any]]:
+        """Return statistics of the embedding and chat backends."""
+        stats = {
+            f"embedding {name}": backend
+            for name, backend in self._router.snapshot().items()
+        }
+        if self.explainer is not None:
+            stats.update(self.explainer.backend_stats())
+        return stats
+
+    async def analyze_score(
+        self, vacancy_text: str, resume: ResumePrompt
+    ) -> dict[str, Any]:
+        """Score one vacancy by embedding similarity."""
+        (result,) = await self.analyze_many([vacancy_text], resume)
+        return result
+
+    async def analyze_many(
+        self, vacancy_texts: list[str], resume: ResumePrompt
+    ) -> list[dict[str, Any]]:
+        """Score vacancies by cosine similarity to the resume.
+
+        Failed embedding requests return failed results, like the chat
+        model scorer.
+
+        Returns:
+            list[dict[str, Any]]: Scores in the order of
+                ``vacancy_texts``.
+        """
+        if not vacancy_texts:
+            return []
+        try:
+            resume_vector = await self._resume_vector(resume)
+            vectors = await self._embed(vacancy_texts)
+        except Exception as e:  # noqa: BLE001
+            log.error("Embedding error: %s", e)
+            return [failed_result(e) for _ in vacancy_texts]
+
+        results: list[dict[str, Any]] = [
+            {
+                "score": self.calibrate(math.sumprod(resume_vector, vector)),
+                "main_reasons": EMBEDDING_REASON,
+            }
+            for vector in vectors
+        ]
+        await self._explain(vacancy_texts, resume, results)
+        return results
+
+    async def _explain(
+        self,
+        vacancy_texts: list[str],
+        resume: ResumePrompt,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Replace top embedding scores with chat model scores."""
+        if self.explainer is None:
+            return
+        top = [
+            index
+            for index, result in enumerate(results)
+            if result["score"] >= self.explain_threshold
+        ]
+        if not top:
+            return
+
+        explained = await self.explainer.analyze_many(
+            vacancy_texts=[vacancy_texts[index] for index in top],
+            resume=resume,
+        )
+        for index, result in zip(top, explained, strict=True):
+            # A failed chat request keeps the embedding score.
+            if not is_failed(result):
+                results[index] = result
+                self.explained += 1
+        log.info(
+            "Embedded %d vacancies, %d passed to the chat model",
+            len(results),
+            len(top),
+        )
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select, tuple_
+
+from src.services.scrapper.models import (
+    Vacancy,
+    VacancyDetail,
+    VacancyFeedback,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from src.core.database import DatabaseManager
+
+
+@dataclass(frozen=True, slots=True)
+class FeedbackSample:
+    """A bot user's reaction to a stored vacancy.
+
+    Attributes:
+        title: Vacancy title.
+        description: Vacancy description.
+        liked: Whether the user liked the vacancy.
+    """
+
+    title: str
+    description: str
+    liked: bool
+
+
+class FeedbackLog:
+    """Reads reactions left in the bot since the previous read.
+
+    Reactions are joined with the stored vacancy details, so only
+    vacancies kept by the ``orm`` repository backend are returned. A
+    changed reaction is returned again with its new value. Reactions
+    are read in ``(updated_at, id)`` order from the last pair returned,
+    so reactions sharing a timestamp are not skipped between reads.
+    """
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """Initialize the log.
+
+        Args:
+            db_manager: Database manager owning the feedback table.
+        """
+        self._db_manager = db_manager
+        self._cursor: tuple[datetime, int] | None = None
+
+    async def fetch_new(self, limit: int) -> list[FeedbackSample]:
+        """Return up to ``limit`` reactions not returned before."""
+        statement = (
+            select(
+                VacancyFeedback.updated_at,
+                VacancyFeedback.id,
+                VacancyDetail.title,
+                VacancyDetail.description,
+                VacancyFeedback.liked,
+            )
+            .join(Vacancy, Vacancy.hash == VacancyFeedback.vacancy_hash)
+            .join(VacancyDetail, VacancyDetail.vacancy_id == Vacancy.id)
+            .order_by(VacancyFeedback.updated_at, VacancyFeedback.id)
+            .limit(limit)
+        )
+        if self._cursor is not None:
+            statement = statement.where(
+                tuple_(VacancyFeedback.updated_at, VacancyFeedback.id)
+                > tuple_(*self._cursor)
+            )
+
+        async with self._db_manager.session() as session:
+            rows = (await session.execute(statement)).all()
+
+        if rows:
+            self._cursor = (rows[-1].updated_at, rows[-1].id)
+        return [
+            FeedbackSample(
+                title=row.title, description=row.description, liked=row.liked
+            )
+            for row in rows
+        ]
@@ -0,0 +1,189 @@
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.dialects.sqlite import insert
+
+from src.core.utils import utcnow
+from src.services.scrapper.models import ScoringInput
+
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.database import DatabaseManager
+    from src.services.scrapper.entity import VacancyEntity
+
+log = logging.getLogger(__name__)
+
+
+def as_score(value: str | int | None) -> int | None:
+    """Convert a scorer score to an integer, or None if not a number."""
+    with contextlib.suppress(TypeError, ValueError):
+        return int(value)
+    return None
+
+
+class ScoringInputStore:
+    """Keeps LLM scoring inputs of recent vacancies.
+
+    Every vacancy sent to the LLM is stored with its source and the
+    digest of the resume it was scored against, so it can be re-scored
+    when the source resume changes. Stale inputs are claimed for a
+    lease before re-scoring, so processes sharing the database never
+    re-score and correct the same vacancy twice.
+    """
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """Initialize the store.
+
+        Args:
+            db_manager: Database manager owning the inputs table.
+        """
+        self._db_manager = db_manager
+
+    async def record(
+        self,
+        vacancies: list[VacancyEntity],
+        source: str,
+        resume_digest: str,
+    ) -> None:
+        """Store vacancies scored against a resume.
+
+        A vacancy that is not scored yet is stored without a score.
+        """
+        if not vacancies:
+            return
+
+        async def insert_inputs(session: AsyncSession) -> None:
+            await session.execute(
+                insert(ScoringInput)
+                .values([
+                    {
+                        "vacancy_hash": vacancy.hash,
+                        "source": source,
+                        "resume_digest": resume_digest,
+                        "vacancy": vacancy.to_json().decode("utf-8"),
+                        "ai_score": as_score(vacancy.ai_score),
+                    }
+                    for vacancy in vacancies
+                ])
+                .on_conflict_do_nothing(
+                    index_elements=[ScoringInput.vacancy_hash]
+                )
+            )
+
+        try:
+            await self._db_manager.write(insert_inputs)
+        except Exception as e:  # noqa: BLE001
+            log.error("Scoring inputs store error: %s", e)
+
+    async def set_score(
+        self, vacancy_hash: str, resume_digest: str, score: str | int | None
+    ) -> None:
+        """Store the score of a vacancy computed against a resume."""
+
+        async def update_input(session: AsyncSession) -> None:
+            await session.execute(
+                update(ScoringInput)
+                .where(ScoringInput.vacancy_hash == vacancy_hash)
+                .values(
+                    resume_digest=resume_digest,
+                    ai_score=as_score(score),
+                    claimed_until=None,
+                    updated_at=utcnow(),
+                )
+            )
+
+        await self._db_manager.write(update_input)
+
+    async def claim_stale(
+        self,
+        source: str,
+        resume_digest: str,
+        created_after: datetime,
+        after_id: int,
+        limit: int,
+        lease: timedelta,
+    ) -> list[ScoringInput]:
+        """Claim inputs of a source scored against another resume.
+
+        Inputs claimed by another process are skipped until their lease
+        runs out. A claim ends when the score is stored or the input is
+        released.
+
+        Args:
+            source: Source the vacancies were found by.
+            resume_digest: Digest of the current source resume.
+            created_after: Start of the window of re-scored vacancies.
+            after_id: Only inputs with a greater id are returned, to
+                page through them.
+            limit: Maximum number of returned inputs.
+            lease: How long the inputs are hidden from others.
+
+        Returns:
+            list[ScoringInput]: Claimed inputs ordered by id.
+        """
+        now = utcnow()
+
+        async def claim_inputs(session: AsyncSession) -> list[ScoringInput]:
+            inputs = await session.scalars(
+                update(ScoringInput)
+                .where(
+                    ScoringInput.id.in_(
+                        select(ScoringInput.id)
+                        .where(
+                            ScoringInput.source == source,
+                            ScoringInput.resume_digest != resume_digest,
+                            ScoringInput.created_at >= created_after,
+                            ScoringInput.id > after_id,
+                            or_(
+                                ScoringInput.claimed_until.is_(None),
+                                ScoringInput.claimed_until <= now,
+                            ),
+                        )
+                        .order_by(ScoringInput.id)
+                        .limit(limit)
+                    )
+                )
+                .values(claimed_until=now + lease)
+                .returning(ScoringInput)
+            )
+            return sorted(inputs.all(), key=lambda entry: entry.id)
+
+        return await self._db_manager.write(claim_inputs)
+
+    async def release(self, inputs: list[ScoringInput]) -> None:
+        """Return claimed inputs that were not re-scored."""
+        if not inputs:
+            return
+
+        ids = [entry.id for entry in inputs]
+
+        async def release_inputs(session: AsyncSession) -> None:
+            await session.execute(
+                update(ScoringInput)
+                .where(ScoringInput.id.in_(ids))
+                .values(claimed_until=None)
+            )
+
+        await self._db_manager.write(release_inputs)
+
+    async def purge(self, older_than: datetime) -> int:
+        """Delete inputs of vacancies found before ``older_than``.
+
+        Returns:
+            int: Number of deleted inputs.
+        """
+
+        async def delete_inputs(session: AsyncSession) -> int:
+            deleted = await session.scalars(
+                delete(ScoringInput)
+                .where(ScoringInput.created_at < older_than)
+                .returning(ScoringInput.id)
+            )
+            return len(deleted.all())
+
+        return await self._db_manager.write(delete_inputs)
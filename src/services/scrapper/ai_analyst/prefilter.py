@@ -0,0 +1,104 @@
+import math
+import re
+from collections import Counter
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Keeps tech names such as "c++", "c#", "node.js" and "ci/cd" whole.
+TOKEN_RE: Final[re.Pattern[str]] = re.compile(r"\w[\w+#./]*\w|\w[+#]*")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into lowercase terms."""
+    return TOKEN_RE.findall(text.lower())
+
+
+class RelevancePrefilter:
+    """Cheap TF-IDF relevance check run before LLM scoring.
+
+    The resume term frequencies are computed once. Document
+    frequencies are accumulated over every vacancy seen, so common
+    boilerplate words lose weight as the corpus grows. Relevance is
+    the cosine similarity of the TF-IDF vectors, between 0 and 1.
+    """
+
+    def __init__(self, resume_text: str, threshold: float) -> None:
+        """Initialize the pre-filter.
+
+        Args:
+            resume_text: Resume to compare vacancies with.
+            threshold: Minimum relevance for a vacancy to reach the
+                LLM; 0 lets every vacancy through.
+        """
+        self.threshold = threshold
+        self._resume: Counter[str] = Counter(tokenize(resume_text))
+        self._document_frequency: Counter[str] = Counter()
+        self._documents = 0
+        self.checked = 0
+        self.filtered = 0
+
+    def set_resume(self, resume_text: str) -> None:
+        """Compare vacancies with another resume, keeping the corpus."""
+        self._resume = Counter(tokenize(resume_text))
+
+    def _idf(self, term: str) -> float:
+        """Smoothed inverse document frequency of a term."""
+        return (
+            math.log(
+                (1 + self._documents) / (1 + self._document_frequency[term])
+            )
+            + 1
+        )
+
+    def _weights(self, terms: Counter[str]) -> dict[str, float]:
+        """TF-IDF weights of a term counter."""
+        return {term: count * self._idf(term) for term, count in terms.items()}
+
+    def relevance(self, vacancy_texts: Iterable[str]) -> list[float]:
+        """Score vacancies against the resume.
+
+        The vacancies are added to the corpus before scoring.
+
+        Returns:
+            list[float]: Cosine similarity per vacancy.
+        """
+        documents: list[Counter[str]] = [
+            Counter(tokenize(text)) for text in vacancy_texts
+        ]
+        for terms in documents:
+            self._document_frequency.update(terms.keys())
+        self._documents += len(documents)
+
+        resume = self._weights(self._resume)
+        resume_norm = math.sqrt(sum(w * w for w in resume.values()))
+
+        scores: list[float] = []
+        for terms in documents:
+            vacancy = self._weights(terms)
+            norm = resume_norm * math.sqrt(
+                sum(w * w for w in vacancy.values())
+            )
+            dot = sum(
+                weight * resume[term]
+                for term, weight in vacancy.items()
+                if term in resume
+            )
+            scores.append(dot / norm if norm else 0.0)
+        return scores
+
+    def check(self, vacancy_texts: list[str]) -> list[float | None]:
+        """Apply the threshold to a page of vacancies.
+
+        Returns:
+            list[float | None]: Relevance of each rejected vacancy, or
+                None for vacancies that should be scored by the LLM.
+        """
+        verdicts: list[float | None] = [
+            None if score >= self.threshold else score
+            for score in self.relevance(vacancy_texts)
+        ]
+        self.checked += len(verdicts)
+        self.filtered += sum(score is not None for score in verdicts)
+        return verdicts
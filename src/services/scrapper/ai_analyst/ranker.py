@@ -0,0 +1,143 @@
+import math
+import zlib
+from collections import Counter
+from typing import Final
+
+from .prefilter import tokenize
+
+FEATURE_BITS: Final[int] = 18
+
+
+def sigmoid(value: float) -> float:
+    """Logistic function, safe for large magnitudes."""
+    if value >= 0:
+        return 1 / (1 + math.exp(-value))
+    exp = math.exp(value)
+    return exp / (1 + exp)
+
+
+class FeedbackRanker:
+    """Local relevance model trained on likes and dislikes in the bot.
+
+    An online logistic regression over hashed vacancy terms, updated
+    one feedback at a time, so it never has to be retrained from
+    scratch. A prediction replaces the LLM score only once the model
+    has learned from ``min_feedback`` reactions and its probability is
+    at least ``confidence`` or at most ``1 - confidence``.
+
+    Before learning from a reaction, the model predicts it, so
+    ``accuracy`` tracks how often confident predictions agreed with
+    the user on vacancies the model had not seen.
+    """
+
+    def __init__(
+        self,
+        confidence: float = 0.9,
+        min_feedback: int = 50,
+        learning_rate: float = 0.5,
+        l2: float = 1e-4,
+    ) -> None:
+        """Initialize the ranker.
+
+        Args:
+            confidence: Probability from which a prediction is used
+                instead of the LLM score.
+            min_feedback: Reactions learned before any prediction is
+                used.
+            learning_rate: Step size of the gradient updates.
+            l2: L2 regularization of the weights.
+        """
+        self.confidence = confidence
+        self.min_feedback = min_feedback
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self._mask = (1 << FEATURE_BITS) - 1
+        self._weights: dict[int, float] = {}
+        self._bias = 0.0
+        self.trained = 0
+        self.validated = 0
+        self.agreed = 0
+        self.checked = 0
+        self.skipped = 0
+
+    @staticmethod
+    def document(title: str, description: str) -> str:
+        """Return the text a vacancy is ranked by."""
+        return f"{title}\n{description}"
+
+    @property
+    def accuracy(self) -> float:
+        """Share of confident predictions that matched the feedback."""
+        return self.agreed / self.validated if self.validated else 0.0
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough feedback was learned to use predictions."""
+        return self.trained >= self.min_feedback
+
+    def _features(self, text: str) -> dict[int, float]:
+        """Hashed, log-scaled and L2-normalized term frequencies."""
+        features: dict[int, float] = {}
+        for term, count in Counter(tokenize(text)).items():
+            index = zlib.crc32(term.encode("utf-8")) & self._mask
+            features[index] = features.get(index, 0.0) + math.log1p(count)
+        norm = math.sqrt(sum(value * value for value in features.values()))
+        if not norm:
+            return features
+        return {index: value / norm for index, value in features.items()}
+
+    def _predict(self, features: dict[int, float]) -> float:
+        """Probability that a vacancy with the features is liked."""
+        return sigmoid(
+            self._bias
+            + sum(
+                self._weights.get(index, 0.0) * value
+                for index, value in features.items()
+            )
+        )
+
+    def _confident(self, probability: float) -> bool:
+        """Whether a probability is far enough from the boundary."""
+        return max(probability, 1 - probability) >= self.confidence
+
+    def predict(self, text: str) -> float:
+        """Return the probability that a vacancy is liked."""
+        return self._predict(self._features(text))
+
+    def learn(self, text: str, liked: bool) -> None:
+        """Update the model with one reaction to a vacancy."""
+        features = self._features(text)
+        probability = self._predict(features)
+        if self.ready and self._confident(probability):
+            self.validated += 1
+            self.agreed += (probability >= 0.5) == liked
+
+        gradient = probability - liked
+        self._bias -= self.learning_rate * gradient
+        for index, value in features.items():
+            weight = self._weights.get(index, 0.0)
+            self._weights[index] = weight - self.learning_rate * (
+                gradient * value + self.l2 * weight
+            )
+        self.trained += 1
+
+    def check(self, vacancy_texts: list[str]) -> list[float | None]:
+        """Predict vacancies the model is confident about.
+
+        Returns:
+            list[float | None]: Probability of a like for confidently
+                ranked vacancies, or None for vacancies that should be
+                scored by the LLM.
+        """
+        if not self.ready:
+            return [None] * len(vacancy_texts)
+
+        verdicts: list[float | None] = []
+        for text in vacancy_texts:
+            probability = self.predict(text)
+            verdicts.append(
+                probability if self._confident(probability) else None
+            )
+        self.checked += len(verdicts)
+        self.skipped += sum(verdict is not None for verdict in verdicts)
+        return verdicts
@@ -0,0 +1,231 @@
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert
+
+from src.core.utils import utcnow
+from src.services.scrapper.models import PendingScore
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.database import DatabaseManager
+    from src.services.scrapper.entity import VacancyEntity
+
+log = logging.getLogger(__name__)
+
+
+class RescoreQueue:
+    """Persistent SQLite queue of vacancies whose AI scoring failed.
+
+    A parked vacancy is retried after ``base_delay``, doubling the
+    delay after every failed attempt up to ``max_delay``, until it has
+    failed ``max_attempts`` times.
+
+    Several processes may share the queue, so due entries are claimed
+    by moving their retry time ``lease`` ahead in the same statement
+    that selects them. An entry claimed by a process that stopped is
+    retried once its lease runs out.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        base_delay: timedelta,
+        max_delay: timedelta,
+        max_attempts: int,
+        lease: timedelta,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            db_manager: Database manager owning the queue table.
+            base_delay: Delay before the first retry.
+            max_delay: Upper bound of the retry delay.
+            max_attempts: Retries before a vacancy is given up.
+            lease: How long claimed entries are hidden from others.
+        """
+        self._db_manager = db_manager
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.lease = lease
+
+    def delay(self, attempts: int) -> timedelta:
+        """Return the delay before the retry after ``attempts`` ones."""
+        return min(self.base_delay * 2**attempts, self.max_delay)
+
+    def entry(
+        self,
+        vacancy: VacancyEntity,
+        resume_digest: str,
+        published: bool,
+        error: str | None,
+    ) -> dict[str, Any]:
+        """Build a queue row for a vacancy.
+
+        Args:
+            vacancy: Vacancy that could not be scored.
+            resume_digest: Digest of the resume to score against.
+            published: Whether the vacancy was already published
+                unscored, so a later score only updates the database.
+            error: Error of the failed scoring.
+
+        Returns:
+            dict[str, Any]: Values of the queue row.
+        """
+        return {
+            "vacancy_hash": vacancy.hash,
+            "resume_digest": resume_digest,
+            "vacancy": vacancy.to_json().decode("utf-8"),
+            "published": published,
+            "attempts": 0,
+            "next_attempt_at": utcnow() + self.base_delay,
+            "last_error": error,
+        }
+
+    @staticmethod
+    async def stage(
+        session: AsyncSession, entries: list[dict[str, Any]]
+    ) -> None:
+        """Insert entries in the transaction of the caller.
+
+        A vacancy already in the queue keeps its schedule.
+        """
+        if not entries:
+            return
+
+        await session.execute(
+            insert(PendingScore)
+            .values(entries)
+            .on_conflict_do_nothing(index_elements=[PendingScore.vacancy_hash])
+        )
+
+    async def add(self, entries: list[dict[str, Any]]) -> None:
+        """Insert entries in a transaction of their own."""
+
+        async def insert_entries(session: AsyncSession) -> None:
+            await self.stage(session, entries)
+
+        await self._db_manager.write(insert_entries)
+
+    async def park(
+        self,
+        vacancy: VacancyEntity,
+        resume_digest: str,
+        published: bool,
+        error: str | None,
+    ) -> None:
+        """Queue a vacancy for re-scoring.
+
+        A vacancy already in the queue keeps its schedule.
+
+        Args:
+            vacancy: Vacancy that could not be scored.
+            resume_digest: Digest of the resume to score against.
+            published: Whether the vacancy was already published
+                unscored, so a later score only updates the database.
+            error: Error of the failed scoring.
+        """
+        await self.add([
+            self.entry(
+                vacancy=vacancy,
+                resume_digest=resume_digest,
+                published=published,
+                error=error,
+            )
+        ])
+        log.info("Vacancy parked for re-scoring: %s", vacancy.hash)
+
+    async def claim(self, limit: int) -> list[PendingScore]:
+        """Claim up to ``limit`` entries whose retry time has come.
+
+        The entries are leased to the caller, which has to mark them
+        done, reschedule or release them.
+        """
+        now = utcnow()
+
+        async def claim_entries(session: AsyncSession) -> list[PendingScore]:
+            entries = await session.scalars(
+                update(PendingScore)
+                .where(
+                    PendingScore.id.in_(
+                        select(PendingScore.id)
+                        .where(PendingScore.next_attempt_at <= now)
+                        .order_by(PendingScore.next_attempt_at)
+                        .limit(limit)
+                    )
+                )
+                .values(next_attempt_at=now + self.lease)
+                .returning(PendingScore)
+            )
+            return sorted(entries.all(), key=lambda entry: entry.id)
+
+        return await self._db_manager.write(claim_entries)
+
+    async def release(self, entries: list[PendingScore]) -> None:
+        """Return claimed entries that were not attempted."""
+        if not entries:
+            return
+
+        ids = [entry.id for entry in entries]
+
+        async def release_entries(session: AsyncSession) -> None:
+            await session.execute(
+                update(PendingScore)
+                .where(PendingScore.id.in_(ids))
+                .values(next_attempt_at=utcnow())
+            )
+
+        await self._db_manager.write(release_entries)
+
+    async def size(self) -> int:
+        """Return the number of parked vacancies."""
+        async with self._db_manager.session() as session:
+            count: int | None = await session.scalar(
+                select(func.count()).select_from(PendingScore)
+            )
+            return count or 0
+
+    async def done(self, entry: PendingScore) -> None:
+        """Remove a re-scored or given up entry from the queue."""
+
+        async def delete_entry(session: AsyncSession) -> None:
+            await session.execute(
+                delete(PendingScore).where(PendingScore.id == entry.id)
+            )
+
+        await self._db_manager.write(delete_entry)
+
+    async def reschedule(self, entry: PendingScore, error: str) -> bool:
+        """Schedule the next attempt of an entry after a failed one.
+
+        Returns:
+            bool: False if the entry ran out of attempts; it stays in
+                the queue until it is marked done.
+        """
+        attempts = entry.attempts + 1
+        if attempts >= self.max_attempts:
+            log.warning(
+                "Re-scoring given up after %d attempts: %s",
+                attempts,
+                entry.vacancy_hash,
+            )
+            return False
+
+        async def update_entry(session: AsyncSession) -> None:
+            await session.execute(
+                update(PendingScore)
+                .where(PendingScore.id == entry.id)
+                .values(
+                    attempts=attempts,
+                    next_attempt_at=utcnow() + self.delay(attempts),
+                    last_error=error,
+                )
+            )
+
+        await self._db_manager.write(update_entry)
+        return True
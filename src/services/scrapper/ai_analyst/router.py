@@ -0,0 +1,283 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final
+
+import openai
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+log = logging.getLogger(__name__)
+
+LATENCY_WINDOW: Final[int] = 200
+# Latency assumed for a backend without samples, in seconds.
+DEFAULT_LATENCY: Final[float] = 1.0
+EWMA_ALPHA: Final[float] = 0.2
+
+
+@dataclass(slots=True)
+class BackendStats:
+    """Rolling latency and error statistics of a backend."""
+
+    requests: int = 0
+    errors: int = 0
+    hedges: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    ewma: float | None = None
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW)
+    )
+
+    def record_success(self, seconds: float) -> None:
+        """Record a successful request."""
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latencies.append(seconds)
+        self.ewma = (
+            seconds
+            if self.ewma is None
+            else EWMA_ALPHA * seconds + (1 - EWMA_ALPHA) * self.ewma
+        )
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self.requests += 1
+        self.errors += 1
+        self.consecutive_failures += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Return a latency quantile, or None without samples."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def consume_error(task: asyncio.Task[Any]) -> None:
+    """Retrieve the error of a task nobody awaits any more."""
+    if not task.cancelled():
+        task.exception()
+
+
+class LLMBackend:
+    """An OpenAI-compatible endpoint with its routing statistics."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        model: str,
+        weight: float = 1.0,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            base_url: OpenAI-compatible API base URL.
+            api_key: API key.
+            model: Model name served by this endpoint.
+            weight: Relative share of traffic at equal latency.
+        """
+        self.name = base_url
+        self.client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self.model = model
+        self.weight = weight
+        self.stats = BackendStats()
+
+    def is_healthy(self, now: float) -> bool:
+        """Whether the backend is not currently ejected."""
+        return now >= self.stats.ejected_until
+
+
+class BackendRouter:
+    """Routes LLM requests across weighted backends.
+
+    A backend is picked at random with probability proportional to its
+    weight divided by its smoothed latency. Backends failing
+    ``eject_after_failures`` times in a row are ejected for
+    ``eject_seconds``; once that expires they receive traffic again
+    and are ejected anew on the next failure. If a request is still
+    running after the backend's ``hedge_percentile`` latency, a second
+    request is sent to another backend and the first answer wins.
+    """
+
+    def __init__(
+        self,
+        backends: list[LLMBackend],
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        eject_after_failures: int = 3,
+        eject_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            backends: Backends to route between.
+            hedge_percentile: Latency quantile after which a hedged
+                request is sent; 0 disables hedging.
+            hedge_min_samples: Latency samples a backend needs before
+                its requests are hedged.
+            eject_after_failures: Consecutive failures that eject a
+                backend.
+            eject_seconds: How long an ejected backend is skipped.
+        """
+        if not backends:
+            raise ValueError("At least one LLM backend is required")
+        if any(backend.weight <= 0 for backend in backends):
+            raise ValueError("LLM backend weights must be positive")
+        self.backends = backends
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.eject_after_failures = eject_after_failures
+        self.eject_seconds = eject_seconds
+
+    def choose(self, exclude: LLMBackend | None = None) -> LLMBackend | None:
+        """Pick a backend, preferring fast and healthy ones.
+
+        When every backend is ejected, all of them are candidates again
+        so that scoring degrades instead of stopping.
+        """
+        now = time.monotonic()
+        candidates = [
+            backend
+            for backend in self.backends
+            if backend is not exclude and backend.is_healthy(now)
+        ]
+        if not candidates:
+            candidates = [
+                backend for backend in self.backends if backend is not exclude
+            ]
+        if not candidates:
+            return None
+
+        weights = [
+            backend.weight / (backend.stats.ewma or DEFAULT_LATENCY)
+            for backend in candidates
+        ]
+        return random.choices(candidates, weights=weights)[0]  # noqa: S311
+
+    def _hedge_delay(self, backend: LLMBackend) -> float | None:
+        """Return when to hedge a request, or None to never hedge."""
+        if (
+            not self.hedge_percentile
+            or len(self.backends) < 2
+            or len(backend.stats.latencies) < self.hedge_min_samples
+        ):
+            return None
+        return backend.stats.percentile(self.hedge_percentile)
+
+    async def _attempt[T](
+        self,
+        backend: LLMBackend,
+        request: Callable[[LLMBackend], Awaitable[T]],
+    ) -> T:
+        """Run a request on a backend and update its statistics."""
+        started = time.perf_counter()
+        try:
+            result = await request(backend)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            backend.stats.record_failure()
+            if backend.stats.consecutive_failures >= self.eject_after_failures:
+                backend.stats.ejected_until = (
+                    time.monotonic() + self.eject_seconds
+                )
+                log.warning(
+                    "LLM backend %s ejected for %.0fs after %d failures",
+                    backend.name,
+                    self.eject_seconds,
+                    backend.stats.consecutive_failures,
+                )
+            raise
+
+        backend.stats.record_success(time.perf_counter() - started)
+        return result
+
+    async def call[T](
+        self, request: Callable[[LLMBackend], Awaitable[T]]
+    ) -> T:
+        """Run a request, hedging it and failing over between backends.
+
+        Args:
+            request: Coroutine function sending the request to the
+                given backend.
+
+        Returns:
+            T: The first successful result.
+        """
+        primary = self.choose()
+        if primary is None:
+            raise RuntimeError("No LLM backend available")
+
+        tasks: list[asyncio.Task[T]] = [
+            asyncio.create_task(self._attempt(primary, request))
+        ]
+        try:
+            done, _ = await asyncio.wait(
+                tasks, timeout=self._hedge_delay(primary)
+            )
+            if done and tasks[0].exception() is None:
+                return tasks[0].result()
+
+            secondary = self.choose(exclude=primary)
+            if secondary is None:
+                return await tasks[0]
+            if not done:
+                primary.stats.hedges += 1
+                log.debug(
+                    "Hedging slow request on %s to %s",
+                    primary.name,
+                    secondary.name,
+                )
+            tasks.append(
+                asyncio.create_task(self._attempt(secondary, request))
+            )
+
+            return await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+                # A loser may have failed in the same batch as the
+                # winner; retrieve its error so it is not reported.
+                task.add_done_callback(consume_error)
+
+    @staticmethod
+    async def _first_success[T](tasks: list[asyncio.Task[T]]) -> T:
+        """Return the first result that is not an error."""
+        error: BaseException | None = None
+        pending: set[asyncio.Task[T]] = set(tasks)
+        while pending:
+            finished, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+
+        if error is None:
+            raise RuntimeError("LLM request failed on every backend")
+        raise error
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return per-backend latency and error statistics."""
+        now = time.monotonic()
+        report: dict[str, dict[str, Any]] = {}
+        for backend in self.backends:
+            stats = backend.stats
+            p50 = stats.percentile(0.5)
+            p99 = stats.percentile(0.99)
+            report[backend.name] = {
+                "healthy": backend.is_healthy(now),
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "hedges": stats.hedges,
+                "p50_ms": None if p50 is None else round(p50 * 1000),
+                "p99_ms": None if p99 is None else round(p99 * 1000),
+            }
+        return report
@@ -0,0 +1,53 @@
+class JsonValueScanner:
+    """Finds where the first JSON object or array in a stream ends.
+
+    Text before the opening bracket (e.g. a stray preamble) is skipped.
+    Brackets inside string literals are ignored.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scanner."""
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> str | None:
+        """Consume the next piece of the stream.
+
+        Returns:
+            str | None: The complete JSON text once the top-level value
+                has closed, otherwise None.
+        """
+        start = 0
+        if self._depth == 0:
+            starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+            if not starts:
+                return None
+            start = min(starts)
+
+        for index in range(start, len(text)):
+            if self._closes(text[index]):
+                self._parts.append(text[start : index + 1])
+                return "".join(self._parts)
+
+        self._parts.append(text[start:])
+        return None
+
+    def _closes(self, char: str) -> bool:
+        """Advance by one character; True when the value has closed."""
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+        elif char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            return self._depth == 0
+        return False
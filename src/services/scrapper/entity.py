@@ -37,6 +37,12 @@ class VacancyEntity:
     ai_missing_skills: str | None = None
     main_tag: str | None = None
     tags: list[str] | None = None
+    # Score the vacancy was published with before a re-scoring.
+    previous_ai_score: str | None = None
+    # Local pre-filter relevance of a vacancy sent without AI scoring.
+    relevance: int | None = None
+    # Set when AI scoring failed for good and will not be retried.
+    ai_given_up: bool = False
 
     @property
     def hash(self) -> str:
@@ -59,13 +65,71 @@ class VacancyEntity:
         ])
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    def to_json(self) -> bytes:
-        """Returns a JSON-compatible representation.
+    def apply_ai_result(self, result: dict[str, Any]) -> None:
+        """Copy an AI scorer result onto the vacancy.
+
+        Args:
+            result (dict[str, Any]): Scorer result with ``score`` and
+                optional ``main_reasons`` and ``missing_skills``, or a
+                pre-filter result with ``relevance`` only.
+        """
+        self.ai_score = result.get("score")
+        self.ai_reasons = result.get("main_reasons")
+        self.ai_missing_skills = result.get("missing_skills")
+        self.relevance = result.get("relevance")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> VacancyEntity:
+        """Restore a vacancy from the fields of ``to_dict``.
+
+        The raw source data is not part of the message, so it is empty.
+
+        Args:
+            data (dict[str, Any]): Vacancy fields.
 
         Returns:
-            bytes: JSON-encoded string.
+            VacancyEntity: The decoded vacancy.
+        """
+        return cls(
+            title=data["title"],
+            company=data["company"],
+            salary=data["salary"],
+            experience=data["experience"],
+            description=data["description"],
+            link=data["link"],
+            location=data["location"],
+            date=data["date"],
+            raw_data={},
+            ai_score=data.get("ai_score"),
+            ai_reasons=data.get("ai_reasons"),
+            ai_missing_skills=data.get("ai_missing_skills"),
+            main_tag=data.get("main_tag"),
+            tags=data.get("tags"),
+            previous_ai_score=data.get("previous_ai_score"),
+            relevance=data.get("relevance"),
+            ai_given_up=bool(data.get("ai_given_up")),
+        )
+
+    @classmethod
+    def from_json(cls, json_bytes: bytes) -> VacancyEntity:
+        """Restore a vacancy published with ``to_json``.
+
+        Args:
+            json_bytes (bytes): JSON-encoded vacancy.
+
+        Returns:
+            VacancyEntity: The decoded vacancy.
         """
-        return json.dumps({
+        return cls.from_dict(json.loads(json_bytes))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the fields sent in a message.
+
+        Returns:
+            dict[str, Any]: Vacancy fields without the raw data.
+        """
+        return {
+            "hash": self.hash,
             "main_tag": self.main_tag,
             "tags": self.tags,
             "title": self.title,
@@ -76,10 +140,21 @@ class VacancyEntity:
             "ai_score": self.ai_score,
             "ai_reasons": self.ai_reasons,
             "ai_missing_skills": self.ai_missing_skills,
+            "previous_ai_score": self.previous_ai_score,
             "link": self.link,
             "location": self.location,
             "date": self.date,
-        }).encode("utf-8")
+            "relevance": self.relevance,
+            "ai_given_up": self.ai_given_up,
+        }
+
+    def to_json(self) -> bytes:
+        """Returns a JSON-compatible representation.
+
+        Returns:
+            bytes: JSON-encoded string.
+        """
+        return json.dumps(self.to_dict()).encode("utf-8")
 
 
 @dataclass(slots=True, frozen=True)
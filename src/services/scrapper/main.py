@@ -1,12 +1,34 @@
 import asyncio
+import contextlib
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING, Final
 
-from src.core.conf import RabbitMQSettings, SourceType
+from src.core.conf import DatabaseSettings, RabbitMQSettings, SourceType
 from src.core.database import DB_MANAGER
-from src.services.scrapper.ai_analyst.analyst import VacancyAIAnalyst
+from src.services.scrapper.ai_analyst.analyst import (
+    ResumeRegistry,
+    VacancyAIAnalyst,
+)
+from src.services.scrapper.ai_analyst.cache import ScoreCache
+from src.services.scrapper.ai_analyst.embedding import EmbeddingScorer
+from src.services.scrapper.ai_analyst.feedback import FeedbackLog
+from src.services.scrapper.ai_analyst.inputs import ScoringInputStore
+from src.services.scrapper.ai_analyst.ranker import FeedbackRanker
+from src.services.scrapper.ai_analyst.retry import RescoreQueue
+from src.services.scrapper.ai_analyst.router import BackendRouter, LLMBackend
+from src.services.scrapper.messaging.outbox import Outbox, OutboxRelay
 from src.services.scrapper.messaging.rabbitmq import MQPublisher
-from src.services.scrapper.tasks.make import make_headhunter_polling_task
+from src.services.scrapper.tasks.make import (
+    make_ai_stats_task,
+    make_headhunter_polling_task,
+    make_ranker_task,
+    make_repository,
+    make_rescore_task,
+    make_resume_rescore_task,
+    make_retention_task,
+    make_score_cache_task,
+)
 
 from .scheduler import ParseScheduler
 
@@ -14,6 +36,8 @@ if TYPE_CHECKING:
     from src.core.conf import ScrapperSettings
     from src.core.conf.classes import AIAnalystSettings
     from src.core.conf.mq_topology import RabbitMQPublisherConfig
+    from src.services.scrapper.ai_analyst.base import IVacancyScorer
+    from src.services.scrapper.messaging import IMessageSender
 
 
 log = logging.getLogger(__name__)
@@ -21,12 +45,137 @@ log = logging.getLogger(__name__)
 OFFSET_SECONDS: Final[int] = 5
 
 
-def make_ai_analyst(conf: AIAnalystSettings) -> VacancyAIAnalyst:
-    """Create AI Analyst instance."""
-    return VacancyAIAnalyst(
-        base_url=conf.base_url,
-        api_key=conf.api_key,
+def make_score_cache(conf: AIAnalystSettings) -> ScoreCache | None:
+    """Create AI score cache instance, if enabled."""
+    if not conf.cache_enabled:
+        return None
+    return ScoreCache(
+        db_manager=DB_MANAGER,
+        ttl=timedelta(days=conf.cache_ttl_days),
+        max_entries=conf.cache_max_entries,
+    )
+
+
+def make_rescore_queue(conf: AIAnalystSettings) -> RescoreQueue | None:
+    """Create the queue of failed AI scorings, if enabled."""
+    if not conf.retry_enabled:
+        return None
+    return RescoreQueue(
+        db_manager=DB_MANAGER,
+        base_delay=timedelta(minutes=conf.retry_base_delay_minutes),
+        max_delay=timedelta(minutes=conf.retry_max_delay_minutes),
+        max_attempts=conf.retry_max_attempts,
+        lease=timedelta(minutes=conf.retry_lease_minutes),
+    )
+
+
+def make_ranker(conf: AIAnalystSettings) -> FeedbackRanker | None:
+    """Create the local ranker trained on bot feedback, if enabled."""
+    if not conf.ranker_enabled:
+        return None
+    return FeedbackRanker(
+        confidence=conf.ranker_confidence,
+        min_feedback=conf.ranker_min_feedback,
+    )
+
+
+def make_scoring_inputs(conf: AIAnalystSettings) -> ScoringInputStore | None:
+    """Create the store of LLM scoring inputs, if enabled."""
+    if not conf.resume_rescore_enabled:
+        return None
+    return ScoringInputStore(db_manager=DB_MANAGER)
+
+
+def make_outbox(
+    rabbitmq_settings: RabbitMQSettings,
+    publisher_settings: RabbitMQPublisherConfig,
+) -> Outbox | None:
+    """Create the transactional outbox of published vacancies."""
+    if not rabbitmq_settings.outbox_enabled:
+        return None
+    return Outbox(
+        db_manager=DB_MANAGER,
+        publisher_settings=publisher_settings,
+        base_delay=timedelta(
+            seconds=rabbitmq_settings.outbox_retry_base_seconds
+        ),
+        max_delay=timedelta(
+            seconds=rabbitmq_settings.outbox_retry_max_seconds
+        ),
+    )
+
+
+def make_outbox_relay(
+    outbox: Outbox | None,
+    mq_publisher: MQPublisher,
+    rabbitmq_settings: RabbitMQSettings,
+) -> OutboxRelay | None:
+    """Create the relay publishing outbox messages, if enabled."""
+    if outbox is None:
+        return None
+    return OutboxRelay(
+        outbox=outbox,
+        mq_publisher=mq_publisher,
+        batch_size=rabbitmq_settings.outbox_batch_size,
+        poll_interval=rabbitmq_settings.outbox_poll_seconds,
+    )
+
+
+def make_backend_router(conf: AIAnalystSettings) -> BackendRouter:
+    """Create LLM backend router from primary and extra endpoints."""
+    backends = [
+        LLMBackend(
+            base_url=conf.base_url,
+            api_key=conf.api_key,
+            model=conf.model,
+            weight=conf.weight,
+        )
+    ]
+    backends.extend(
+        LLMBackend(
+            base_url=backend.base_url,
+            api_key=backend.api_key,
+            model=backend.model or conf.model,
+            weight=backend.weight,
+        )
+        for backend in conf.backends
+    )
+    return BackendRouter(
+        backends=backends,
+        hedge_percentile=conf.hedge_percentile,
+        eject_after_failures=conf.eject_after_failures,
+        eject_seconds=conf.eject_seconds,
+    )
+
+
+def make_ai_analyst(
+    conf: AIAnalystSettings, cache: ScoreCache | None
+) -> IVacancyScorer:
+    """Create AI Analyst instance for the configured scorer.
+
+    The embedding scorer gets a router of its own, so embedding and
+    chat requests do not share latency statistics or ejections.
+    """
+    chat = VacancyAIAnalyst(
+        router=make_backend_router(conf),
         model=conf.model,
+        max_concurrency=conf.max_concurrency,
+        cache=cache,
+        batch_size=conf.batch_sizes.get(conf.model, 1),
+        stream=conf.stream,
+    )
+    if conf.scorer == "chat":
+        return chat
+
+    return EmbeddingScorer(
+        router=make_backend_router(conf),
+        model=conf.embedding_model,
+        max_concurrency=conf.max_concurrency,
+        batch_size=conf.embedding_batch_size,
+        explainer=chat,
+        explain_threshold=conf.embedding_explain_threshold,
+        cosine_floor=conf.embedding_cosine_floor,
+        cosine_ceiling=conf.embedding_cosine_ceiling,
     )
 
 
@@ -46,45 +195,176 @@ async def main(
         rabbitmq_settings: RabbitMQ connection settings.
         publisher_settings: RabbitMQ publisher topology configuration.
     """
-    ai_analyst = make_ai_analyst(settings.ai_analyst)
-    async with MQPublisher(
-        rabbitmq_settings=rabbitmq_settings,
-        publisher_settings=publisher_settings,
-    ) as mq_publisher:
-        scheduler = ParseScheduler(settings=settings.scheduler)
+    outbox = make_outbox(rabbitmq_settings, publisher_settings)
+    try:
+        async with MQPublisher(
+            rabbitmq_settings=rabbitmq_settings,
+            publisher_settings=publisher_settings,
+        ) as mq_publisher:
+            await serve(
+                settings=settings,
+                mq_publisher=mq_publisher,
+                outbox=outbox,
+                relay=make_outbox_relay(
+                    outbox, mq_publisher, rabbitmq_settings
+                ),
+            )
+    finally:
+        log.info("Disposing database engine")
+        await DB_MANAGER.dispose_engine()
+        log.info("Observer stopped")
+
+
+async def serve(
+    settings: ScrapperSettings,
+    mq_publisher: IMessageSender,
+    outbox: Outbox | None = None,
+    relay: OutboxRelay | None = None,
+) -> None:
+    """Schedule the polling and maintenance jobs until cancelled.
+
+    The database engine is left open for the caller to dispose.
+
+    Args:
+        settings: Observer configuration settings.
+        mq_publisher: Sender of vacancies to the bot or the analyst.
+        outbox: Transactional outbox, or None to publish vacancies
+            before saving them.
+        relay: Relay publishing the outbox messages.
+    """
+    inline = settings.ai_analyst.mode == "inline"
+    score_cache = make_score_cache(settings.ai_analyst) if inline else None
+    ai_analyst = (
+        make_ai_analyst(settings.ai_analyst, cache=score_cache)
+        if inline
+        else None
+    )
+    rescore_queue = make_rescore_queue(settings.ai_analyst) if inline else None
+    ranker = make_ranker(settings.ai_analyst)
+    scoring_inputs = make_scoring_inputs(settings.ai_analyst)
+    scheduler = ParseScheduler(settings=settings.scheduler)
+    db_settings = DatabaseSettings()  # pyright: ignore[reportCallIssue]
+    repository = make_repository(db_settings=db_settings)
 
+    for idx, source in enumerate(settings.sources):
+        log.debug(
+            "Adding job for source: %s, url: %s",
+            source.source_type,
+            source.url,
+        )
+        if source.source_type == SourceType.HH:
+            scheduler.add_job(
+                job_id=source.key,
+                func=make_headhunter_polling_task(
+                    mq_publisher=mq_publisher,
+                    loader_settings=settings.httpx_settings,
+                    ai_analyst=ai_analyst,
+                    source_settings=source,
+                    repository=repository,
+                    ai_settings=settings.ai_analyst,
+                    rescore_queue=rescore_queue,
+                    ranker=ranker,
+                    scoring_inputs=scoring_inputs,
+                    outbox=outbox,
+                ).run,
+                interval_minutes=source.period_minutes,
+                stagger_first_run=True,
+                offset_seconds=idx * OFFSET_SECONDS,
+            )
+            log.debug("Added job for source: %s", source.source_type)
+
+    scheduler.add_job(
+        job_id="retention",
+        func=make_retention_task(
+            db_settings=db_settings,
+            repository=repository,
+        ).run,
+        interval_minutes=db_settings.purge_interval_minutes,
+        stagger_first_run=True,
+        offset_seconds=len(settings.sources) * OFFSET_SECONDS,
+    )
+
+    if score_cache is not None:
+        scheduler.add_job(
+            job_id="score_cache",
+            func=make_score_cache_task(cache=score_cache).run,
+            interval_minutes=(
+                settings.ai_analyst.cache_evict_interval_minutes
+            ),
+            stagger_first_run=True,
+            offset_seconds=(len(settings.sources) + 1) * OFFSET_SECONDS,
+        )
+
+    if ai_analyst is not None:
+        scheduler.add_job(
+            job_id="ai_stats",
+            func=make_ai_stats_task(ai_analyst=ai_analyst).run,
+            interval_minutes=settings.ai_analyst.stats_interval_minutes,
+            stagger_first_run=True,
+            offset_seconds=(len(settings.sources) + 2) * OFFSET_SECONDS,
+        )
+
+    if ai_analyst is not None and rescore_queue is not None:
+        scheduler.add_job(
+            job_id="rescore",
+            func=make_rescore_task(
+                queue=rescore_queue,
+                ai_analyst=ai_analyst,
+                mq_publisher=mq_publisher,
+                repository=repository,
+                resumes=ResumeRegistry(settings.sources),
+                ai_settings=settings.ai_analyst,
+                scoring_inputs=scoring_inputs,
+            ).run,
+            interval_minutes=settings.ai_analyst.retry_interval_minutes,
+            stagger_first_run=True,
+            offset_seconds=(len(settings.sources) + 3) * OFFSET_SECONDS,
+        )
+
+    if ai_analyst is not None and scoring_inputs is not None:
         for idx, source in enumerate(settings.sources):
-            log.debug(
-                "Adding job for source: %s, url: %s",
-                source.source_type,
-                source.url,
+            scheduler.add_job(
+                job_id=f"resume_rescore_{source.key}",
+                func=make_resume_rescore_task(
+                    source_settings=source,
+                    scoring_inputs=scoring_inputs,
+                    ai_analyst=ai_analyst,
+                    mq_publisher=mq_publisher,
+                    repository=repository,
+                    ai_settings=settings.ai_analyst,
+                    db_settings=db_settings,
+                ).run,
+                interval_minutes=(
+                    settings.ai_analyst.resume_rescore_interval_minutes
+                ),
+                stagger_first_run=True,
+                offset_seconds=(len(settings.sources) + 4 + idx)
+                * OFFSET_SECONDS,
             )
-            if source.source_type == SourceType.HH:
-                scheduler.add_job(
-                    job_id=f"{source.source_type.value}_{source.url}",
-                    func=make_headhunter_polling_task(
-                        mq_publisher=mq_publisher,
-                        loader_settings=settings.httpx_settings,
-                        ai_analyst=ai_analyst,
-                        source_settings=source,
-                    ).run,
-                    interval_minutes=source.period_minutes,
-                    stagger_first_run=True,
-                    offset_seconds=idx * OFFSET_SECONDS,
-                )
-                log.debug("Added job for source: %s", source.source_type)
-
-        scheduler.start()
-
-        try:
+
+    if ranker is not None:
+        scheduler.add_job(
+            job_id="ranker",
+            func=make_ranker_task(
+                ranker=ranker, feedback_log=FeedbackLog(DB_MANAGER)
+            ).run,
+            interval_minutes=settings.ai_analyst.ranker_interval_minutes,
+            stagger_first_run=False,
+            offset_seconds=0,
+        )
+
+    scheduler.start()
+
+    try:
+        # The relay is stopped first, while the database is open.
+        async with relay or contextlib.nullcontext():
             await asyncio.Event().wait()
-        finally:
-            log.info("Shutting down scheduler")
-            scheduler.shutdown()
-            log.info("Disposing database engine")
-            await DB_MANAGER.dispose_engine()
-            log.info("Exiting")
-            log.info("Observer stopped")
+    finally:
+        log.info("Shutting down scheduler")
+        scheduler.shutdown()
+        log.info("Closing repository")
+        await repository.close()
+        log.info("Exiting")
 
 
 def run_observer(
@@ -1,4 +1,14 @@
 from .base import IMessageSender
-from .rabbitmq import MQPublisher
+from .local import LocalDelivery, LocalQueue
+from .outbox import Outbox, OutboxRelay
+from .rabbitmq import RESUME_DIGEST_HEADER, MQPublisher
 
-__all__ = ("IMessageSender", "MQPublisher")
+__all__ = (
+    "RESUME_DIGEST_HEADER",
+    "IMessageSender",
+    "LocalDelivery",
+    "LocalQueue",
+    "MQPublisher",
+    "Outbox",
+    "OutboxRelay",
+)
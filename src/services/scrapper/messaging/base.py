@@ -12,3 +12,37 @@ class IMessageSender(ABC):
     async def send_message(self, vacancy: VacancyEntity) -> bool:
         """Send a message to the message broker."""
         ...
+
+    @abstractmethod
+    async def send_for_analysis(
+        self, vacancy: VacancyEntity, resume_digest: str
+    ) -> bool:
+        """Send an unscored vacancy to the AI analyst worker."""
+        ...
+
+    async def send_many(self, vacancies: list[VacancyEntity]) -> list[bool]:
+        """Send several messages to the message broker.
+
+        Returns:
+            list[bool]: Whether each vacancy was accepted, in input
+                order. Vacancies that were not must not be saved.
+        """
+        return [
+            await self.send_message(vacancy=vacancy) for vacancy in vacancies
+        ]
+
+    async def send_many_for_analysis(
+        self, vacancies: list[VacancyEntity], resume_digest: str
+    ) -> list[bool]:
+        """Send several unscored vacancies to the AI analyst worker.
+
+        Returns:
+            list[bool]: Whether each vacancy was accepted, in input
+                order. Vacancies that were not must not be saved.
+        """
+        return [
+            await self.send_for_analysis(
+                vacancy=vacancy, resume_digest=resume_digest
+            )
+            for vacancy in vacancies
+        ]
@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, insert, select
+
+from src.services.scrapper.entity import VacancyEntity
+from src.services.scrapper.models import LocalMessage
+
+from .base import IMessageSender
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.database import DatabaseManager
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class LocalDelivery:
+    """Vacancy taken from the in-process queue.
+
+    Attributes:
+        vacancy: Vacancy to deliver.
+        row_id: Id of the persisted message in a persistent queue.
+    """
+
+    vacancy: VacancyEntity
+    row_id: int | None = None
+
+
+class LocalQueue(IMessageSender):
+    """Bounded in-process queue of vacancies for the Telegram bot.
+
+    Replaces RabbitMQ when the scrapper and the bot run in one event
+    loop: vacancies are handed over as entities, without a broker or
+    serialization. A sender waits at most ``put_timeout`` seconds for
+    room in a full queue; vacancies that do not fit are reported as not
+    sent, so they are not saved and are fetched again by the next poll.
+
+    With a database manager every message is also written to the
+    ``local_messages`` table and deleted once the consumer acknowledges
+    it, so messages left in the queue at shutdown are delivered after
+    :meth:`restore` on the next start.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        put_timeout: float,
+        db_manager: DatabaseManager | None = None,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            max_size: Maximum number of queued vacancies.
+            put_timeout: Seconds to wait for room in a full queue.
+            db_manager: Database manager to persist messages with, or
+                None to keep them in memory only.
+        """
+        self._queue: asyncio.Queue[LocalDelivery] = asyncio.Queue(
+            maxsize=max_size
+        )
+        self.put_timeout = put_timeout
+        self._db_manager = db_manager
+        # Persisted messages of a previous run, delivered first.
+        self._backlog: deque[LocalDelivery] = deque()
+
+    def qsize(self) -> int:
+        """Return the number of vacancies waiting for the consumer."""
+        return self._queue.qsize() + len(self._backlog)
+
+    async def restore(self) -> int:
+        """Load messages persisted and not acknowledged by a past run.
+
+        Returns:
+            int: Number of restored messages.
+        """
+        if self._db_manager is None:
+            return 0
+
+        async with self._db_manager.session() as session:
+            rows = await session.scalars(
+                select(LocalMessage).order_by(LocalMessage.id)
+            )
+            self._backlog.extend(
+                LocalDelivery(
+                    vacancy=VacancyEntity.from_json(row.body.encode("utf-8")),
+                    row_id=row.id,
+                )
+                for row in rows
+            )
+
+        if self._backlog:
+            log.info("Restored %d queued messages", len(self._backlog))
+        return len(self._backlog)
+
+    async def _persist(
+        self, vacancies: list[VacancyEntity]
+    ) -> list[int | None]:
+        """Write messages to the database of a persistent queue."""
+        if self._db_manager is None:
+            return [None] * len(vacancies)
+
+        async def insert_messages(session: AsyncSession) -> list[int | None]:
+            ids = await session.scalars(
+                insert(LocalMessage).returning(
+                    LocalMessage.id, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "message_id": vacancy.hash,
+                        "body": vacancy.to_json().decode("utf-8"),
+                    }
+                    for vacancy in vacancies
+                ],
+            )
+            return list(ids.all())
+
+        return await self._db_manager.write(insert_messages)
+
+    async def _forget(self, row_ids: list[int]) -> None:
+        """Delete persisted messages."""
+        if self._db_manager is None or not row_ids:
+            return
+
+        async def delete_messages(session: AsyncSession) -> None:
+            await session.execute(
+                delete(LocalMessage).where(LocalMessage.id.in_(row_ids))
+            )
+
+        await self._db_manager.write(delete_messages)
+
+    async def _put_all(self, vacancies: list[VacancyEntity]) -> list[bool]:
+        """Queue vacancies in order until the queue stays full."""
+        row_ids = await self._persist(vacancies)
+        sent = [False] * len(vacancies)
+        for index, (vacancy, row_id) in enumerate(
+            zip(vacancies, row_ids, strict=True)
+        ):
+            try:
+                await asyncio.wait_for(
+                    self._queue.put(LocalDelivery(vacancy, row_id)),
+                    self.put_timeout,
+                )
+            except TimeoutError:
+                log.warning(
+                    "Local queue is full, %d vacancies not sent",
+                    len(vacancies) - index,
+                )
+                break
+            sent[index] = True
+
+        await self._forget([
+            row_id
+            for row_id, queued in zip(row_ids, sent, strict=True)
+            if row_id is not None and not queued
+        ])
+        return sent
+
+    async def send_message(self, vacancy: VacancyEntity) -> bool:
+        """Queue a vacancy for the bot."""
+        return (await self._put_all([vacancy]))[0]
+
+    async def send_many(self, vacancies: list[VacancyEntity]) -> list[bool]:
+        """Queue several vacancies, persisting them in one write."""
+        if not vacancies:
+            return []
+        return await self._put_all(vacancies)
+
+    async def send_for_analysis(
+        self, vacancy: VacancyEntity, resume_digest: str
+    ) -> bool:
+        """Reject the vacancy: no analyst worker runs in the process."""
+        log.error(
+            "No analyst worker for %s (resume %s), use the inline AI mode",
+            vacancy.hash,
+            resume_digest,
+        )
+        return False
+
+    async def get(self) -> LocalDelivery:
+        """Wait for the next vacancy to deliver."""
+        if self._backlog:
+            return self._backlog.popleft()
+        return await self._queue.get()
+
+    async def ack(self, delivery: LocalDelivery) -> None:
+        """Mark a vacancy as handled by the consumer."""
+        if delivery.row_id is not None:
+            await self._forget([delivery.row_id])
+
+
+__all__ = ("LocalDelivery", "LocalQueue")
@@ -0,0 +1,324 @@
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Final, Self
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert
+
+from src.core.utils import utcnow
+from src.services.scrapper.entity import VacancyEntity
+from src.services.scrapper.models import OutboxMessage
+
+from .rabbitmq import RESUME_DIGEST_HEADER
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.conf import RabbitMQPublisherConfig
+    from src.core.database import DatabaseManager
+
+    from .rabbitmq import MQPublisher
+
+log = logging.getLogger(__name__)
+
+NOT_CONFIRMED_ERROR: Final[str] = "Message was not confirmed by the broker"
+
+
+class Outbox:
+    """Transactional outbox of messages to RabbitMQ in SQLite.
+
+    Messages are inserted in the same transaction as the vacancies they
+    describe and published later by :class:`OutboxRelay`, so saving a
+    vacancy never waits on the broker and a crash can not separate the
+    two. Every message carries the vacancy hash as its ``message_id``,
+    which stays the same across redeliveries.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        publisher_settings: RabbitMQPublisherConfig,
+        base_delay: timedelta,
+        max_delay: timedelta,
+    ) -> None:
+        """Initialize the outbox.
+
+        Args:
+            db_manager: Database manager owning the outbox table.
+            publisher_settings: Publisher config with routing keys.
+            base_delay: Delay before the first retry of a message.
+            max_delay: Upper bound of the retry delay.
+        """
+        self._db_manager = db_manager
+        self.publisher_settings = publisher_settings
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._pending = asyncio.Event()
+
+    def delay(self, attempts: int) -> timedelta:
+        """Return the delay before the retry after ``attempts`` ones."""
+        return min(self.base_delay * 2**attempts, self.max_delay)
+
+    def message(
+        self, vacancy: VacancyEntity, resume_digest: str | None = None
+    ) -> dict[str, Any]:
+        """Build an outbox row for a vacancy.
+
+        Args:
+            vacancy: Vacancy to publish.
+            resume_digest: Digest of the resume to score against; the
+                vacancy goes to the analysis queue if it is given.
+
+        Returns:
+            dict[str, Any]: Values of the outbox row.
+        """
+        return {
+            "message_id": vacancy.hash,
+            "routing_key": (
+                self.publisher_settings.vacancy_routing_key
+                if resume_digest is None
+                else self.publisher_settings.analysis_routing_key
+            ),
+            "resume_digest": resume_digest,
+            "body": vacancy.to_json().decode("utf-8"),
+            "attempts": 0,
+            "next_attempt_at": utcnow(),
+        }
+
+    @staticmethod
+    async def stage(
+        session: AsyncSession, messages: list[dict[str, Any]]
+    ) -> None:
+        """Insert messages in the transaction of the caller.
+
+        A message already in the outbox is kept as it is.
+        """
+        if not messages:
+            return
+
+        await session.execute(
+            insert(OutboxMessage)
+            .values(messages)
+            .on_conflict_do_nothing(index_elements=[OutboxMessage.message_id])
+        )
+
+    async def add(self, messages: list[dict[str, Any]]) -> None:
+        """Insert messages in a transaction of their own."""
+
+        async def insert_messages(session: AsyncSession) -> None:
+            await self.stage(session, messages)
+
+        await self._db_manager.write(insert_messages)
+
+    def notify(self) -> None:
+        """Wake the relay up after new messages are committed."""
+        self._pending.set()
+
+    async def wait(self, poll_interval: float) -> None:
+        """Wait for new messages at most ``poll_interval`` seconds."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._pending.wait(), poll_interval)
+        self._pending.clear()
+
+    async def due(self, limit: int) -> list[OutboxMessage]:
+        """Return up to ``limit`` messages due for publishing."""
+        async with self._db_manager.session() as session:
+            messages = await session.scalars(
+                select(OutboxMessage)
+                .where(OutboxMessage.next_attempt_at <= utcnow())
+                .order_by(OutboxMessage.id)
+                .limit(limit)
+            )
+            return list(messages.all())
+
+    async def size(self) -> int:
+        """Return the number of messages waiting in the outbox."""
+        async with self._db_manager.session() as session:
+            count: int | None = await session.scalar(
+                select(func.count()).select_from(OutboxMessage)
+            )
+            return count or 0
+
+    async def delivered(self, messages: list[OutboxMessage]) -> None:
+        """Remove messages confirmed by the broker."""
+        if not messages:
+            return
+
+        ids = [message.id for message in messages]
+
+        async def delete_messages(session: AsyncSession) -> None:
+            await session.execute(
+                delete(OutboxMessage).where(OutboxMessage.id.in_(ids))
+            )
+
+        await self._db_manager.write(delete_messages)
+
+    async def reschedule(
+        self, messages: list[OutboxMessage], error: str
+    ) -> None:
+        """Schedule the next attempt of messages that failed to publish.
+
+        Messages are never given up, so every vacancy is delivered at
+        least once.
+        """
+        if not messages:
+            return
+
+        now = utcnow()
+
+        async def update_messages(session: AsyncSession) -> None:
+            for message in messages:
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id == message.id)
+                    .values(
+                        attempts=message.attempts + 1,
+                        next_attempt_at=now + self.delay(message.attempts),
+                        last_error=error,
+                    )
+                )
+
+        await self._db_manager.write(update_messages)
+
+
+class OutboxRelay:
+    """Background coroutine publishing outbox messages to RabbitMQ.
+
+    Due messages are published in batches with windowed publisher
+    confirms. Confirmed messages are removed from the outbox; the rest
+    are retried with an exponential backoff. The relay wakes up when
+    new messages are committed, or every ``poll_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        mq_publisher: MQPublisher,
+        batch_size: int,
+        poll_interval: float,
+    ) -> None:
+        """Initialize the relay.
+
+        Args:
+            outbox: Outbox to drain.
+            mq_publisher: Publisher with a confirm channel.
+            batch_size: Maximum number of messages per batch.
+            poll_interval: Seconds between checks for due retries.
+        """
+        self._outbox = outbox
+        self._mq_publisher = mq_publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    def start(self) -> None:
+        """Start the relay coroutine."""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """Relay the messages that are due and stop the coroutine."""
+        if self._task is None or self._task.done():
+            return
+
+        self._stopping = True
+        self._outbox.notify()
+        await self._task
+        self._task = None
+        log.debug("Outbox relay stopped")
+
+    async def __aenter__(self) -> Self:
+        """Start the relay."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Stop the relay."""
+        await self.stop()
+
+    async def _publish(
+        self,
+        routing_key: str,
+        resume_digest: str | None,
+        batch: list[OutboxMessage],
+    ) -> list[bool]:
+        """Publish outbox messages sharing a route and headers."""
+        return await self._mq_publisher.publish_many(
+            vacancies=[
+                VacancyEntity.from_json(message.body.encode("utf-8"))
+                for message in batch
+            ],
+            routing_key=routing_key,
+            headers=(
+                None
+                if resume_digest is None
+                else {RESUME_DIGEST_HEADER: resume_digest}
+            ),
+        )
+
+    async def relay_batch(self, messages: list[OutboxMessage]) -> int:
+        """Publish a batch of messages and record the outcome.
+
+        Returns:
+            int: Number of messages confirmed by the broker.
+        """
+        groups: defaultdict[tuple[str, str | None], list[OutboxMessage]] = (
+            defaultdict(list)
+        )
+        for message in messages:
+            groups[message.routing_key, message.resume_digest].append(message)
+
+        delivered: list[OutboxMessage] = []
+        failed: list[OutboxMessage] = []
+        for (routing_key, resume_digest), batch in groups.items():
+            sent = await self._publish(routing_key, resume_digest, batch)
+            for message, confirmed in zip(batch, sent, strict=True):
+                (delivered if confirmed else failed).append(message)
+
+        await self._outbox.delivered(delivered)
+        await self._outbox.reschedule(failed, error=NOT_CONFIRMED_ERROR)
+        if failed:
+            log.warning("%d outbox messages rescheduled", len(failed))
+        return len(delivered)
+
+    async def drain(self) -> int:
+        """Publish due messages until none is left.
+
+        Stops early when a whole batch fails, leaving the rest to the
+        backoff.
+
+        Returns:
+            int: Number of delivered messages.
+        """
+        delivered = 0
+        while messages := await self._outbox.due(self.batch_size):
+            confirmed = await self.relay_batch(messages)
+            delivered += confirmed
+            if not confirmed:
+                break
+        return delivered
+
+    async def _run(self) -> None:
+        """Drain the outbox whenever it is notified or polled."""
+        log.debug("Outbox relay started")
+        while True:
+            try:
+                delivered = await self.drain()
+            except Exception as e:  # noqa: BLE001
+                log.error("Outbox relay error: %s", e)
+            else:
+                if delivered:
+                    log.info("Relayed %d outbox messages", delivered)
+
+            if self._stopping:
+                break
+            await self._outbox.wait(poll_interval=self.poll_interval)
+
+
+__all__ = ("Outbox", "OutboxRelay")
@@ -1,5 +1,7 @@
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Final
 
 from aio_pika import DeliveryMode, Message
 from aio_pika.abc import AbstractExchange
@@ -11,11 +13,14 @@ from src.core.rabbitmq import (
     RabbitMQPublishError,
     RabbitMQSerializationError,
     RabbitMQTimeoutError,
+    encode_vacancy,
 )
 
 from .base import IMessageSender
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
     from aio_pika.abc import (
         AbstractExchange,
     )
@@ -26,6 +31,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Header naming the resume an analysis message must be scored against.
+RESUME_DIGEST_HEADER: Final[str] = "x-resume-digest"
+
 
 class MQPublisher(IMessageSender, RabbitMQClient):
     """Publisher for sending vacancies to RabbitMQ."""
@@ -39,9 +47,13 @@ class MQPublisher(IMessageSender, RabbitMQClient):
         super().__init__(
             url=rabbitmq_settings.url,
             connection_ttl=rabbitmq_settings.connection_ttl,
+            channel_pool_size=rabbitmq_settings.channel_pool_size,
         )
 
         self.publisher_settings = publisher_settings
+        self.confirm_window = rabbitmq_settings.confirm_window
+        self.wire_format = rabbitmq_settings.wire_format
+        self.compress_min_bytes = rabbitmq_settings.compress_min_bytes
         self.exchanges_map: dict[str, AbstractExchange] = {}
 
     async def _initialize(self) -> None:
@@ -73,29 +85,71 @@ class MQPublisher(IMessageSender, RabbitMQClient):
 
         log.debug("RabbitMQ connection setup complete")
 
-    async def publish_vacancy(self, vacancy: VacancyEntity) -> bool:
-        """Send a message to RabbitMQ."""
-        try:
-            exchange: AbstractExchange = self.exchanges_map[
-                self.publisher_settings.vacancy_exchange_name
-            ]
-            if exchange is None:
-                raise RabbitMQInitializeError("Exchange is not initialized")
+    @asynccontextmanager
+    async def _vacancy_exchange(self) -> AsyncGenerator[AbstractExchange]:
+        """Hold a pooled channel and yield the vacancy exchange on it.
 
-            log.debug("Publishing message: %s", vacancy)
+        Publishers holding different channels wait for their confirms
+        in parallel.
+        """
+        if self.channel_pool is None:
+            raise RabbitMQInitializeError("Channel pool is not initialized")
 
-            confirmation: (
-                Basic.Ack | Basic.Nack | Basic.Reject | None
-            ) = await exchange.publish(
-                Message(
-                    body=vacancy.to_json(),
-                    delivery_mode=DeliveryMode.PERSISTENT,
-                    message_id=vacancy.hash,
-                ),
-                routing_key=self.publisher_settings.vacancy_routing_key,
-                mandatory=True,
+        async with self.channel_pool.acquire() as channel:
+            yield await self.channel_pool.exchange(
+                channel, self.publisher_settings.vacancy_exchange_name
             )
 
+    def _message(
+        self, vacancy: VacancyEntity, headers: dict[str, str] | None
+    ) -> Message:
+        """Build a persistent message for a vacancy.
+
+        The body is encoded in the configured wire format, which is
+        announced in the content type and encoding of the message.
+        """
+        body, content_type, content_encoding = encode_vacancy(
+            vacancy.to_dict(),
+            wire_format=self.wire_format,
+            compress_min_bytes=self.compress_min_bytes,
+        )
+        return Message(
+            body=body,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            delivery_mode=DeliveryMode.PERSISTENT,
+            message_id=vacancy.hash,
+            headers=headers,
+        )
+
+    async def publish_vacancy(
+        self,
+        vacancy: VacancyEntity,
+        routing_key: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> bool:
+        """Send a message to RabbitMQ.
+
+        Args:
+            vacancy: Vacancy to publish.
+            routing_key: Routing key, the vacancy queue by default.
+            headers: Optional message headers.
+        """
+        try:
+            log.debug("Publishing message: %s", vacancy)
+
+            async with self._vacancy_exchange() as exchange:
+                confirmation: (
+                    Basic.Ack | Basic.Nack | Basic.Reject | None
+                ) = await exchange.publish(
+                    self._message(vacancy, headers),
+                    routing_key=(
+                        routing_key
+                        or self.publisher_settings.vacancy_routing_key
+                    ),
+                    mandatory=True,
+                )
+
             if isinstance(confirmation, Basic.Ack):
                 log.debug("Message acked: %s", vacancy)
                 return True
@@ -117,6 +171,93 @@ class MQPublisher(IMessageSender, RabbitMQClient):
             log.error("Failed to publish vacancy: %s", e)
             raise RabbitMQPublishError(f"Failed to publish: {e}") from e
 
+    async def publish_many(
+        self,
+        vacancies: list[VacancyEntity],
+        routing_key: str | None = None,
+        headers: dict[str, str] | None = None,
+        window: int | None = None,
+    ) -> list[bool]:
+        """Send messages to RabbitMQ without waiting for each confirm.
+
+        The batch holds one pooled channel, on which up to ``window``
+        messages are kept unconfirmed; the next message is published as
+        soon as any of them is confirmed. Acks and nacks are matched to
+        their messages by delivery tag, so one nacked or failed message
+        does not affect the others.
+
+        Args:
+            vacancies: Vacancies to publish, in publishing order.
+            routing_key: Routing key, the vacancy queue by default.
+            headers: Optional headers of every message.
+            window: Maximum number of unconfirmed messages,
+                ``confirm_window`` by default.
+
+        Returns:
+            list[bool]: Whether each vacancy was acked, in input order.
+                Vacancies that were not must not be saved.
+
+        Raises:
+            RabbitMQInitializeError: If the publisher is not connected.
+            RabbitMQConnectionError: If no channel can be opened.
+        """
+        in_flight = asyncio.Semaphore(window or self.confirm_window)
+        routing_key = (
+            routing_key or self.publisher_settings.vacancy_routing_key
+        )
+
+        async def publish(
+            exchange: AbstractExchange, vacancy: VacancyEntity
+        ) -> bool:
+            async with in_flight:
+                try:
+                    confirmation = await exchange.publish(
+                        self._message(vacancy, headers),
+                        routing_key=routing_key,
+                        mandatory=True,
+                    )
+                except Exception as e:  # noqa: BLE001
+                    log.error("Failed to publish %s: %s", vacancy.hash, e)
+                    return False
+
+            if isinstance(confirmation, Basic.Ack):
+                return True
+            log.warning("Message nacked/rejected: %s", vacancy)
+            return False
+
+        async with self._vacancy_exchange() as exchange:
+            results = await asyncio.gather(
+                *(publish(exchange, vacancy) for vacancy in vacancies)
+            )
+        log.debug(
+            "Published %d messages, %d acked", len(results), sum(results)
+        )
+        return list(results)
+
     async def send_message(self, vacancy: VacancyEntity) -> bool:
         """Send a message to the message broker."""
         return await self.publish_vacancy(vacancy=vacancy)
+
+    async def send_for_analysis(
+        self, vacancy: VacancyEntity, resume_digest: str
+    ) -> bool:
+        """Send an unscored vacancy to the AI analyst worker."""
+        return await self.publish_vacancy(
+            vacancy=vacancy,
+            routing_key=self.publisher_settings.analysis_routing_key,
+            headers={RESUME_DIGEST_HEADER: resume_digest},
+        )
+
+    async def send_many(self, vacancies: list[VacancyEntity]) -> list[bool]:
+        """Send several messages with windowed publisher confirms."""
+        return await self.publish_many(vacancies=vacancies)
+
+    async def send_many_for_analysis(
+        self, vacancies: list[VacancyEntity], resume_digest: str
+    ) -> list[bool]:
+        """Send unscored vacancies with windowed publisher confirms."""
+        return await self.publish_many(
+            vacancies=vacancies,
+            routing_key=self.publisher_settings.analysis_routing_key,
+            headers={RESUME_DIGEST_HEADER: resume_digest},
+        )
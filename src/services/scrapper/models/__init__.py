@@ -1,3 +1,19 @@
+from .cached_score import CachedScore
+from .local_message import LocalMessage
+from .outbox_message import OutboxMessage
+from .pending_score import PendingScore
+from .scoring_input import ScoringInput
 from .vacancy import Vacancy
+from .vacancy_detail import VacancyDetail
+from .vacancy_feedback import VacancyFeedback
 
-__all__ = ("Vacancy",)
+__all__ = (
+    "CachedScore",
+    "LocalMessage",
+    "OutboxMessage",
+    "PendingScore",
+    "ScoringInput",
+    "Vacancy",
+    "VacancyDetail",
+    "VacancyFeedback",
+)
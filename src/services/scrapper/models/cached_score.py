@@ -0,0 +1,23 @@
+from sqlalchemy import String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.database.mixins import IntIdMixin
+from src.core.database.types import CreatedAt
+
+
+class CachedScore(Base, IntIdMixin):
+    """AI score cached by vacancy content, resume, model and prompt."""
+
+    __table_args__ = (
+        UniqueConstraint(
+            "fingerprint", "resume_digest", "model", "prompt_version"
+        ),
+    )
+
+    fingerprint: Mapped[str] = mapped_column(String(length=64))
+    resume_digest: Mapped[str] = mapped_column(String(length=64))
+    model: Mapped[str] = mapped_column(String(length=128))
+    prompt_version: Mapped[int]
+    result: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[CreatedAt] = mapped_column(index=True)
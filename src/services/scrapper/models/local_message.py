@@ -0,0 +1,14 @@
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.database.mixins import IntIdMixin
+from src.core.database.types import CreatedAt
+
+
+class LocalMessage(Base, IntIdMixin):
+    """Message of the in-process queue not yet handled by the bot."""
+
+    message_id: Mapped[str] = mapped_column(String(length=64))
+    body: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[CreatedAt]
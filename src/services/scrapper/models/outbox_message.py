@@ -0,0 +1,23 @@
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import TIMESTAMP, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.database.mixins import IntIdMixin
+from src.core.database.types import CreatedAt, UniqueStr64
+
+
+class OutboxMessage(Base, IntIdMixin):
+    """Message saved with its vacancy and waiting to be relayed."""
+
+    message_id: Mapped[UniqueStr64]
+    routing_key: Mapped[str] = mapped_column(String(length=255))
+    resume_digest: Mapped[str | None] = mapped_column(String(length=64))
+    body: Mapped[str] = mapped_column(Text)
+    attempts: Mapped[int]
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), index=True
+    )
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[CreatedAt]
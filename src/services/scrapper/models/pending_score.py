@@ -0,0 +1,23 @@
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import TIMESTAMP, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.database.mixins import IntIdMixin
+from src.core.database.types import CreatedAt, UniqueStr64
+
+
+class PendingScore(Base, IntIdMixin):
+    """Vacancy whose AI scoring failed and is waiting to be retried."""
+
+    vacancy_hash: Mapped[UniqueStr64]
+    resume_digest: Mapped[str] = mapped_column(String(length=64))
+    vacancy: Mapped[str] = mapped_column(Text)
+    published: Mapped[bool]
+    attempts: Mapped[int]
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), index=True
+    )
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[CreatedAt]
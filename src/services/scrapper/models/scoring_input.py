@@ -0,0 +1,28 @@
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import TIMESTAMP, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.database.mixins import IntIdMixin, TimestampMixin
+from src.core.database.types import CreatedAt, UniqueStr64
+
+
+class ScoringInput(Base, IntIdMixin, TimestampMixin):
+    """Vacancy scored by the LLM, kept to re-score it later.
+
+    ``resume_digest`` identifies the resume the score was computed
+    against, so vacancies with stale scores are found after a resume
+    changes. ``claimed_until`` hides a stale input being re-scored
+    from other processes.
+    """
+
+    vacancy_hash: Mapped[UniqueStr64]
+    source: Mapped[str] = mapped_column(String(length=512))
+    resume_digest: Mapped[str] = mapped_column(String(length=64))
+    vacancy: Mapped[str] = mapped_column(Text)
+    ai_score: Mapped[int | None]
+    claimed_until: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True)
+    )
+    created_at: Mapped[CreatedAt] = mapped_column(index=True)
@@ -1,11 +1,12 @@
-from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
 from src.core.database.mixins import IntIdMixin, TimestampMixin
-from src.core.database.types import UniqueStr64
+from src.core.database.types import CreatedAt, UniqueStr64
 
 
 class Vacancy(Base, IntIdMixin, TimestampMixin):
     """Vacancy model."""
 
     hash: Mapped[UniqueStr64]
+    created_at: Mapped[CreatedAt] = mapped_column(index=True)
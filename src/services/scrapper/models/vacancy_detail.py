@@ -0,0 +1,28 @@
+from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.database.mixins import IntIdMixin, TimestampMixin
+
+
+class VacancyDetail(Base, IntIdMixin, TimestampMixin):
+    """Vacancy details model.
+
+    Indexed by the ``vacancy_details_fts`` FTS5 table, which is kept in
+    sync by triggers created in the migration.
+    """
+
+    vacancy_id: Mapped[int] = mapped_column(
+        ForeignKey("vacancys.id", ondelete="CASCADE"),
+        unique=True,
+    )
+    main_tag: Mapped[str | None] = mapped_column(String(length=128))
+    title: Mapped[str] = mapped_column(Text)
+    company: Mapped[str] = mapped_column(Text)
+    salary: Mapped[str] = mapped_column(Text)
+    location: Mapped[str] = mapped_column(Text)
+    link: Mapped[str] = mapped_column(Text)
+    description: Mapped[str] = mapped_column(Text)
+    ai_score: Mapped[int | None]
+    ai_reasons: Mapped[str | None] = mapped_column(Text)
+    missing_skills: Mapped[str | None] = mapped_column(Text)
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.database.mixins import IntIdMixin, TimestampMixin
+from src.core.database.types import UpdatedAt
+
+
+class VacancyFeedback(Base, IntIdMixin, TimestampMixin):
+    """Like or dislike of a published vacancy by a bot user."""
+
+    __table_args__ = (UniqueConstraint("vacancy_hash", "user_id"),)
+
+    vacancy_hash: Mapped[str] = mapped_column(String(length=64))
+    user_id: Mapped[int] = mapped_column(BigInteger)
+    liked: Mapped[bool]
+    updated_at: Mapped[UpdatedAt] = mapped_column(index=True)
@@ -1,4 +1,11 @@
 from .base import IRepository
+from .digest_store import DigestStoreRepository
+from .sqlite_vacancy import SQLiteVacancyRepository
 from .vacancy import VacancyRepository
 
-__all__ = ("IRepository", "VacancyRepository")
+__all__ = (
+    "DigestStoreRepository",
+    "IRepository",
+    "SQLiteVacancyRepository",
+    "VacancyRepository",
+)
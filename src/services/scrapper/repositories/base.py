@@ -1,4 +1,14 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+    from typing import Any
+
+    from src.services.scrapper.ai_analyst.retry import RescoreQueue
+    from src.services.scrapper.entity import VacancyEntity
+    from src.services.scrapper.messaging import Outbox
 
 
 class IRepository(ABC):
@@ -9,5 +19,85 @@ class IRepository(ABC):
         """Check if vacancy exists in the repository."""
 
     @abstractmethod
-    async def save(self, vacancy_hash: str) -> None:
+    async def save(self, vacancy: VacancyEntity) -> None:
         """Save vacancy to the repository."""
+
+    async def exists_many(self, vacancy_hashes: Iterable[str]) -> set[str]:
+        """Return the subset of hashes present in the repository.
+
+        Implementations should override it with a single bulk lookup.
+        """
+        return {
+            vacancy_hash
+            for vacancy_hash in vacancy_hashes
+            if await self.exists(vacancy_hash=vacancy_hash)
+        }
+
+    async def update_ai_results(self, vacancy: VacancyEntity) -> None:  # noqa: B027
+        """Store the AI score of a vacancy saved before it was scored.
+
+        Repositories that keep no vacancy details ignore it.
+        """
+
+    async def save_many(self, vacancies: Iterable[VacancyEntity]) -> None:
+        """Save several vacancies to the repository.
+
+        Implementations should override it with a single bulk write.
+        """
+        for vacancy in vacancies:
+            await self.save(vacancy=vacancy)
+
+    async def save_many_with_outbox(
+        self,
+        vacancies: list[VacancyEntity],
+        outbox: Outbox,
+        messages: list[dict[str, Any]],
+    ) -> None:
+        """Save vacancies and queue outbox messages about them.
+
+        Repositories kept in the application database override it to
+        write both in one transaction. By default the messages are
+        queued first, so a crash in between may deliver a vacancy
+        twice but never loses it.
+        """
+        await outbox.add(messages)
+        await self.save_many(vacancies)
+
+    async def save_parked(
+        self,
+        vacancy: VacancyEntity,
+        rescore_queue: RescoreQueue,
+        entry: dict[str, Any],
+        outbox: Outbox | None = None,
+        message: dict[str, Any] | None = None,
+    ) -> None:
+        """Save a vacancy whose scoring failed and queue its re-scoring.
+
+        Repositories kept in the application database override it to
+        write the vacancy, its retry queue entry and its outbox
+        message, if any, in one transaction. By default the entry and
+        the message are queued first, so a crash in between may deliver
+        a vacancy twice but never loses it.
+        """
+        if outbox is not None and message is not None:
+            await outbox.add([message])
+        await rescore_queue.add([entry])
+        await self.save(vacancy=vacancy)
+
+    @abstractmethod
+    async def purge_expired(
+        self, older_than: datetime, batch_size: int
+    ) -> int:
+        """Delete vacancies created before ``older_than``.
+
+        Args:
+            older_than: Records created before this moment are removed.
+            batch_size: Maximum number of records deleted per
+                transaction.
+
+        Returns:
+            int: Total number of deleted records.
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """Release resources held by the repository."""
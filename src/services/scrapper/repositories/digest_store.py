@@ -0,0 +1,378 @@
+import asyncio
+import heapq
+import logging
+import mmap
+import os
+import struct
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING, Final
+
+from src.core.utils import utcnow
+
+from .base import IRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+    from pathlib import Path
+
+    from src.services.scrapper.entity import VacancyEntity
+
+log = logging.getLogger(__name__)
+
+# SHA-256 digest followed by the creation time in Unix seconds.
+RECORD: Final[struct.Struct] = struct.Struct(">32sQ")
+DIGEST_SIZE: Final[int] = 32
+JOURNAL_NAME: Final[str] = "journal.log"
+MANIFEST_NAME: Final[str] = "MANIFEST"
+SEGMENT_PATTERN: Final[str] = "segment-*.bin"
+
+type DigestRecord = tuple[bytes, int]
+
+
+def fsync_directory(directory: Path) -> None:
+    """Persist directory entries after a rename or unlink."""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_manifest(directory: Path) -> list[Path] | None:
+    """Return the live segments listed in the manifest.
+
+    Returns:
+        list[Path] | None: Segment paths in generation order, or None
+            for a store written before the manifest was introduced.
+    """
+    manifest = directory / MANIFEST_NAME
+    if not manifest.exists():
+        return None
+    return [
+        directory / name
+        for name in manifest.read_text(encoding="utf-8").split()
+    ]
+
+
+def write_manifest(directory: Path, segments: Iterable[Path]) -> None:
+    """Atomically replace the list of live segments."""
+    manifest = directory / MANIFEST_NAME
+    tmp_path = manifest.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.writelines(f"{path.name}\n" for path in segments)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(manifest)
+    fsync_directory(directory)
+
+
+class ExpiryFilter:
+    """Drops records created before a cutoff and counts them."""
+
+    def __init__(self, cutoff: int) -> None:
+        """Initialize the filter.
+
+        Args:
+            cutoff: Unix time; older records are dropped.
+        """
+        self.cutoff = cutoff
+        self.dropped = 0
+
+    def apply(self, records: Iterable[DigestRecord]) -> Iterator[DigestRecord]:
+        """Yield records that are not expired."""
+        for record in records:
+            if record[1] < self.cutoff:
+                self.dropped += 1
+                continue
+            yield record
+
+
+class DigestSegment:
+    """Immutable sorted file of digest records read through ``mmap``."""
+
+    def __init__(self, path: Path) -> None:
+        """Map the segment file into memory.
+
+        Args:
+            path: Path to a non-empty segment file.
+        """
+        self.path = path
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count: int = len(self._mmap) // RECORD.size
+
+    def contains(self, digest: bytes) -> bool:
+        """Binary search for a digest."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = mid * RECORD.size
+            current = self._mmap[offset : offset + DIGEST_SIZE]
+            if current == digest:
+                return True
+            if current < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        return False
+
+    def __iter__(self) -> Iterator[DigestRecord]:
+        """Iterate over records in digest order."""
+        for index in range(self._count):
+            record: DigestRecord = RECORD.unpack_from(
+                self._mmap, index * RECORD.size
+            )
+            yield record
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return self._count
+
+    def close(self) -> None:
+        """Unmap the segment."""
+        self._mmap.close()
+
+
+class DigestStoreRepository(IRepository):
+    """Vacancy repository without a database.
+
+    Hashes are appended as fixed-size records to a journal, which is
+    periodically sorted into immutable segments. Segments are read
+    through ``mmap`` with binary search and merged once there are too
+    many of them. Only the journal tail is held in memory, so startup
+    is near-instant and memory use does not grow with the store.
+
+    The ``MANIFEST`` file lists the live segments and is replaced
+    atomically once a new segment is durable, before the segments it
+    supersedes are deleted. Segment files missing from the manifest
+    are leftovers of an interrupted compaction and are removed on open.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        compact_threshold: int = 10_000,
+        max_segments: int = 8,
+        fsync: bool = True,
+    ) -> None:
+        """Open the store, recovering from an interrupted append.
+
+        Args:
+            directory: Directory holding the journal and segments.
+            compact_threshold: Journal records that trigger compaction.
+            max_segments: Segment count that triggers a full merge.
+            fsync: Whether every append is flushed to disk.
+        """
+        self._directory = directory
+        self.compact_threshold = compact_threshold
+        self.max_segments = max_segments
+        self.fsync = fsync
+        self._lock = asyncio.Lock()
+
+        directory.mkdir(parents=True, exist_ok=True)
+        self._segments: list[DigestSegment] = [
+            DigestSegment(path) for path in self._load_manifest()
+        ]
+
+        journal_path = directory / JOURNAL_NAME
+        self._journal_fd: int = os.open(
+            journal_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        self._journal: set[bytes] = set()
+        for digest, _ in self._read_journal():
+            self._journal.add(digest)
+
+        log.info(
+            "Digest store opened: %d segments, %d journal records",
+            len(self._segments),
+            len(self._journal),
+        )
+
+    def _load_manifest(self) -> list[Path]:
+        """Return live segment paths, removing stale segment files."""
+        on_disk = sorted(self._directory.glob(SEGMENT_PATTERN))
+        live = read_manifest(self._directory)
+        if live is None:
+            live = [path for path in on_disk if path.stat().st_size]
+            write_manifest(self._directory, live)
+
+        stale = set(on_disk).difference(live)
+        for path in stale:
+            log.warning("Removing stale digest segment %s", path.name)
+            path.unlink()
+        if stale:
+            fsync_directory(self._directory)
+        return live
+
+    def _read_journal(self) -> list[DigestRecord]:
+        """Read journal records, dropping a torn trailing record."""
+        size: int = os.fstat(self._journal_fd).st_size
+        torn: int = size % RECORD.size
+        if torn:
+            log.warning("Truncating %d bytes of a torn journal write", torn)
+            os.ftruncate(self._journal_fd, size - torn)
+            size -= torn
+
+        data: bytes = os.pread(self._journal_fd, size, 0)
+        return list(RECORD.iter_unpack(data))
+
+    def _append(self, records: bytes) -> None:
+        """Append records to the journal."""
+        os.write(self._journal_fd, records)
+        if self.fsync:
+            os.fdatasync(self._journal_fd)
+
+    def _next_segment_path(self) -> Path:
+        """Return the path of the next segment generation."""
+        generation = 0
+        if self._segments:
+            generation = int(self._segments[-1].path.stem.split("-")[1]) + 1
+        return self._directory / f"segment-{generation:010d}.bin"
+
+    def _write_segment(self, records: Iterable[DigestRecord]) -> Path | None:
+        """Durably write sorted records to a new segment.
+
+        Duplicate digests are collapsed to the earliest record.
+
+        Returns:
+            Path | None: New segment path, or None when it is empty.
+        """
+        path = self._next_segment_path()
+        tmp_path = path.with_suffix(".tmp")
+        written = 0
+        with tmp_path.open("wb") as f:
+            for _, group in groupby(records, key=itemgetter(0)):
+                f.write(RECORD.pack(*next(group)))
+                written += 1
+            f.flush()
+            os.fsync(f.fileno())
+
+        if not written:
+            tmp_path.unlink()
+            return None
+
+        tmp_path.replace(path)
+        fsync_directory(self._directory)
+        return path
+
+    def _needs_full_merge(self, expire_before: int | None) -> bool:
+        """Whether compaction must rewrite all segments into one."""
+        return (
+            expire_before is not None
+            or len(self._segments) + 1 > self.max_segments
+        )
+
+    def _compact(self, expire_before: int | None) -> tuple[Path | None, int]:
+        """Move the journal into segments, merging them when needed.
+
+        Runs in a worker thread while holding the store lock. The new
+        segment becomes live when the manifest is replaced; segments
+        merged into it are deleted afterwards by the caller.
+
+        Args:
+            expire_before: Drop records created before this Unix time;
+                forces a full merge. None keeps all records.
+
+        Returns:
+            tuple[Path | None, int]: New segment path and the number
+                of dropped expired records.
+        """
+        journal: list[DigestRecord] = sorted(self._read_journal())
+
+        records: Iterable[DigestRecord] = journal
+        kept: list[Path] = [segment.path for segment in self._segments]
+        if self._needs_full_merge(expire_before):
+            records = heapq.merge(*self._segments, journal)
+            kept = []
+
+        expiry = ExpiryFilter(cutoff=expire_before or 0)
+        path = self._write_segment(expiry.apply(records))
+        write_manifest(
+            self._directory, kept if path is None else [*kept, path]
+        )
+        os.ftruncate(self._journal_fd, 0)
+        os.fsync(self._journal_fd)
+        return path, expiry.dropped
+
+    async def _run_compaction(self, expire_before: int | None = None) -> int:
+        """Compact in a thread and swap in the new segments."""
+        full_merge: bool = self._needs_full_merge(expire_before)
+        path, dropped = await asyncio.to_thread(self._compact, expire_before)
+
+        retired: list[DigestSegment] = []
+        if full_merge:
+            retired, self._segments = self._segments, []
+        if path is not None:
+            self._segments.append(DigestSegment(path))
+        self._journal.clear()
+
+        for segment in retired:
+            segment.close()
+            segment.path.unlink(missing_ok=True)
+        if retired:
+            await asyncio.to_thread(fsync_directory, self._directory)
+
+        log.info(
+            "Digest store compacted: %d segments, %d expired dropped",
+            len(self._segments),
+            dropped,
+        )
+        return dropped
+
+    async def exists(self, vacancy_hash: str) -> bool:
+        """Check if vacancy exists in the repository."""
+        digest = bytes.fromhex(vacancy_hash)
+        if digest in self._journal:
+            return True
+        return any(
+            segment.contains(digest) for segment in reversed(self._segments)
+        )
+
+    async def save(self, vacancy: VacancyEntity) -> None:
+        """Append the vacancy hash to the journal."""
+        await self.save_many(vacancies=(vacancy,))
+
+    async def save_many(self, vacancies: Iterable[VacancyEntity]) -> None:
+        """Append hashes to the journal with a single sync."""
+        created_at = int(utcnow().timestamp())
+        digests: list[bytes] = [
+            bytes.fromhex(vacancy.hash) for vacancy in vacancies
+        ]
+        if not digests:
+            return
+
+        async with self._lock:
+            await asyncio.to_thread(
+                self._append,
+                b"".join(
+                    RECORD.pack(digest, created_at) for digest in digests
+                ),
+            )
+            self._journal.update(digests)
+
+            if len(self._journal) >= self.compact_threshold:
+                await self._run_compaction()
+
+    async def purge_expired(
+        self,
+        older_than: datetime,
+        batch_size: int,  # noqa: ARG002
+    ) -> int:
+        """Drop expired hashes by rewriting the store in one merge.
+
+        Segments are immutable, so ``batch_size`` does not apply.
+        """
+        async with self._lock:
+            return await self._run_compaction(
+                expire_before=int(older_than.timestamp())
+            )
+
+    async def close(self) -> None:
+        """Close the journal and unmap all segments."""
+        async with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+            os.close(self._journal_fd)
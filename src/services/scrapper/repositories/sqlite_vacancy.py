@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Final
+
+import aiosqlite
+
+from src.services.scrapper.models import Vacancy
+
+from .vacancy import LOOKUP_CHUNK_SIZE, VacancyRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+EXISTS_MANY_SQL: Final[str] = (
+    f"SELECT hash FROM {Vacancy.__tablename__} WHERE hash IN ({{}})"  # noqa: S608
+)
+EXISTS_SQL: Final[str] = (
+    f"SELECT 1 FROM {Vacancy.__tablename__} WHERE hash = ? LIMIT 1"  # noqa: S608
+)
+
+
+class SQLiteVacancyRepository(VacancyRepository):
+    """Vacancy repository with an ORM-free read path.
+
+    Lookups bypass SQLAlchemy and run on a dedicated read-only
+    connection, where sqlite3 keeps the prepared statements cached.
+    Writes still go through the ORM and the single database writer.
+    """
+
+    def __init__(
+        self, database_path: Path, cached_statements: int = 32
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            database_path: Path to the SQLite database file.
+            cached_statements: Size of the prepared statement cache of
+                the dedicated connection.
+        """
+        self._database_path = database_path
+        self._cached_statements = cached_statements
+        self._connection: aiosqlite.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open the dedicated connection on first use."""
+        async with self._lock:
+            if self._connection is None:
+                connection = await aiosqlite.connect(
+                    self._database_path,
+                    timeout=30,
+                    cached_statements=self._cached_statements,
+                )
+                await connection.execute("PRAGMA query_only = ON")
+                self._connection = connection
+                log.debug(
+                    "Opened dedicated connection: %s", self._database_path
+                )
+
+        return self._connection
+
+    async def exists(self, vacancy_hash: str) -> bool:
+        """Check if vacancy exists in the repository."""
+        connection = self._connection or await self._connect()
+        async with connection.execute(EXISTS_SQL, (vacancy_hash,)) as cursor:
+            return await cursor.fetchone() is not None
+
+    async def exists_many(self, vacancy_hashes: Iterable[str]) -> set[str]:
+        """Return the subset of hashes present in the repository."""
+        connection = self._connection or await self._connect()
+        hashes: list[str] = list(vacancy_hashes)
+        found: set[str] = set()
+        for start in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+            chunk = hashes[start : start + LOOKUP_CHUNK_SIZE]
+            sql = EXISTS_MANY_SQL.format(",".join("?" * len(chunk)))
+            async with connection.execute(sql, chunk) as cursor:
+                found.update(row[0] for row in await cursor.fetchall())
+        return found
+
+    async def close(self) -> None:
+        """Close the dedicated connection."""
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+            log.debug("Closed dedicated connection")
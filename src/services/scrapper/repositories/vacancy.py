@@ -1,14 +1,40 @@
+import asyncio
 import logging
+from typing import TYPE_CHECKING, Any, Final
 
-from sqlalchemy import exists, insert, select
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from src.core.database import DB_MANAGER
-from src.services.scrapper.models import Vacancy
+from src.services.scrapper.models import Vacancy, VacancyDetail
 
 from .base import IRepository
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.services.scrapper.ai_analyst.retry import RescoreQueue
+    from src.services.scrapper.entity import VacancyEntity
+    from src.services.scrapper.messaging import Outbox
+
 log = logging.getLogger(__name__)
 
+# Stays well below SQLite's limit on bound parameters.
+LOOKUP_CHUNK_SIZE: Final[int] = 500
+
+
+def parse_score(value: object) -> int | None:
+    """Convert an AI score of any shape to an integer percent."""
+    if value is None:
+        return None
+    try:
+        return round(float(str(value)))
+    except ValueError:
+        return None
+
 
 class VacancyRepository(IRepository):
     """Vacancy repository."""
@@ -25,13 +51,196 @@ class VacancyRepository(IRepository):
 
             return result
 
-    async def save(self, vacancy_hash: str) -> None:
-        """Save vacancy to the repository."""
+    async def exists_many(self, vacancy_hashes: Iterable[str]) -> set[str]:
+        """Return the subset of hashes present in the repository."""
+        hashes: list[str] = list(vacancy_hashes)
+        found: set[str] = set()
         async with DB_MANAGER.session() as session:
-            try:
-                stmt = insert(Vacancy).values(hash=vacancy_hash)
-                await session.execute(stmt)
-                await session.commit()
-            except Exception as e:
-                await session.rollback()
-                log.exception("Error saving vacancy: %s", e)
+            for start in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+                chunk = hashes[start : start + LOOKUP_CHUNK_SIZE]
+                found.update(
+                    await session.scalars(
+                        select(Vacancy.hash).where(Vacancy.hash.in_(chunk))
+                    )
+                )
+        return found
+
+    @staticmethod
+    def _detail_values(
+        vacancy: VacancyEntity, vacancy_id: int | None
+    ) -> dict[str, Any]:
+        """Build a vacancy_details row for the vacancy."""
+        return {
+            "vacancy_id": vacancy_id,
+            "main_tag": vacancy.main_tag,
+            "title": vacancy.title,
+            "company": vacancy.company,
+            "salary": vacancy.salary,
+            "location": vacancy.location,
+            "link": vacancy.link,
+            "description": vacancy.description,
+            "ai_score": parse_score(vacancy.ai_score),
+            "ai_reasons": vacancy.ai_reasons,
+            "missing_skills": vacancy.ai_missing_skills,
+        }
+
+    async def save(self, vacancy: VacancyEntity) -> None:
+        """Save vacancy and its details in a single transaction."""
+
+        async def insert_vacancy(session: AsyncSession) -> None:
+            vacancy_id: int | None = await session.scalar(
+                insert(Vacancy).values(hash=vacancy.hash).returning(Vacancy.id)
+            )
+            await session.execute(
+                insert(VacancyDetail).values(
+                    self._detail_values(vacancy, vacancy_id)
+                )
+            )
+
+        try:
+            await DB_MANAGER.write(insert_vacancy)
+        except Exception as e:
+            log.exception("Error saving vacancy: %s", e)
+
+    @classmethod
+    async def _insert_many(
+        cls, session: AsyncSession, vacancies: Iterable[VacancyEntity]
+    ) -> None:
+        """Insert vacancies and their details, skipping duplicates."""
+        by_hash: dict[str, VacancyEntity] = {
+            vacancy.hash: vacancy for vacancy in vacancies
+        }
+        if not by_hash:
+            return
+
+        inserted = await session.execute(
+            sqlite_insert(Vacancy)
+            .values([{"hash": vacancy_hash} for vacancy_hash in by_hash])
+            .on_conflict_do_nothing(index_elements=[Vacancy.hash])
+            .returning(Vacancy.id, Vacancy.hash)
+        )
+        details: list[dict[str, Any]] = [
+            cls._detail_values(by_hash[row.hash], row.id) for row in inserted
+        ]
+        if details:
+            await session.execute(insert(VacancyDetail), details)
+
+    async def save_many(self, vacancies: Iterable[VacancyEntity]) -> None:
+        """Save vacancies in one write, skipping duplicates."""
+        vacancies = list(vacancies)
+        if not vacancies:
+            return
+
+        async def insert_vacancies(session: AsyncSession) -> None:
+            await self._insert_many(session, vacancies)
+
+        try:
+            await DB_MANAGER.write(insert_vacancies)
+        except Exception as e:
+            log.exception("Error saving vacancies: %s", e)
+
+    async def save_many_with_outbox(
+        self,
+        vacancies: list[VacancyEntity],
+        outbox: Outbox,
+        messages: list[dict[str, Any]],
+    ) -> None:
+        """Save vacancies and their outbox messages in one transaction.
+
+        Raises:
+            Exception: Re-raises the write error; then neither the
+                vacancies nor the messages are stored.
+        """
+
+        async def insert_all(session: AsyncSession) -> None:
+            await self._insert_many(session, vacancies)
+            await outbox.stage(session, messages)
+
+        await DB_MANAGER.write(insert_all)
+
+    async def save_parked(
+        self,
+        vacancy: VacancyEntity,
+        rescore_queue: RescoreQueue,
+        entry: dict[str, Any],
+        outbox: Outbox | None = None,
+        message: dict[str, Any] | None = None,
+    ) -> None:
+        """Save a vacancy and its re-scoring in one transaction.
+
+        Raises:
+            Exception: Re-raises the write error; then neither the
+                vacancy nor its queue entries are stored.
+        """
+
+        async def insert_all(session: AsyncSession) -> None:
+            await self._insert_many(session, [vacancy])
+            await rescore_queue.stage(session, [entry])
+            if outbox is not None and message is not None:
+                await outbox.stage(session, [message])
+
+        await DB_MANAGER.write(insert_all)
+
+    async def update_ai_results(self, vacancy: VacancyEntity) -> None:
+        """Store the AI score of a vacancy saved before scoring."""
+
+        async def update_details(session: AsyncSession) -> None:
+            await session.execute(
+                update(VacancyDetail)
+                .where(
+                    VacancyDetail.vacancy_id
+                    == select(Vacancy.id)
+                    .where(Vacancy.hash == vacancy.hash)
+                    .scalar_subquery()
+                )
+                .values(
+                    ai_score=parse_score(vacancy.ai_score),
+                    ai_reasons=vacancy.ai_reasons,
+                    missing_skills=vacancy.ai_missing_skills,
+                )
+            )
+
+        try:
+            await DB_MANAGER.write(update_details)
+        except Exception as e:
+            log.exception("Error updating vacancy AI results: %s", e)
+
+    async def purge_expired(
+        self, older_than: datetime, batch_size: int
+    ) -> int:
+        """Delete expired vacancies in small batches.
+
+        Every batch is a separate operation of the single writer, so
+        the purge never holds the write lock for long and polling
+        tasks are not blocked by it.
+        """
+        query = (
+            select(Vacancy.id)
+            .where(Vacancy.created_at < older_than)
+            .limit(batch_size)
+        )
+
+        async def delete_batch(session: AsyncSession) -> int:
+            expired_ids: list[int] = list(await session.scalars(query))
+            if expired_ids:
+                await session.execute(
+                    delete(VacancyDetail).where(
+                        VacancyDetail.vacancy_id.in_(expired_ids)
+                    )
+                )
+                await session.execute(
+                    delete(Vacancy).where(Vacancy.id.in_(expired_ids))
+                )
+            return len(expired_ids)
+
+        purged = 0
+        while True:
+            deleted: int = await DB_MANAGER.write(delete_batch)
+            purged += deleted
+            if deleted < batch_size:
+                break
+
+            await asyncio.sleep(0)
+
+        log.debug("Purged %d vacancies older than %s", purged, older_than)
+        return purged
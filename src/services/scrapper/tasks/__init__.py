@@ -1,4 +1,19 @@
+from .ai_stats_task import AIStatsTask
 from .base_task import ISchedulerTask
 from .polling_task import PollingTask
+from .ranker_task import RankerTask
+from .rescore_task import RescoreTask
+from .resume_rescore_task import ResumeRescoreTask
+from .retention_task import RetentionTask
+from .score_cache_task import ScoreCacheTask
 
-__all__ = ("ISchedulerTask", "PollingTask")
+__all__ = (
+    "AIStatsTask",
+    "ISchedulerTask",
+    "PollingTask",
+    "RankerTask",
+    "RescoreTask",
+    "ResumeRescoreTask",
+    "RetentionTask",
+    "ScoreCacheTask",
+)
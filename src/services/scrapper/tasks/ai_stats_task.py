@@ -0,0 +1,41 @@
+import logging
+from typing import TYPE_CHECKING
+
+from .base_task import ISchedulerTask
+
+if TYPE_CHECKING:
+    from src.services.scrapper.ai_analyst.base import IVacancyScorer
+
+log = logging.getLogger(__name__)
+
+
+class AIStatsTask(ISchedulerTask):
+    """A task for reporting per-backend AI scoring statistics."""
+
+    def __init__(self, ai_analyst: IVacancyScorer) -> None:
+        """Initialize task."""
+        self._ai_analyst = ai_analyst
+
+    async def run(self) -> None:
+        """Execute the AI stats task.
+
+        Logs request, error and hedge counts and latency percentiles
+        of every LLM backend accumulated since startup.
+        """
+        try:
+            for name, stats in self._ai_analyst.backend_stats().items():
+                log.info(
+                    "LLM backend %s: healthy=%s, %d requests, %d errors, "
+                    "%d hedges, p50 %s ms, p99 %s ms",
+                    name,
+                    stats["healthy"],
+                    stats["requests"],
+                    stats["errors"],
+                    stats["hedges"],
+                    stats["p50_ms"],
+                    stats["p99_ms"],
+                )
+
+        except Exception as e:
+            log.exception("Error occurred during AI stats report: %s", e)
+            raise
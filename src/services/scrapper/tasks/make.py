@@ -1,33 +1,100 @@
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from src.core.database import DB_MANAGER
+from src.services.scrapper.ai_analyst.prefilter import RelevancePrefilter
 from src.services.scrapper.loader.httpx_loader import HttpxLoader
 from src.services.scrapper.parsing.hh_parsing import HeadHunterParser
+from src.services.scrapper.repositories.digest_store import (
+    DigestStoreRepository,
+)
+from src.services.scrapper.repositories.sqlite_vacancy import (
+    SQLiteVacancyRepository,
+)
 from src.services.scrapper.repositories.vacancy import VacancyRepository
+from src.services.scrapper.tasks.ai_stats_task import AIStatsTask
 from src.services.scrapper.tasks.polling_task import PollingTask
+from src.services.scrapper.tasks.ranker_task import RankerTask
+from src.services.scrapper.tasks.rescore_task import RescoreTask
+from src.services.scrapper.tasks.resume_rescore_task import (
+    ResumeRescoreTask,
+)
+from src.services.scrapper.tasks.retention_task import RetentionTask
+from src.services.scrapper.tasks.score_cache_task import ScoreCacheTask
 
 if TYPE_CHECKING:
     from src.core.conf.classes import (
+        AIAnalystSettings,
+        DatabaseSettings,
         HttpxSettings,
         SourceSettings,
     )
-    from src.services.scrapper.ai_analyst.analyst import VacancyAIAnalyst
-    from src.services.scrapper.messaging.rabbitmq import MQPublisher
+    from src.services.scrapper.ai_analyst.analyst import ResumeRegistry
+    from src.services.scrapper.ai_analyst.base import IVacancyScorer
+    from src.services.scrapper.ai_analyst.cache import ScoreCache
+    from src.services.scrapper.ai_analyst.feedback import FeedbackLog
+    from src.services.scrapper.ai_analyst.inputs import ScoringInputStore
+    from src.services.scrapper.ai_analyst.ranker import FeedbackRanker
+    from src.services.scrapper.ai_analyst.retry import RescoreQueue
+    from src.services.scrapper.messaging import IMessageSender, Outbox
+    from src.services.scrapper.repositories.base import IRepository
     from src.services.scrapper.tasks.base_task import ISchedulerTask
 
 
+def make_repository(db_settings: DatabaseSettings) -> IRepository:
+    """Create the vacancy repository for the configured backend.
+
+    Args:
+        db_settings: Database settings with the repository backend.
+
+    Returns:
+        A repository instance shared by all tasks.
+    """
+    if db_settings.repository_backend == "sqlite":
+        return SQLiteVacancyRepository(database_path=db_settings.database_path)
+
+    if db_settings.repository_backend == "digest":
+        return DigestStoreRepository(
+            directory=db_settings.digest_store_path,
+            compact_threshold=db_settings.digest_compact_threshold,
+            max_segments=db_settings.digest_max_segments,
+            fsync=db_settings.digest_fsync,
+        )
+
+    return VacancyRepository()
+
+
 def make_headhunter_polling_task(
     source_settings: SourceSettings,
-    ai_analyst: VacancyAIAnalyst,
-    mq_publisher: MQPublisher,
+    ai_analyst: IVacancyScorer | None,
+    mq_publisher: IMessageSender,
     loader_settings: HttpxSettings,
+    repository: IRepository,
+    ai_settings: AIAnalystSettings,
+    rescore_queue: RescoreQueue | None = None,
+    ranker: FeedbackRanker | None = None,
+    scoring_inputs: ScoringInputStore | None = None,
+    outbox: Outbox | None = None,
 ) -> ISchedulerTask:
     """Create a polling task instance.
 
     Args:
         source_settings: Source settings.
-        ai_analyst: AI Analyst instance.
-        mq_publisher: The RabbitMQ publisher instance.
+        ai_analyst: AI Analyst instance, or None to hand scoring to
+            the analyst worker.
+        mq_publisher: Sender of vacancies to the bot or the analyst.
         loader_settings: HTTPX settings.
+        repository: Vacancy repository.
+        ai_settings: AI Analyst settings with the pre-filter and retry
+            options.
+        rescore_queue: Queue of failed scorings, or None to publish
+            them unscored.
+        ranker: Local ranker trained on bot feedback, shared by all
+            sources.
+        scoring_inputs: Store of LLM scoring inputs, or None to not
+            keep them for re-scoring.
+        outbox: Transactional outbox, or None to publish vacancies
+            before saving them.
 
     Returns:
         A configured PollingTask instance.
@@ -43,15 +110,165 @@ def make_headhunter_polling_task(
     tags_string: str = "#".join(source_settings.search_keywords.split(","))
     tags: list[str] = ["#" + tag for tag in tags_string.split("#") if tag]
 
+    resume: str = source_settings.resume_text
+    prefilter: RelevancePrefilter | None = None
+    if ai_settings.prefilter_threshold > 0:
+        prefilter = RelevancePrefilter(
+            resume_text=resume, threshold=ai_settings.prefilter_threshold
+        )
+
     return PollingTask(
         loader=HttpxLoader(settings=loader_settings),
         parser=HeadHunterParser(),
-        repository=VacancyRepository(),
+        repository=repository,
         mq_publisher=mq_publisher,
         ai_analyst=ai_analyst,
         main_tag=source_settings.tag,
         url=search_url,
         request_params=params,
         tags=tags,
-        resume=source_settings.resume_text,
+        resume=resume,
+        prefilter=prefilter,
+        prefilter_mode=ai_settings.prefilter_mode,
+        rescore_queue=rescore_queue,
+        retry_mode=ai_settings.retry_mode,
+        ranker=ranker,
+        source=source_settings.key,
+        resume_path=source_settings.resume,
+        scoring_inputs=scoring_inputs,
+        outbox=outbox,
+    )
+
+
+def make_retention_task(
+    db_settings: DatabaseSettings,
+    repository: IRepository,
+) -> ISchedulerTask:
+    """Create a retention task instance.
+
+    Args:
+        db_settings: Database settings with the retention window.
+        repository: Vacancy repository.
+
+    Returns:
+        A configured RetentionTask instance.
+    """
+    return RetentionTask(
+        repository=repository,
+        db_manager=(
+            None if db_settings.repository_backend == "digest" else DB_MANAGER
+        ),
+        retention_days=db_settings.retention_days,
+        batch_size=db_settings.purge_batch_size,
+        vacuum_pages=db_settings.vacuum_pages,
+    )
+
+
+def make_score_cache_task(cache: ScoreCache) -> ISchedulerTask:
+    """Create a score cache eviction task instance.
+
+    Args:
+        cache: AI score cache.
+
+    Returns:
+        A configured ScoreCacheTask instance.
+    """
+    return ScoreCacheTask(cache=cache)
+
+
+def make_ai_stats_task(ai_analyst: IVacancyScorer) -> ISchedulerTask:
+    """Create an AI backend statistics task instance.
+
+    Args:
+        ai_analyst: AI Analyst whose backends are reported.
+
+    Returns:
+        A configured AIStatsTask instance.
+    """
+    return AIStatsTask(ai_analyst=ai_analyst)
+
+
+def make_rescore_task(
+    queue: RescoreQueue,
+    ai_analyst: IVacancyScorer,
+    mq_publisher: IMessageSender,
+    repository: IRepository,
+    resumes: ResumeRegistry,
+    ai_settings: AIAnalystSettings,
+    scoring_inputs: ScoringInputStore | None = None,
+) -> ISchedulerTask:
+    """Create a task re-scoring vacancies whose scoring failed.
+
+    Args:
+        queue: Queue of failed scorings.
+        ai_analyst: AI Analyst instance.
+        mq_publisher: Publisher of vacancies scored after a retry.
+        repository: Vacancy repository.
+        resumes: Resumes of the configured sources.
+        ai_settings: AI Analyst settings with the retry budget.
+        scoring_inputs: Store of LLM scoring inputs to update.
+
+    Returns:
+        A configured RescoreTask instance.
+    """
+    return RescoreTask(
+        queue=queue,
+        ai_analyst=ai_analyst,
+        mq_publisher=mq_publisher,
+        repository=repository,
+        resumes=resumes,
+        budget=ai_settings.retry_budget,
+        scoring_inputs=scoring_inputs,
+    )
+
+
+def make_ranker_task(
+    ranker: FeedbackRanker, feedback_log: FeedbackLog
+) -> ISchedulerTask:
+    """Create a task training the local ranker on bot feedback.
+
+    Args:
+        ranker: Local ranker used by the polling tasks.
+        feedback_log: Reader of new likes and dislikes.
+
+    Returns:
+        A configured RankerTask instance.
+    """
+    return RankerTask(ranker=ranker, feedback_log=feedback_log)
+
+
+def make_resume_rescore_task(
+    source_settings: SourceSettings,
+    scoring_inputs: ScoringInputStore,
+    ai_analyst: IVacancyScorer,
+    mq_publisher: IMessageSender,
+    repository: IRepository,
+    ai_settings: AIAnalystSettings,
+    db_settings: DatabaseSettings,
+) -> ISchedulerTask:
+    """Create a task re-scoring vacancies after a resume change.
+
+    Args:
+        source_settings: Source whose resume is watched.
+        scoring_inputs: Store of LLM scoring inputs.
+        ai_analyst: AI Analyst instance.
+        mq_publisher: Publisher of score corrections.
+        repository: Vacancy repository.
+        ai_settings: AI Analyst settings with the re-scoring options.
+        db_settings: Database settings with the retention window.
+
+    Returns:
+        A configured ResumeRescoreTask instance.
+    """
+    return ResumeRescoreTask(
+        source=source_settings,
+        scoring_inputs=scoring_inputs,
+        ai_analyst=ai_analyst,
+        mq_publisher=mq_publisher,
+        repository=repository,
+        retention=timedelta(days=db_settings.retention_days),
+        min_delta=ai_settings.resume_rescore_min_delta,
+        chunk_size=ai_settings.resume_rescore_chunk_size,
+        rate_per_minute=ai_settings.resume_rescore_rate_per_minute,
+        lease=timedelta(minutes=ai_settings.resume_rescore_lease_minutes),
     )
@@ -1,18 +1,31 @@
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+from src.services.scrapper.ai_analyst.analyst import ResumePrompt
+from src.services.scrapper.ai_analyst.base import is_failed
 
 from .base_task import ISchedulerTask
 
 if TYPE_CHECKING:
-    from src.services.scrapper.ai_analyst.analyst import VacancyAIAnalyst
-    from src.services.scrapper.entity import VacanciesList
+    from pathlib import Path
+
+    from src.services.scrapper.ai_analyst import RelevancePrefilter
+    from src.services.scrapper.ai_analyst.base import IVacancyScorer
+    from src.services.scrapper.ai_analyst.inputs import ScoringInputStore
+    from src.services.scrapper.ai_analyst.ranker import FeedbackRanker
+    from src.services.scrapper.ai_analyst.retry import RescoreQueue
+    from src.services.scrapper.entity import VacanciesList, VacancyEntity
     from src.services.scrapper.loader import ILoader
-    from src.services.scrapper.messaging.rabbitmq import MQPublisher
+    from src.services.scrapper.messaging import IMessageSender, Outbox
     from src.services.scrapper.parsing import IParser
     from src.services.scrapper.repositories import IRepository
 
 log = logging.getLogger(__name__)
 
+RANKER_REASON: Final[str] = (
+    "Оценка локальной модели по реакциям в боте, AI-оценка не проводилась"
+)
+
 
 class PollingTask(ISchedulerTask):
     """A task for periodically polling the HH.ru API.
@@ -26,13 +39,22 @@ class PollingTask(ISchedulerTask):
         loader: ILoader,
         parser: IParser,
         repository: IRepository,
-        mq_publisher: MQPublisher,
-        ai_analyst: VacancyAIAnalyst,
+        mq_publisher: IMessageSender,
+        ai_analyst: IVacancyScorer | None,
         url: str,
         request_params: dict[str, str],
         main_tag: str,
         tags: list[str],
         resume: str,
+        prefilter: RelevancePrefilter | None = None,
+        prefilter_mode: Literal["skip", "low_priority"] = "low_priority",
+        rescore_queue: RescoreQueue | None = None,
+        retry_mode: Literal["gate", "publish"] = "gate",
+        ranker: FeedbackRanker | None = None,
+        source: str = "",
+        resume_path: Path | None = None,
+        scoring_inputs: ScoringInputStore | None = None,
+        outbox: Outbox | None = None,
     ) -> None:
         """Initialize task."""
         self._loader = loader
@@ -46,6 +68,308 @@ class PollingTask(ISchedulerTask):
         self.tags = tags
         self.request_params = request_params
         self.resume = resume
+        # Rebuilt only when the resume file changes, so every request
+        # of this task shares the same prompt prefix.
+        self.resume_prompt = ResumePrompt.build(resume)
+        self.resume_path = resume_path
+        self.source = source
+        self._scoring_inputs = scoring_inputs
+        self.prefilter = prefilter
+        self.prefilter_mode = prefilter_mode
+        self._rescore_queue = rescore_queue
+        self.retry_mode = retry_mode
+        self.ranker = ranker
+        self._outbox = outbox
+
+    def _refresh_resume(self) -> None:
+        """Switch to the resume file contents if its digest changed.
+
+        A resume file that can not be read, e.g. while it is being
+        rewritten, keeps the previous prompt until the next run.
+        """
+        if self.resume_path is None:
+            return
+
+        try:
+            resume = self.resume_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            log.warning(
+                "Resume %s unreadable, keeping the previous one: %s",
+                self.resume_path,
+                e,
+            )
+            return
+        prompt = ResumePrompt.build(resume)
+        if prompt.digest == self.resume_prompt.digest:
+            return
+
+        log.info("Resume changed for %s: %s", self.url, prompt.digest)
+        self.resume = resume
+        self.resume_prompt = prompt
+        if self.prefilter is not None:
+            self.prefilter.set_resume(resume)
+
+    async def _record(self, vacancies: list[VacancyEntity]) -> None:
+        """Keep scoring inputs of vacancies sent to the LLM."""
+        if self._scoring_inputs is not None:
+            await self._scoring_inputs.record(
+                vacancies=vacancies,
+                source=self.source,
+                resume_digest=self.resume_prompt.digest,
+            )
+
+    def _prefilter_results(
+        self, vacancies: list[VacancyEntity]
+    ) -> list[dict[str, Any] | None]:
+        """Build local results for vacancies rejected by the pre-filter.
+
+        The pre-filter relevance is not an AI score, so it is kept in
+        its own ``relevance`` field and ``score`` stays unset.
+
+        Returns:
+            list[dict[str, Any] | None]: A result per rejected vacancy,
+                or None for vacancies that need LLM scoring.
+        """
+        if self.prefilter is None or not vacancies:
+            return [None] * len(vacancies)
+
+        verdicts = self.prefilter.check(
+            vacancy_texts=[vacancy.description for vacancy in vacancies]
+        )
+        rejected = sum(verdict is not None for verdict in verdicts)
+        log.info(
+            "Pre-filter rejected %d of %d vacancies, %d LLM calls saved",
+            rejected,
+            len(verdicts),
+            self.prefilter.filtered,
+        )
+        return [
+            None
+            if relevance is None
+            else {"relevance": round(relevance * 100)}
+            for relevance in verdicts
+        ]
+
+    def _ranker_results(
+        self,
+        vacancies: list[VacancyEntity],
+        local_results: list[dict[str, Any] | None],
+    ) -> list[dict[str, Any] | None]:
+        """Add local results for vacancies the ranker is sure about.
+
+        Returns:
+            list[dict[str, Any] | None]: ``local_results`` with the
+                confident ranker predictions filled in.
+        """
+        pending = [
+            index for index, local in enumerate(local_results) if local is None
+        ]
+        if self.ranker is None or not pending:
+            return local_results
+
+        verdicts = self.ranker.check(
+            vacancy_texts=[
+                self.ranker.document(
+                    vacancies[index].title, vacancies[index].description
+                )
+                for index in pending
+            ]
+        )
+        results = list(local_results)
+        for index, probability in zip(pending, verdicts, strict=True):
+            if probability is not None:
+                results[index] = {
+                    "score": round(probability * 100),
+                    "main_reasons": RANKER_REASON,
+                }
+        log.info(
+            "Ranker scored %d of %d vacancies, %d LLM calls saved",
+            sum(verdict is not None for verdict in verdicts),
+            len(verdicts),
+            self.ranker.skipped,
+        )
+        return results
+
+    def _skipped(self, local: dict[str, Any] | None) -> bool:
+        """Whether a vacancy is only remembered, not published."""
+        return (
+            local is not None
+            and self.prefilter_mode == "skip"
+            and local.get("relevance") is not None
+        )
+
+    async def _defer(self, vacancy: VacancyEntity, error: str) -> bool:
+        """Park a vacancy whose scoring failed for a later retry.
+
+        In the "gate" mode the vacancy is published once it is scored,
+        in the "publish" mode it is published unscored right away.
+        Without a retry queue it is published unscored. The vacancy is
+        saved in the same transaction as its retry queue entry, so a
+        crash can not leave it saved but never scored.
+
+        Returns:
+            bool: Whether the vacancy was saved.
+        """
+        if self._rescore_queue is None:
+            # Without a retry queue the vacancy is never scored.
+            vacancy.ai_given_up = True
+            return bool(await self._send_and_save([vacancy]))
+
+        published = self.retry_mode == "publish"
+        message = None
+        if published:
+            if self._outbox is not None:
+                message = self._outbox.message(vacancy)
+            elif not await self._mq_publisher.send_message(vacancy=vacancy):
+                log.error("Failed to send vacancy to RabbitMQ: %s", vacancy)
+                return False
+
+        await self._repository.save_parked(
+            vacancy=vacancy,
+            rescore_queue=self._rescore_queue,
+            entry=self._rescore_queue.entry(
+                vacancy=vacancy,
+                resume_digest=self.resume_prompt.digest,
+                published=published,
+                error=error,
+            ),
+            outbox=self._outbox,
+            message=message,
+        )
+        if message is not None and self._outbox is not None:
+            self._outbox.notify()
+        log.info("Vacancy saved, scoring deferred: %s", vacancy.hash)
+        return True
+
+    async def _publish(
+        self,
+        new_vacancies: list[VacancyEntity],
+        local_results: list[dict[str, Any] | None],
+    ) -> None:
+        """Score new vacancies in the task and publish them."""
+        if self.ai_analyst is None:
+            raise RuntimeError("AI analyst is not configured")
+
+        # Scoring is batched and concurrent (bounded by the analyst
+        # semaphore); results are published in the original order.
+        ai_results = iter(
+            await self.ai_analyst.analyze_many(
+                vacancy_texts=[
+                    vacancy.description
+                    for vacancy, local in zip(
+                        new_vacancies, local_results, strict=True
+                    )
+                    if local is None
+                ],
+                resume=self.resume_prompt,
+            )
+        )
+
+        scored: list[VacancyEntity] = []
+        ready: list[VacancyEntity] = []
+        llm_scored: set[str] = set()
+        for vacancy, local in zip(new_vacancies, local_results, strict=True):
+            result = local if local is not None else next(ai_results)
+            vacancy.apply_ai_result(result)
+
+            if is_failed(result):
+                if await self._defer(vacancy, error=result["error"]):
+                    scored.append(vacancy)
+            elif self._skipped(local):
+                # Remembered as seen so it is not checked again.
+                await self._repository.save(vacancy=vacancy)
+                log.info("Vacancy skipped by pre-filter: %s", vacancy.hash)
+            else:
+                ready.append(vacancy)
+                if local is None:
+                    llm_scored.add(vacancy.hash)
+
+        scored.extend(
+            vacancy
+            for vacancy in await self._send_and_save(ready)
+            if vacancy.hash in llm_scored
+        )
+        await self._record(scored)
+
+    async def _send_and_save(
+        self, vacancies: list[VacancyEntity], for_analysis: bool = False
+    ) -> list[VacancyEntity]:
+        """Publish vacancies as one batch and save the accepted ones.
+
+        With an outbox the vacancies are saved together with their
+        messages in one transaction and the relay publishes them in
+        the background, so the task never waits on the broker. Without
+        it only vacancies the broker confirmed are saved; the rest are
+        fetched and scored again next time.
+
+        Args:
+            vacancies: Vacancies to publish.
+            for_analysis: Send the vacancies to the analyst worker.
+
+        Returns:
+            list[VacancyEntity]: The saved vacancies.
+        """
+        if not vacancies:
+            return []
+
+        digest = self.resume_prompt.digest if for_analysis else None
+        if self._outbox is not None:
+            await self._repository.save_many_with_outbox(
+                vacancies=vacancies,
+                outbox=self._outbox,
+                messages=[
+                    self._outbox.message(vacancy, resume_digest=digest)
+                    for vacancy in vacancies
+                ],
+            )
+            self._outbox.notify()
+            log.info("%d vacancies saved to the outbox", len(vacancies))
+            return vacancies
+
+        if digest is None:
+            sent = await self._mq_publisher.send_many(vacancies=vacancies)
+        else:
+            sent = await self._mq_publisher.send_many_for_analysis(
+                vacancies=vacancies, resume_digest=digest
+            )
+
+        saved: list[VacancyEntity] = []
+        for vacancy, accepted in zip(vacancies, sent, strict=True):
+            if accepted:
+                await self._repository.save(vacancy=vacancy)
+                saved.append(vacancy)
+                log.info("Vacancy saved and sent: %s", vacancy.hash)
+            else:
+                log.error("Failed to send vacancy to RabbitMQ: %s", vacancy)
+        return saved
+
+    async def _hand_off(
+        self,
+        new_vacancies: list[VacancyEntity],
+        local_results: list[dict[str, Any] | None],
+    ) -> None:
+        """Send new vacancies to the analyst worker unscored.
+
+        Vacancies are saved once the broker accepts them, so they are
+        deduplicated at fetch time while the worker scores them.
+        """
+        scored_locally: list[VacancyEntity] = []
+        unscored: list[VacancyEntity] = []
+        for vacancy, local in zip(new_vacancies, local_results, strict=True):
+            if local is None:
+                unscored.append(vacancy)
+                continue
+            vacancy.apply_ai_result(local)
+            if self._skipped(local):
+                await self._repository.save(vacancy=vacancy)
+                log.info("Vacancy skipped by pre-filter: %s", vacancy.hash)
+            else:
+                scored_locally.append(vacancy)
+
+        await self._send_and_save(scored_locally)
+        await self._record(
+            await self._send_and_save(unscored, for_analysis=True)
+        )
 
     async def run(self) -> None:
         """Execute the polling task.
@@ -58,6 +382,7 @@ class PollingTask(ISchedulerTask):
         """
         log.info("Polling task started for URL: %s", self.url)
         try:
+            self._refresh_resume()
             log.info("Loading HTML data from source")
             download_data: str = await self._loader.load(
                 url=self.url,
@@ -71,10 +396,14 @@ class PollingTask(ISchedulerTask):
             )
             log.info("Parsed %d vacancies from source", len(vacancies_list))
 
+            existing: set[str] = await self._repository.exists_many(
+                vacancy_hashes=vacancies_list.unique_hashes,
+            )
+
+            new_vacancies: list[VacancyEntity] = []
             for vacancy in vacancies_list:
-                if not await self._repository.exists(
-                    vacancy_hash=vacancy.hash
-                ):
+                if vacancy.hash not in existing:
+                    existing.add(vacancy.hash)
                     log.info(
                         "Processing new vacancy: %s at %s",
                         vacancy.title,
@@ -82,27 +411,18 @@ class PollingTask(ISchedulerTask):
                     )
                     vacancy.main_tag = self.main_tag
                     vacancy.tags = self.tags
-
-                    ai_data = await self.ai_analyst.analyze_score(
-                        vacancy_text=vacancy.description,
-                        resume_text=self.resume,
-                    )
-                    vacancy.ai_score = ai_data.get("score")
-                    vacancy.ai_reasons = ai_data.get("main_reasons")
-                    vacancy.ai_missing_skills = ai_data.get("missing_skills")
-
-                    if await self._mq_publisher.send_message(vacancy=vacancy):
-                        await self._repository.save(vacancy_hash=vacancy.hash)
-                        log.info(
-                            "Vacancy saved and published: %s", vacancy.hash
-                        )
-                    else:
-                        log.error(
-                            "Failed to send vacancy to RabbitMQ: %s", vacancy
-                        )
+                    new_vacancies.append(vacancy)
                 else:
                     log.info("Vacancy already exists: %s", vacancy.hash)
 
+            local_results = self._ranker_results(
+                new_vacancies, self._prefilter_results(new_vacancies)
+            )
+            if self.ai_analyst is None:
+                await self._hand_off(new_vacancies, local_results)
+            else:
+                await self._publish(new_vacancies, local_results)
+
         except Exception as e:
             log.exception("Error occurred during polling: %s", e)
             raise
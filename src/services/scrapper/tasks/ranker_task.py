@@ -0,0 +1,65 @@
+import logging
+from typing import TYPE_CHECKING, Final
+
+from .base_task import ISchedulerTask
+
+if TYPE_CHECKING:
+    from src.services.scrapper.ai_analyst.feedback import FeedbackLog
+    from src.services.scrapper.ai_analyst.ranker import FeedbackRanker
+
+log = logging.getLogger(__name__)
+
+FEEDBACK_BATCH_SIZE: Final[int] = 500
+
+
+class RankerTask(ISchedulerTask):
+    """A task for training the local ranker on new bot feedback."""
+
+    def __init__(
+        self, ranker: FeedbackRanker, feedback_log: FeedbackLog
+    ) -> None:
+        """Initialize task."""
+        self._ranker = ranker
+        self._feedback_log = feedback_log
+
+    async def _learn_new(self) -> int:
+        """Feed reactions left since the previous run to the ranker.
+
+        Returns:
+            int: Number of learned reactions.
+        """
+        learned = 0
+        while samples := await self._feedback_log.fetch_new(
+            limit=FEEDBACK_BATCH_SIZE
+        ):
+            for sample in samples:
+                self._ranker.learn(
+                    text=self._ranker.document(
+                        sample.title, sample.description
+                    ),
+                    liked=sample.liked,
+                )
+            learned += len(samples)
+        return learned
+
+    async def run(self) -> None:
+        """Execute the ranker task.
+
+        Learns from new likes and dislikes and logs how many LLM calls
+        the ranker replaced since startup.
+        """
+        try:
+            learned = await self._learn_new()
+            log.info(
+                "Ranker: %d new reactions, %d total, accuracy %.2f, "
+                "%d of %d vacancies ranked without LLM",
+                learned,
+                self._ranker.trained,
+                self._ranker.accuracy,
+                self._ranker.skipped,
+                self._ranker.checked,
+            )
+
+        except Exception as e:
+            log.exception("Error occurred during ranker training: %s", e)
+            raise
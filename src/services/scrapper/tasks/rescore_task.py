@@ -0,0 +1,161 @@
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from src.services.scrapper.ai_analyst.base import is_failed
+from src.services.scrapper.entity import VacancyEntity
+
+from .base_task import ISchedulerTask
+
+if TYPE_CHECKING:
+    from src.services.scrapper.ai_analyst.analyst import ResumeRegistry
+    from src.services.scrapper.ai_analyst.base import IVacancyScorer
+    from src.services.scrapper.ai_analyst.inputs import ScoringInputStore
+    from src.services.scrapper.ai_analyst.retry import RescoreQueue
+    from src.services.scrapper.messaging import IMessageSender
+    from src.services.scrapper.models import PendingScore
+    from src.services.scrapper.repositories import IRepository
+
+log = logging.getLogger(__name__)
+
+
+class RescoreTask(ISchedulerTask):
+    """A task for retrying AI scorings that failed.
+
+    Every run re-scores at most ``budget`` parked vacancies, so retries
+    after an outage are spread over several runs instead of competing
+    with new vacancies. The vacancies are claimed from the queue, so
+    processes sharing it never re-score the same vacancy twice.
+    """
+
+    def __init__(
+        self,
+        queue: RescoreQueue,
+        ai_analyst: IVacancyScorer,
+        mq_publisher: IMessageSender,
+        repository: IRepository,
+        resumes: ResumeRegistry,
+        budget: int,
+        scoring_inputs: ScoringInputStore | None = None,
+    ) -> None:
+        """Initialize task."""
+        self._queue = queue
+        self._ai_analyst = ai_analyst
+        self._mq_publisher = mq_publisher
+        self._repository = repository
+        self._resumes = resumes
+        self.budget = budget
+        self._scoring_inputs = scoring_inputs
+
+    async def _finish(
+        self, entry: PendingScore, vacancy: VacancyEntity
+    ) -> None:
+        """Deliver a re-scored or given up vacancy and dequeue it.
+
+        A vacancy published before it was scored only gets its score
+        stored. An unpublished one stays in the queue if it could not
+        be published, and is retried when its lease runs out.
+        """
+        if not entry.published:
+            if not await self._mq_publisher.send_message(vacancy=vacancy):
+                log.error("Failed to send vacancy to RabbitMQ: %s", vacancy)
+                return
+            log.info("Vacancy published after re-scoring: %s", vacancy.hash)
+        await self._repository.update_ai_results(vacancy=vacancy)
+        await self._queue.done(entry)
+
+    async def _give_up(
+        self, entry: PendingScore, vacancy: VacancyEntity
+    ) -> None:
+        """Deliver a vacancy that will never be scored."""
+        vacancy.ai_given_up = True
+        await self._finish(entry, vacancy)
+
+    async def _rescore(
+        self, resume_digest: str, entries: list[PendingScore]
+    ) -> int | None:
+        """Re-score the entries of one resume.
+
+        Returns:
+            int | None: Number of re-scored entries, or None if the
+                resume is unknown and the entries were given up.
+        """
+        vacancies = [
+            VacancyEntity.from_json(entry.vacancy.encode("utf-8"))
+            for entry in entries
+        ]
+        resume = self._resumes.get(resume_digest)
+        if resume is None:
+            # The resume was edited, so the score can never be
+            # computed; the vacancy is delivered as not scored.
+            log.error("Unknown resume digest: %s", resume_digest)
+            for entry, vacancy in zip(entries, vacancies, strict=True):
+                await self._give_up(entry, vacancy)
+            return None
+
+        results = await self._ai_analyst.analyze_many(
+            vacancy_texts=[vacancy.description for vacancy in vacancies],
+            resume=resume,
+        )
+        done = 0
+        for entry, vacancy, result in zip(
+            entries, vacancies, results, strict=True
+        ):
+            if not is_failed(result):
+                vacancy.apply_ai_result(result)
+                await self._finish(entry, vacancy)
+                if self._scoring_inputs is not None:
+                    await self._scoring_inputs.set_score(
+                        vacancy_hash=vacancy.hash,
+                        resume_digest=resume_digest,
+                        score=vacancy.ai_score,
+                    )
+                done += 1
+            elif not await self._queue.reschedule(entry, result["error"]):
+                await self._give_up(entry, vacancy)
+        return done
+
+    async def _rescore_due(self) -> tuple[int, int]:
+        """Re-score due vacancies grouped by resume.
+
+        Returns:
+            tuple[int, int]: Numbers of re-scored and due entries.
+        """
+        entries = await self._queue.claim(limit=self.budget)
+        groups: defaultdict[str, list[PendingScore]] = defaultdict(list)
+        for entry in entries:
+            groups[entry.resume_digest].append(entry)
+
+        handled = 0
+        pending = list(groups.items())
+        while pending:
+            resume_digest, group = pending.pop(0)
+            done = await self._rescore(resume_digest, group)
+            if done == 0:
+                break
+            handled += done or 0
+
+        await self._queue.release([
+            entry for _, group in pending for entry in group
+        ])
+        return handled, len(entries)
+
+    async def run(self) -> None:
+        """Execute the rescore task.
+
+        Re-scores due vacancies grouped by resume. A run stops at the
+        first resume whose vacancies all failed again and releases the
+        rest for the next run while the backends are down.
+        """
+        try:
+            handled, due = await self._rescore_due()
+            log.info(
+                "Re-scored %d of %d due vacancies, %d parked",
+                handled,
+                due,
+                await self._queue.size(),
+            )
+
+        except Exception as e:
+            log.exception("Error occurred during re-scoring: %s", e)
+            raise
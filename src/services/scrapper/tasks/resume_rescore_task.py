@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from src.core.utils import utcnow
+from src.services.scrapper.ai_analyst.analyst import ResumePrompt
+from src.services.scrapper.ai_analyst.base import is_failed
+from src.services.scrapper.ai_analyst.inputs import as_score
+from src.services.scrapper.entity import VacancyEntity
+
+from .base_task import ISchedulerTask
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from src.core.conf import SourceSettings
+    from src.services.scrapper.ai_analyst.base import IVacancyScorer
+    from src.services.scrapper.ai_analyst.inputs import ScoringInputStore
+    from src.services.scrapper.messaging import IMessageSender
+    from src.services.scrapper.models import ScoringInput
+    from src.services.scrapper.repositories import IRepository
+
+log = logging.getLogger(__name__)
+
+
+class ResumeRescoreTask(ISchedulerTask):
+    """A task for re-scoring recent vacancies after a resume change.
+
+    Vacancies of the source found within the retention window and
+    scored against another resume digest are re-scored in chunks of
+    ``chunk_size``. The chunk is scored concurrently, and chunks are
+    paced to at most ``rate_per_minute`` vacancies a minute so the job
+    leaves capacity for new vacancies. A correction is published only
+    if the score moved by at least ``min_delta`` points; otherwise the
+    new score is only stored. Chunks are claimed for ``lease``, so
+    every process sharing the database may run the task without
+    re-scoring a vacancy twice.
+    """
+
+    def __init__(
+        self,
+        source: SourceSettings,
+        scoring_inputs: ScoringInputStore,
+        ai_analyst: IVacancyScorer,
+        mq_publisher: IMessageSender,
+        repository: IRepository,
+        retention: timedelta,
+        min_delta: int,
+        chunk_size: int,
+        rate_per_minute: int,
+        lease: timedelta,
+    ) -> None:
+        """Initialize task."""
+        self._source = source
+        self._scoring_inputs = scoring_inputs
+        self._ai_analyst = ai_analyst
+        self._mq_publisher = mq_publisher
+        self._repository = repository
+        self.retention = retention
+        self.min_delta = min_delta
+        self.chunk_size = chunk_size
+        self.rate_per_minute = rate_per_minute
+        self.lease = lease
+
+    def _significant(
+        self, previous: int | None, vacancy: VacancyEntity
+    ) -> bool:
+        """Whether a new score differs enough to send a correction."""
+        score = as_score(vacancy.ai_score)
+        if previous is None or score is None:
+            return False
+        return abs(score - previous) >= self.min_delta
+
+    async def _rescore_chunk(
+        self, inputs: list[ScoringInput], resume: ResumePrompt
+    ) -> tuple[int, int]:
+        """Re-score a chunk of vacancies.
+
+        Vacancies that failed to score or whose correction could not
+        be published keep the stale digest and are released to be
+        retried next run.
+
+        Returns:
+            tuple[int, int]: Numbers of re-scored vacancies and sent
+                corrections.
+        """
+        vacancies = [
+            VacancyEntity.from_json(entry.vacancy.encode("utf-8"))
+            for entry in inputs
+        ]
+        results = await self._ai_analyst.analyze_many(
+            vacancy_texts=[vacancy.description for vacancy in vacancies],
+            resume=resume,
+        )
+
+        rescored = corrected = 0
+        failed: list[ScoringInput] = []
+        for entry, vacancy, result in zip(
+            inputs, vacancies, results, strict=True
+        ):
+            if is_failed(result):
+                failed.append(entry)
+                continue
+            vacancy.apply_ai_result(result)
+            if self._significant(entry.ai_score, vacancy):
+                vacancy.previous_ai_score = str(entry.ai_score)
+                if not await self._mq_publisher.send_message(vacancy=vacancy):
+                    log.error("Failed to send correction: %s", vacancy)
+                    failed.append(entry)
+                    continue
+                corrected += 1
+
+            await self._repository.update_ai_results(vacancy=vacancy)
+            await self._scoring_inputs.set_score(
+                vacancy_hash=vacancy.hash,
+                resume_digest=resume.digest,
+                score=vacancy.ai_score,
+            )
+            rescored += 1
+
+        await self._scoring_inputs.release(failed)
+        return rescored, corrected
+
+    async def _rescore_stale(
+        self, resume: ResumePrompt
+    ) -> tuple[int, int, int]:
+        """Re-score every stale vacancy of the source, chunk by chunk.
+
+        Stops early when a whole chunk fails, leaving the rest to the
+        next run.
+
+        Returns:
+            tuple[int, int, int]: Numbers of stale and re-scored
+                vacancies and sent corrections.
+        """
+        created_after = utcnow() - self.retention
+        stale = rescored = corrected = after_id = 0
+        while inputs := await self._scoring_inputs.claim_stale(
+            source=self._source.key,
+            resume_digest=resume.digest,
+            created_after=created_after,
+            after_id=after_id,
+            limit=self.chunk_size,
+            lease=self.lease,
+        ):
+            started = time.monotonic()
+            chunk_rescored, chunk_corrected = await self._rescore_chunk(
+                inputs, resume
+            )
+            stale += len(inputs)
+            rescored += chunk_rescored
+            corrected += chunk_corrected
+            after_id = inputs[-1].id
+            if not chunk_rescored:
+                break
+
+            pace = len(inputs) * 60 / self.rate_per_minute
+            await asyncio.sleep(max(0.0, pace - (time.monotonic() - started)))
+        return stale, rescored, corrected
+
+    async def run(self) -> None:
+        """Execute the resume rescore task.
+
+        Compares stored scoring inputs of the source with the digest
+        of its current resume file and re-scores the stale ones.
+        Inputs older than the retention window are purged.
+        """
+        try:
+            resume = ResumePrompt.build(self._source.resume_text)
+            purged = await self._scoring_inputs.purge(
+                older_than=utcnow() - self.retention
+            )
+            stale, rescored, corrected = await self._rescore_stale(resume)
+            log.info(
+                "Resume re-scoring for %s: %d stale, %d re-scored, "
+                "%d corrections sent, %d inputs purged",
+                self._source.key,
+                stale,
+                rescored,
+                corrected,
+                purged,
+            )
+
+        except Exception as e:
+            log.exception("Error occurred during resume re-scoring: %s", e)
+            raise
@@ -0,0 +1,62 @@
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from src.core.utils import utcnow
+
+from .base_task import ISchedulerTask
+
+if TYPE_CHECKING:
+    from src.core.database import DatabaseManager
+    from src.services.scrapper.repositories import IRepository
+
+log = logging.getLogger(__name__)
+
+
+class RetentionTask(ISchedulerTask):
+    """A task for purging vacancies older than the retention window.
+
+    RabbitMQ drops undelivered messages after ``MESSAGE_TTL``, so hashes
+    older than the retention window are no longer needed for
+    deduplication. Removing them keeps the hash index small.
+    """
+
+    def __init__(
+        self,
+        repository: IRepository,
+        db_manager: DatabaseManager | None,
+        retention_days: int,
+        batch_size: int,
+        vacuum_pages: int,
+    ) -> None:
+        """Initialize task."""
+        self._repository = repository
+        self._db_manager = db_manager
+        self.retention = timedelta(days=retention_days)
+        self.batch_size = batch_size
+        self.vacuum_pages = vacuum_pages
+
+    async def run(self) -> None:
+        """Execute the retention task.
+
+        Deletes expired vacancies in batches and reclaims freed pages
+        with an incremental vacuum when the repository uses SQLite.
+        """
+        older_than = utcnow() - self.retention
+        log.info("Retention task started, purging before %s", older_than)
+        try:
+            purged: int = await self._repository.purge_expired(
+                older_than=older_than,
+                batch_size=self.batch_size,
+            )
+            log.info("Purged %d expired vacancies", purged)
+
+            if purged and self._db_manager is not None:
+                await self._db_manager.incremental_vacuum(
+                    pages=self.vacuum_pages
+                )
+                log.info("Incremental vacuum completed")
+
+        except Exception as e:
+            log.exception("Error occurred during retention purge: %s", e)
+            raise
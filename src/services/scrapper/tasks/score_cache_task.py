@@ -0,0 +1,37 @@
+import logging
+from typing import TYPE_CHECKING
+
+from .base_task import ISchedulerTask
+
+if TYPE_CHECKING:
+    from src.services.scrapper.ai_analyst.cache import ScoreCache
+
+log = logging.getLogger(__name__)
+
+
+class ScoreCacheTask(ISchedulerTask):
+    """A task for evicting stale AI scores and reporting cache usage."""
+
+    def __init__(self, cache: ScoreCache) -> None:
+        """Initialize task."""
+        self._cache = cache
+
+    async def run(self) -> None:
+        """Execute the score cache task.
+
+        Evicts expired and excess entries and logs the hit ratio
+        accumulated since startup.
+        """
+        try:
+            evicted: int = await self._cache.evict()
+            log.info(
+                "Score cache: %d evicted, %d hits, %d misses, hit ratio %.2f",
+                evicted,
+                self._cache.hits,
+                self._cache.misses,
+                self._cache.hit_ratio,
+            )
+
+        except Exception as e:
+            log.exception("Error occurred during score cache eviction: %s", e)
+            raise
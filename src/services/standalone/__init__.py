@@ -0,0 +1,3 @@
+from .main import run_standalone
+
+__all__ = ["run_standalone"]
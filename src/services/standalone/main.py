@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from src.core.database import DB_MANAGER
+from src.services.scrapper.main import serve as serve_scrapper
+from src.services.scrapper.messaging import LocalQueue
+from src.services.tg_bot.bot import serve as serve_bot
+from src.services.tg_bot.consumer import local_consumer
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+    from src.core.conf import (
+        LocalQueueSettings,
+        ScrapperSettings,
+        TgBotConfig,
+    )
+
+
+log = logging.getLogger(__name__)
+
+
+def make_local_queue(queue_settings: LocalQueueSettings) -> LocalQueue:
+    """Create the in-process queue between the scrapper and the bot."""
+    return LocalQueue(
+        max_size=queue_settings.max_size,
+        put_timeout=queue_settings.put_timeout_seconds,
+        db_manager=DB_MANAGER if queue_settings.persistent else None,
+    )
+
+
+async def main(
+    settings: ScrapperSettings,
+    tg_bot_config: TgBotConfig,
+    queue_settings: LocalQueueSettings,
+) -> None:
+    """Run the scrapper and the Telegram bot in one event loop.
+
+    Vacancies go from the polling tasks to the bot through an
+    in-process queue instead of RabbitMQ. The scrapper is stopped when
+    the bot stops, and the bot is stopped when the scrapper fails, so
+    the process never keeps running half of the service.
+
+    Args:
+        settings: Scrapper configuration settings.
+        tg_bot_config: Telegram bot configuration.
+        queue_settings: In-process queue settings.
+
+    Raises:
+        ValueError: If vacancies are to be scored by the analyst
+            worker, which needs RabbitMQ.
+    """
+    if settings.ai_analyst.mode != "inline":
+        raise ValueError('Standalone mode needs ai_analyst.mode = "inline"')
+
+    queue = make_local_queue(queue_settings)
+    await queue.restore()
+
+    async def consume(bot: Bot) -> None:
+        await local_consumer(
+            bot=bot,
+            queue=queue,
+            user_ids=tg_bot_config.user_ids,
+            send_timeout=10,
+        )
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            scrapper = group.create_task(
+                serve_scrapper(settings=settings, mq_publisher=queue),
+                name="scrapper",
+            )
+            await serve_bot(tg_bot_config=tg_bot_config, consume=consume)
+            log.info("Stopping scrapper")
+            scrapper.cancel()
+    finally:
+        await DB_MANAGER.dispose_engine()
+        log.info("Database engine disposed")
+
+
+def run_standalone(
+    settings: ScrapperSettings,
+    tg_bot_config: TgBotConfig,
+    queue_settings: LocalQueueSettings,
+) -> None:
+    """Entry point for running the scrapper and the bot together.
+
+    Args:
+        settings: Scrapper configuration settings.
+        tg_bot_config: Telegram bot configuration.
+        queue_settings: In-process queue settings.
+    """
+    log.info("Starting standalone mode...")
+    asyncio.run(
+        main(
+            settings=settings,
+            tg_bot_config=tg_bot_config,
+            queue_settings=queue_settings,
+        )
+    )
+    log.info("Standalone mode stopped")
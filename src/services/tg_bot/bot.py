@@ -1,14 +1,21 @@
 import asyncio
+import contextlib
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from aiogram import Bot, Dispatcher
 from aiogram.types import BotCommand
 
+from src.core.database import DB_MANAGER
+
 from .consumer import rabbit_consumer
+from .feedback import FeedbackStore
 from .handlers import register_commands
+from .search import VacancySearch
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
     from src.core.conf.classes import RabbitMQSettings, TgBotConfig
     from src.core.conf.mq_topology import RabbitMQConsumerConfig
 
@@ -18,6 +25,7 @@ log = logging.getLogger(__name__)
 
 DEFAULT_COMMANDS: list[BotCommand] = [
     BotCommand(command="start", description="Start the bot"),
+    BotCommand(command="search", description="Search saved vacancies"),
 ]
 
 
@@ -54,13 +62,6 @@ async def main(
 ) -> None:
     """Initialize and run all bot components.
 
-    This async function performs the following steps:
-    1. Creates Dispatcher and Bot instances
-    2. Registers command handlers
-    3. Sets bot commands for the Telegram menu
-    4. Starts the RabbitMQ consumer task
-    5. Starts polling for Telegram updates
-
     Args:
         tg_bot_config:
             Telegram bot configuration. including token and user IDs.
@@ -70,11 +71,50 @@ async def main(
             Consumer configuration including queue settings.
 
     """
-    log.info("Waiting 60s for RabbitMQ topology to be ready...")
-    await asyncio.sleep(60)
 
+    async def consume(bot: Bot) -> None:
+        await rabbit_consumer(
+            bot=bot,
+            rabbitmq_settings=rabbitmq_settings,
+            consumer_config=consumer_config,
+            user_ids=tg_bot_config.user_ids,
+            send_timeout=10,
+        )
+
+    try:
+        await serve(tg_bot_config=tg_bot_config, consume=consume)
+    finally:
+        await DB_MANAGER.dispose_engine()
+        log.info("Database engine disposed")
+
+
+async def serve(
+    tg_bot_config: TgBotConfig,
+    consume: Callable[[Bot], Coroutine[Any, Any, None]],
+) -> None:
+    """Run the bot with a consumer of vacancy messages.
+
+    This async function performs the following steps:
+    1. Creates Dispatcher and Bot instances
+    2. Registers command handlers
+    3. Sets bot commands for the Telegram menu
+    4. Starts the consumer task
+    5. Starts polling for Telegram updates
+
+    The database engine is left open for the caller to dispose.
+
+    Args:
+        tg_bot_config:
+            Telegram bot configuration. including token and user IDs.
+        consume:
+            Coroutine function delivering vacancies with the bot.
+    """
     log.info("Initializing dispatcher and bot...")
-    dp = Dispatcher()
+    dp = Dispatcher(
+        vacancy_search=VacancySearch(db_manager=DB_MANAGER),
+        feedback_store=FeedbackStore(db_manager=DB_MANAGER),
+        user_ids=tg_bot_config.user_ids,
+    )
     bot = Bot(token=tg_bot_config.token)
     log.info("Bot initialized for user_ids=%s", tg_bot_config.user_ids)
 
@@ -86,16 +126,8 @@ async def main(
     )
     await bot.set_my_commands(DEFAULT_COMMANDS)
 
-    log.info("Starting RabbitMQ consumer task...")
-    consumer_task = asyncio.create_task(
-        rabbit_consumer(
-            bot=bot,
-            rabbitmq_settings=rabbitmq_settings,
-            consumer_config=consumer_config,
-            user_ids=tg_bot_config.user_ids,
-            send_timeout=10,
-        )
-    )
+    log.info("Starting consumer task...")
+    consumer_task = asyncio.create_task(consume(bot))
 
     try:
         log.info("Starting polling...")
@@ -105,6 +137,7 @@ async def main(
     finally:
         log.info("Shutting down...")
         consumer_task.cancel()
-        await consumer_task
+        with contextlib.suppress(asyncio.CancelledError):
+            await consumer_task
         await bot.session.close()
         log.info("Bot session closed")
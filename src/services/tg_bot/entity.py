@@ -1,14 +1,41 @@
+import base64
 import json
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Self
+from typing import Any, Self
 
+from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
+from src.core.rabbitmq import decode_vacancy
+
 log = logging.getLogger(__name__)
 
 
+class FeedbackCallback(CallbackData, prefix="fb"):
+    """Callback data for like and dislike buttons.
+
+    The SHA-256 vacancy hash is packed as unpadded base64url, so the
+    data fits into the 64 bytes Telegram allows.
+    """
+
+    vacancy: str
+    liked: bool
+
+    @classmethod
+    def for_vacancy(cls, vacancy_hash: str, liked: bool) -> Self:
+        """Build callback data for a vacancy hash."""
+        packed = base64.urlsafe_b64encode(bytes.fromhex(vacancy_hash))
+        return cls(vacancy=packed.rstrip(b"=").decode("ascii"), liked=liked)
+
+    @property
+    def vacancy_hash(self) -> str:
+        """Hex vacancy hash the callback refers to."""
+        padding = "=" * (-len(self.vacancy) % 4)
+        return base64.urlsafe_b64decode(self.vacancy + padding).hex()
+
+
 class IReceivedConsumedMessage(ABC):
     """Abstract base interface for received consumed messages.
 
@@ -57,6 +84,13 @@ class RecivedVacancyEntity(IReceivedConsumedMessage):
         link: URL to apply for the position or view details.
         location: Geographic location of the position.
         date: Date when the vacancy was posted.
+        vacancy_hash: Vacancy fingerprint used for feedback, if sent.
+        previous_ai_score: Score published before the resume changed,
+            set for score corrections.
+        relevance: Local pre-filter relevance of a vacancy sent without
+            AI scoring.
+        ai_given_up: Whether AI scoring failed for good, so the vacancy
+            will not be scored later.
     """
 
     main_tag: str
@@ -69,24 +103,41 @@ class RecivedVacancyEntity(IReceivedConsumedMessage):
     link: str
     location: str
     date: str
-    ai_score: str
+    ai_score: str | None
     ai_reasons: str
     ai_missing_skills: str
+    vacancy_hash: str | None = None
+    previous_ai_score: str | None = None
+    relevance: int | None = None
+    ai_given_up: bool = False
 
     def create_keyboard(self) -> InlineKeyboardMarkup:
-        """Create inline keyboard with action button.
+        """Create inline keyboard with action buttons.
 
-        Creates an inline keyboard markup with a single button
-        that links to the vacancy application page.
+        Creates an inline keyboard markup with a button that links to
+        the vacancy application page and, when the vacancy hash is
+        known, like and dislike buttons.
 
         Returns:
             InlineKeyboardMarkup: Keyboard with 'Подробнее' button.
         """
-        return InlineKeyboardMarkup(
-            inline_keyboard=[
-                [InlineKeyboardButton(text="📌 Подробнее", url=self.link)]
-            ]
-        )
+        keyboard = [[InlineKeyboardButton(text="📌 Подробнее", url=self.link)]]
+        if self.vacancy_hash is not None:
+            keyboard.append([
+                InlineKeyboardButton(
+                    text="👍",
+                    callback_data=FeedbackCallback.for_vacancy(
+                        self.vacancy_hash, liked=True
+                    ).pack(),
+                ),
+                InlineKeyboardButton(
+                    text="👎",
+                    callback_data=FeedbackCallback.for_vacancy(
+                        self.vacancy_hash, liked=False
+                    ).pack(),
+                ),
+            ])
+        return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
     def format_message(self) -> str:
         """Format vacancy data as HTML message.
@@ -98,7 +149,33 @@ class RecivedVacancyEntity(IReceivedConsumedMessage):
         Returns:
             str: Formatted vacancy message ready for Telegram.
         """
+        if self.ai_score is None and self.relevance is not None:
+            score = (
+                f"Низкая релевантность резюме по локальному фильтру "
+                f"({self.relevance} %), AI-оценка не проводилась\n\n"
+            )
+        elif self.ai_score is None and self.ai_given_up:
+            score = "AI-оценка недоступна: вакансию не удалось оценить\n\n"
+        elif self.ai_score is None:
+            # Published before the AI scoring, which is retried later.
+            score = "AI-оценка отложена, вакансия будет оценена позже\n\n"
+        else:
+            score = (
+                f"AI analyst:\n"
+                f"<i>''{self.ai_reasons}''</i>\n\n"
+                f"Missings stack: {self.ai_missing_skills}\n\n"
+                f"Подходит на <b>{self.ai_score} %</b>\n\n"
+            )
+        correction = (
+            ""
+            if self.previous_ai_score is None
+            else (
+                f"🔄 Оценка обновлена после изменения резюме: "
+                f"{self.previous_ai_score} % → {self.ai_score} %\n\n"
+            )
+        )
         return (
+            f"{correction}"
             f"#{self.main_tag} {' '.join(self.tags)}\n"
             f"<b>{self.title}</b>\n\n"
             f"Компания: {self.company}\n"
@@ -107,28 +184,60 @@ class RecivedVacancyEntity(IReceivedConsumedMessage):
             f"Опыт работы: {self.experience}\n"
             f"Дата: {self.date}\n\n"
             f"Описание:\n{self.description}\n\n"
-            f"AI analyst:\n"
-            f"<i>''{self.ai_reasons}''</i>\n\n"
-            f"Missings stack: {self.ai_missing_skills}\n\n"
-            f"Подходит на <b>{self.ai_score} %</b>\n\n"
+            f"{score}"
         )
 
     @classmethod
     def from_json(cls, json_bytes: bytes) -> Self:
         """Create vacancy entity from JSON bytes.
 
-        Parses JSON data and extracts vacancy fields with fallback
-        to 'unoknown' for missing fields.
-
         Args:
             json_bytes: Raw JSON bytes containing vacancy data.
 
         Returns:
             Self: New RecivedVacancyEntity instance.
         """
-        log.debug("Parsing vacancy JSON: %s", json_bytes)
-        data: dict[str, str] = json.loads(json_bytes.decode("utf-8"))
-        log.debug("Parsed vacancy data: %s", data)
+        return cls.from_dict(json.loads(json_bytes.decode("utf-8")))
+
+    @classmethod
+    def from_message(
+        cls,
+        body: bytes,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+    ) -> Self:
+        """Create vacancy entity from a message in any wire format.
+
+        Args:
+            body: Raw message body.
+            content_type: AMQP content type of the message; JSON if
+                missing.
+            content_encoding: AMQP content encoding of the message.
+
+        Returns:
+            Self: New RecivedVacancyEntity instance.
+
+        Raises:
+            RabbitMQSerializationError: If the body can not be decoded.
+        """
+        return cls.from_dict(
+            decode_vacancy(body, content_type, content_encoding)
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Create vacancy entity from decoded vacancy fields.
+
+        Extracts vacancy fields with fallback to 'unoknown' for missing
+        fields.
+
+        Args:
+            data: Vacancy fields.
+
+        Returns:
+            Self: New RecivedVacancyEntity instance.
+        """
+        log.debug("Parsed vacancy %s", data.get("hash"))
 
         title: str = data.get("title", "unoknown")
         main_tag: str = data.get("main_tag", "unoknown")
@@ -141,9 +250,13 @@ class RecivedVacancyEntity(IReceivedConsumedMessage):
         link: str = data.get("link", "unoknown")
         location: str = data.get("location", "unoknown")
         date: str = data.get("date", "unoknown")
-        ai_score: str = data.get("ai_score", "000")
+        ai_score: str | None = data.get("ai_score", "000")
         ai_reasons: str = data.get("ai_reasons", "skill empty")
         ai_missing_skills: str = data.get("ai_missing_skills", "not found")
+        vacancy_hash: str | None = data.get("hash")
+        previous_ai_score: str | None = data.get("previous_ai_score")
+        relevance: int | None = data.get("relevance")
+        ai_given_up: bool = bool(data.get("ai_given_up"))
 
         entity = cls(
             main_tag=main_tag,
@@ -159,6 +272,10 @@ class RecivedVacancyEntity(IReceivedConsumedMessage):
             ai_score=ai_score,
             ai_reasons=ai_reasons,
             ai_missing_skills=ai_missing_skills,
+            vacancy_hash=vacancy_hash,
+            previous_ai_score=previous_ai_score,
+            relevance=relevance,
+            ai_given_up=ai_given_up,
         )
         log.debug("Created RecivedVacancyEntity: %s", entity)
         return entity
@@ -175,4 +292,8 @@ class RecivedVacancyEntity(IReceivedConsumedMessage):
         )
 
 
-__all__ = ("IReceivedConsumedMessage", "RecivedVacancyEntity")
+__all__ = (
+    "FeedbackCallback",
+    "IReceivedConsumedMessage",
+    "RecivedVacancyEntity",
+)
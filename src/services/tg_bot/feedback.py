@@ -0,0 +1,63 @@
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy.dialects.sqlite import insert
+
+from src.core.utils import utcnow
+from src.services.scrapper.models import VacancyFeedback
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.database import DatabaseManager
+
+log = logging.getLogger(__name__)
+
+
+class FeedbackStore:
+    """Stores likes and dislikes of published vacancies.
+
+    The scrapper trains its local ranker on them.
+    """
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """Initialize the store.
+
+        Args:
+            db_manager: Database manager owning the feedback table.
+        """
+        self._db_manager = db_manager
+
+    async def save(self, vacancy_hash: str, user_id: int, liked: bool) -> None:
+        """Store a reaction, replacing the user's previous one."""
+
+        async def upsert(session: AsyncSession) -> None:
+            statement = insert(VacancyFeedback).values(
+                vacancy_hash=vacancy_hash,
+                user_id=user_id,
+                liked=liked,
+                updated_at=utcnow(),
+            )
+            await session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        VacancyFeedback.vacancy_hash,
+                        VacancyFeedback.user_id,
+                    ],
+                    set_={
+                        "liked": statement.excluded.liked,
+                        "updated_at": statement.excluded.updated_at,
+                    },
+                )
+            )
+
+        await self._db_manager.write(upsert)
+        log.debug(
+            "Feedback from user_id=%s on %s: liked=%s",
+            user_id,
+            vacancy_hash,
+            liked,
+        )
+
+
+__all__ = ("FeedbackStore",)
@@ -1,11 +1,34 @@
+import html
+import logging
 from typing import TYPE_CHECKING
 
 from aiogram.enums import ParseMode
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import (
+    CallbackQuery,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    Message,
+)
+
+from .entity import FeedbackCallback
 
 if TYPE_CHECKING:
     from aiogram import Dispatcher
-    from aiogram.types import Message
+
+    from .feedback import FeedbackStore
+    from .search import SearchPage, VacancySearch
+
+
+log = logging.getLogger(__name__)
+
+
+class SearchCallback(CallbackData, prefix="search"):
+    """Callback data for search result pagination."""
+
+    page: int
+    query: str
 
 
 async def command_start_handler(message: Message) -> None:
@@ -34,6 +57,166 @@ async def command_start_handler(message: Message) -> None:
     )
 
 
+def format_search_page(search_page: SearchPage) -> str:
+    """Format search results as HTML message.
+
+    Args:
+        search_page: Page of search results.
+
+    Returns:
+        str: Formatted message ready for Telegram.
+    """
+    if not search_page.hits:
+        return "Nothing found."
+
+    offset: int = search_page.page * search_page.page_size
+    header: str = (
+        f"Search: <b>{html.escape(search_page.query)}</b>, "
+        f"page {search_page.page + 1}\n"
+    )
+    lines: list[str] = [header]
+    for number, hit in enumerate(search_page.hits, start=offset + 1):
+        score: str = f"{hit.ai_score} %" if hit.ai_score is not None else "-"
+        lines.append(
+            f"{number}. <b>{html.escape(hit.title)}</b>\n"
+            f"{html.escape(hit.company)} · {html.escape(hit.salary)}\n"
+            f"{html.escape(hit.location)} · {score} · {hit.created_at}\n"
+            f'<a href="{html.escape(hit.link)}">Подробнее</a>\n'
+        )
+    return "\n".join(lines)
+
+
+def create_search_keyboard(
+    search_page: SearchPage,
+) -> InlineKeyboardMarkup | None:
+    """Create pagination keyboard for search results.
+
+    Returns None when there is nothing to paginate or the query is too
+    long to fit into Telegram callback data.
+    """
+    buttons: list[InlineKeyboardButton] = []
+    try:
+        if search_page.page > 0:
+            buttons.append(
+                InlineKeyboardButton(
+                    text="⬅️",
+                    callback_data=SearchCallback(
+                        page=search_page.page - 1, query=search_page.query
+                    ).pack(),
+                )
+            )
+        if search_page.has_next:
+            buttons.append(
+                InlineKeyboardButton(
+                    text="➡️",
+                    callback_data=SearchCallback(
+                        page=search_page.page + 1, query=search_page.query
+                    ).pack(),
+                )
+            )
+    except ValueError:
+        log.debug("Query too long for pagination: %s", search_page.query)
+        return None
+
+    if not buttons:
+        return None
+
+    return InlineKeyboardMarkup(inline_keyboard=[buttons])
+
+
+async def command_search_handler(
+    message: Message,
+    command: CommandObject,
+    vacancy_search: VacancySearch,
+    user_ids: list[int],
+) -> None:
+    """Handle the /search command.
+
+    Runs a full-text search over stored vacancies and answers with
+    the first page of ranked results.
+
+    Args:
+        message: The incoming message.
+        command: Parsed command with the search query as arguments.
+        vacancy_search: Vacancy search service.
+        user_ids: Telegram user IDs allowed to search.
+    """
+    if not message.from_user or message.from_user.id not in user_ids:
+        await message.answer("Access denied.")
+        return
+
+    if not command.args:
+        await message.answer("Usage: /search <query>")
+        return
+
+    search_page: SearchPage = await vacancy_search.search(command.args)
+    await message.answer(
+        format_search_page(search_page),
+        parse_mode=ParseMode.HTML,
+        reply_markup=create_search_keyboard(search_page),
+        disable_web_page_preview=True,
+    )
+
+
+async def search_page_callback_handler(
+    callback: CallbackQuery,
+    callback_data: SearchCallback,
+    vacancy_search: VacancySearch,
+    user_ids: list[int],
+) -> None:
+    """Handle search pagination buttons.
+
+    Args:
+        callback: The incoming callback query.
+        callback_data: Query and requested page.
+        vacancy_search: Vacancy search service.
+        user_ids: Telegram user IDs allowed to search.
+    """
+    if callback.from_user.id not in user_ids or not isinstance(
+        callback.message, Message
+    ):
+        await callback.answer()
+        return
+
+    search_page: SearchPage = await vacancy_search.search(
+        query=callback_data.query,
+        page=callback_data.page,
+    )
+    await callback.message.edit_text(
+        format_search_page(search_page),
+        parse_mode=ParseMode.HTML,
+        reply_markup=create_search_keyboard(search_page),
+        disable_web_page_preview=True,
+    )
+    await callback.answer()
+
+
+async def feedback_callback_handler(
+    callback: CallbackQuery,
+    callback_data: FeedbackCallback,
+    feedback_store: FeedbackStore,
+    user_ids: list[int],
+) -> None:
+    """Handle like and dislike buttons of a vacancy message.
+
+    Args:
+        callback: The incoming callback query.
+        callback_data: Vacancy and reaction.
+        feedback_store: Vacancy feedback storage.
+        user_ids: Telegram user IDs allowed to leave feedback.
+    """
+    if callback.from_user.id not in user_ids:
+        await callback.answer()
+        return
+
+    await feedback_store.save(
+        vacancy_hash=callback_data.vacancy_hash,
+        user_id=callback.from_user.id,
+        liked=callback_data.liked,
+    )
+    await callback.answer("👍 Учтено" if callback_data.liked else "👎 Учтено")
+
+
 def register_commands(dp: Dispatcher) -> None:
     """Register command handlers with the dispatcher.
 
@@ -45,6 +228,13 @@ def register_commands(dp: Dispatcher) -> None:
 
     """
     dp.message.register(command_start_handler, Command("start"))
+    dp.message.register(command_search_handler, Command("search"))
+    dp.callback_query.register(
+        search_page_callback_handler, SearchCallback.filter()
+    )
+    dp.callback_query.register(
+        feedback_callback_handler, FeedbackCallback.filter()
+    )
 
 
 __all__ = ("register_commands",)
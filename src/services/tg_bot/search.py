@@ -0,0 +1,144 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from src.core.database import DatabaseManager
+
+log = logging.getLogger(__name__)
+
+TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+")
+
+# bm25 weights: title, company, description, missing_skills.
+SEARCH_QUERY: Final = text(
+    """
+    SELECT d.title, d.company, d.salary, d.location, d.link,
+           d.ai_score, d.created_at
+    FROM vacancy_details_fts AS f
+    JOIN vacancy_details AS d ON d.id = f.rowid
+    WHERE vacancy_details_fts MATCH :match
+    ORDER BY bm25(vacancy_details_fts, 10.0, 5.0, 1.0, 2.0)
+    LIMIT :limit OFFSET :offset
+    """
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    """A single vacancy found by full-text search."""
+
+    title: str
+    company: str
+    salary: str
+    location: str
+    link: str
+    ai_score: int | None
+    created_at: str
+
+
+@dataclass(frozen=True, slots=True)
+class SearchPage:
+    """A page of ranked search results.
+
+    Attributes:
+        query: Normalized search query.
+        page: Zero-based page number.
+        page_size: Number of results per full page.
+        hits: Vacancies on the page, best match first.
+        has_next: Whether another page is available.
+    """
+
+    query: str
+    page: int
+    page_size: int
+    hits: list[SearchHit]
+    has_next: bool
+
+
+def normalize_query(query: str) -> str:
+    """Reduce a user query to space-separated word tokens."""
+    return " ".join(TOKEN_PATTERN.findall(query.lower()))
+
+
+class VacancySearch:
+    """Full-text search over stored vacancies."""
+
+    def __init__(
+        self, db_manager: DatabaseManager, page_size: int = 5
+    ) -> None:
+        """Initialize the search.
+
+        Args:
+            db_manager: Database manager providing sessions.
+            page_size: Number of results per page.
+        """
+        self._db_manager = db_manager
+        self.page_size = page_size
+
+    @staticmethod
+    def build_match(query: str) -> str:
+        """Build an FTS5 MATCH expression from a normalized query.
+
+        Every token is quoted, so user input cannot inject FTS5
+        operators, and used as a prefix to match word forms.
+        """
+        return " ".join(f'"{token}"*' for token in query.split())
+
+    async def search(self, query: str, page: int = 0) -> SearchPage:
+        """Find vacancies matching the query.
+
+        Args:
+            query: Free-form search text.
+            page: Zero-based page number.
+
+        Returns:
+            SearchPage: Ranked results for the requested page.
+        """
+        normalized = normalize_query(query)
+        if not normalized:
+            return SearchPage(
+                query="",
+                page=0,
+                page_size=self.page_size,
+                hits=[],
+                has_next=False,
+            )
+
+        async with self._db_manager.session() as session:
+            result = await session.execute(
+                SEARCH_QUERY,
+                {
+                    "match": self.build_match(normalized),
+                    "limit": self.page_size + 1,
+                    "offset": page * self.page_size,
+                },
+            )
+            rows = result.all()
+
+        hits = [
+            SearchHit(
+                title=row.title,
+                company=row.company,
+                salary=row.salary,
+                location=row.location,
+                link=row.link,
+                ai_score=row.ai_score,
+                created_at=str(row.created_at)[:16],
+            )
+            for row in rows[: self.page_size]
+        ]
+        log.debug("Search %r page %d: %d hits", normalized, page, len(hits))
+
+        return SearchPage(
+            query=normalized,
+            page=page,
+            page_size=self.page_size,
+            hits=hits,
+            has_next=len(rows) > self.page_size,
+        )
+
+
+__all__ = ("SearchHit", "SearchPage", "VacancySearch", "normalize_query")